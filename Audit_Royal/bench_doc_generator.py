@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Benchmark du générateur de documentation
+Génère des XML synthétiques et mesure le temps et la mémoire du parsing,
+ainsi que le temps de chaque phase des formats de doc_generator.py (interactive, javadoc)
+"""
+
+import os
+import sys
+import time
+import json
+import resource
+import tempfile
+import tracemalloc
+import multiprocessing
+from xml.sax.saxutils import escape as xml_escape
+
+from doc_generator import DocGenerator, RENDER_BACKENDS, parse_doc_id
+
+
+# Les statistiques et la couverture sont comptées pendant parse_xml (voir process_member)
+PHASES = ('parse_xml', 'generate_search_index', 'generate_index', 'generate_nav', 'class_pages',
+          'css_js')
+# Chaque page Javadoc liste toutes les classes : la sortie croît en classes² (≈ 6 Go à 100 000
+# membres), ce format n'est donc mesuré au-delà que sur demande (--javadoc-max-members 0)
+JAVADOC_MAX_MEMBERS = 10000
+
+
+def members_per_class_total(members_per_class=10, overloads=1):
+    """Nombre de membres XML (type compris) écrits par classe synthétique"""
+    methods = len(range(2, members_per_class, 3))
+    return 1 + members_per_class - methods + methods * overloads
+
+
+def synthetic_namespace(c, namespace_depth=2):
+    """Namespace de la classe c : Bench.Ns{c % 10} puis des sous-namespaces jusqu'à la profondeur voulue"""
+    parts = ['Bench', f'Ns{c % 10}']
+    for level in range(2, namespace_depth):
+        parts.append(f'Sous{level}_{c % (level + 3)}')
+    return '.'.join(parts[:max(1, namespace_depth)])
+
+
+def generate_synthetic_xml(path, n_classes, members_per_class=10, summary_words=12,
+                           overloads=1, namespace_depth=2):
+    """Écrit un fichier XML de documentation synthétique"""
+    summary = xml_escape(' '.join(['Résumé'] * summary_words))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0"?>\n<doc>\n')
+        f.write('    <assembly>\n        <name>Assembly-CSharp</name>\n    </assembly>\n')
+        f.write('    <members>\n')
+        for c in range(n_classes):
+            cls = f'{synthetic_namespace(c, namespace_depth)}.Classe{c}'
+            f.write(f'        <member name="T:{cls}">\n')
+            f.write(f'            <summary>{summary}</summary>\n')
+            f.write('        </member>\n')
+            for m in range(members_per_class):
+                kind = m % 3
+                if kind == 0:
+                    f.write(f'        <member name="F:{cls}.champ{m}">\n')
+                    f.write(f'            <summary>{summary}</summary>\n')
+                elif kind == 1:
+                    f.write(f'        <member name="P:{cls}.Propriete{m}">\n')
+                    f.write(f'            <summary>{summary}</summary>\n')
+                else:
+                    # Surcharges : un System.Int32 de plus à chaque fois
+                    for o in range(overloads):
+                        extra = ',System.Int32' * o
+                        f.write(f'        <member name="M:{cls}.Methode{m}(System.String,System.Int32{extra})">\n')
+                        f.write(f'            <summary>{summary}</summary>\n')
+                        f.write('            <param name="texte">Le texte</param>\n')
+                        f.write('            <param name="valeur">La valeur</param>\n')
+                        for p in range(o):
+                            f.write(f'            <param name="option{p}">Option</param>\n')
+                        f.write('            <returns>Le résultat</returns>\n')
+                        f.write('        </member>\n')
+                    continue
+                f.write('        </member>\n')
+        f.write('    </members>\n</doc>\n')
+
+
+def _measure_parse(xml_path, streaming):
+    """Parse dans un processus neuf et renvoie (temps, RSS max en Ko)"""
+    start = time.perf_counter()
+    generator = DocGenerator(xml_path, streaming=streaming)
+    generator.parse_xml()
+    elapsed = time.perf_counter() - start
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss_kb //= 1024
+    return elapsed, rss_kb
+
+
+def bench_parse(sizes=(1000, 10000, 50000), members_per_class=10):
+    """Compare le parsing complet (ET.parse) et le parsing en flux (iterparse)"""
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_classes in sizes:
+            xml_path = os.path.join(tmp, f'bench_{n_classes}.xml')
+            generate_synthetic_xml(xml_path, n_classes, members_per_class)
+            size_mb = os.path.getsize(xml_path) / (1024 * 1024)
+            for streaming in (False, True):
+                # Un processus par mesure pour que le RSS max ne soit pas partagé
+                with ctx.Pool(1) as pool:
+                    elapsed, rss_kb = pool.apply(_measure_parse, (xml_path, streaming))
+                results.append({
+                    'classes': n_classes,
+                    'members': n_classes * (members_per_class + 1),
+                    'xml_mb': round(size_mb, 2),
+                    'mode': 'iterparse' if streaming else 'ET.parse',
+                    'seconds': round(elapsed, 4),
+                    'max_rss_mb': round(rss_kb / 1024, 1),
+                })
+    return results
+
+
+def bench_render(n_classes=5000, members_per_class=10):
+    """Mesure le coût de rendu par page (sans écriture disque)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_path = os.path.join(tmp, 'bench_render.xml')
+        generate_synthetic_xml(xml_path, n_classes, members_per_class)
+        generator = DocGenerator(xml_path, tmp)
+        generator.parse_xml()
+    
+    pages = 0
+    total_bytes = 0
+    start = time.perf_counter()
+    for class_name, class_data in generator.classes.items():
+        _, html = generator.render_class_page(class_name, class_data)
+        pages += 1
+        total_bytes += len(html)
+    elapsed = time.perf_counter() - start
+    return [{
+        'classes': n_classes,
+        'pages': pages,
+        'seconds': round(elapsed, 4),
+        'us_per_page': round(elapsed / pages * 1e6, 1),
+        'mb_rendered': round(total_bytes / (1024 * 1024), 2),
+    }]
+
+
+def bench_cache(sizes=(1000, 10000, 50000), members_per_class=10):
+    """Compare un parsing à froid (cache vide) et à chaud (modèle chargé depuis le cache)"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        for n_classes in sizes:
+            xml_path = os.path.join(tmp, f'bench_{n_classes}.xml')
+            generate_synthetic_xml(xml_path, n_classes, members_per_class)
+            timings = {}
+            for mode in ('cold', 'warm'):
+                generator = DocGenerator(xml_path, tmp, cache_dir=cache_dir)
+                start = time.perf_counter()
+                generator.parse_xml()
+                timings[mode] = time.perf_counter() - start
+            cache_files = [e for e in os.scandir(cache_dir) if e.name.endswith('.pickle')]
+            results.append({
+                'classes': n_classes,
+                'xml_mb': round(os.path.getsize(xml_path) / (1024 * 1024), 2),
+                'cache_mb': round(sum(e.stat().st_size for e in cache_files) / (1024 * 1024), 2),
+                'cold_seconds': round(timings['cold'], 4),
+                'warm_seconds': round(timings['warm'], 4),
+                'speedup': round(timings['cold'] / timings['warm'], 1),
+            })
+            for e in cache_files:
+                os.remove(e.path)
+    return results
+
+
+def _timed(timings, phase, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    timings[phase] = round(time.perf_counter() - start, 4)
+
+
+def _measure_phases(format_name, xml_path, output_dir):
+    """Chronomètre chaque phase d'un format dans un processus neuf"""
+    generator = DocGenerator(xml_path, output_dir)
+    timings = dict.fromkeys(PHASES)
+    
+    # Les sorties console des générateurs ne sont pas mesurées
+    devnull = open(os.devnull, 'w')
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        _timed(timings, 'parse_xml', generator.parse_xml)
+        
+        # Le format interactive est rendu par DocGenerator lui-même
+        if format_name != 'interactive':
+            generator = RENDER_BACKENDS[format_name](generator, output_dir)
+        if hasattr(generator, 'generate_search_index'):
+            _timed(timings, 'generate_search_index', generator.generate_search_index)
+        _timed(timings, 'generate_index', generator.generate_index)
+        if hasattr(generator, 'generate_nav'):
+            _timed(timings, 'generate_nav', generator.generate_nav)
+        
+        if hasattr(generator, 'generate_class_pages'):
+            _timed(timings, 'class_pages', generator.generate_class_pages,
+                   list(generator.classes.items()))
+        else:
+            def class_pages():
+                for class_name, class_data in generator.classes.items():
+                    generator.generate_class_page(class_name, class_data)
+            _timed(timings, 'class_pages', class_pages)
+        
+        def css_js():
+            generator.generate_css()
+            if hasattr(generator, 'generate_js'):
+                generator.generate_js()
+        _timed(timings, 'css_js', css_js)
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+    
+    output_bytes = sum(os.path.getsize(os.path.join(root, name))
+                       for root, _, files in os.walk(output_dir) for name in files)
+    return {
+        'classes': len(generator.classes),
+        'phases': timings,
+        'total_seconds': round(sum(t for t in timings.values() if t is not None), 4),
+        'output_mb': round(output_bytes / (1024 * 1024), 2),
+    }
+
+
+def bench_phases(member_counts=(1000, 10000, 100000), members_per_class=10, overloads=1,
+                 namespace_depth=2, summary_words=12,
+                 formats=('interactive', 'javadoc'), javadoc_max_members=JAVADOC_MAX_MEMBERS):
+    """Temps par phase des formats sur les mêmes XML synthétiques
+    
+    Le format javadoc n'est mesuré que jusqu'à javadoc_max_members membres (0 : sans limite).
+    """
+    ctx = multiprocessing.get_context('spawn')
+    per_class = members_per_class_total(members_per_class, overloads)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for members in member_counts:
+            n_classes = max(1, members // per_class)
+            xml_path = os.path.join(tmp, f'bench_{members}.xml')
+            generate_synthetic_xml(xml_path, n_classes, members_per_class, summary_words,
+                                   overloads, namespace_depth)
+            for format_name in formats:
+                if format_name == 'javadoc' and 0 < javadoc_max_members < members:
+                    print(f"⏭️  javadoc ignoré à {members} membres (--javadoc-max-members "
+                          f"{javadoc_max_members}, 0 pour tout mesurer)")
+                    continue
+                output_dir = os.path.join(tmp, f'out_{members}_{format_name}')
+                with ctx.Pool(1) as pool:
+                    measure = pool.apply(_measure_phases, (format_name, xml_path, output_dir))
+                results.append({
+                    'format': format_name,
+                    'members': n_classes * per_class,
+                    'overloads': overloads,
+                    'namespace_depth': namespace_depth,
+                    'summary_words': summary_words,
+                    'xml_mb': round(os.path.getsize(xml_path) / (1024 * 1024), 2),
+                    **measure,
+                })
+    return results
+
+
+def _walk_dict_model(classes):
+    """Lit tous les champs rendus, modèle en dictionnaires (ancienne forme)"""
+    total = 0
+    for c in classes.values():
+        total += len(c['name']) + len(c['summary']) + len(c['remarks'])
+        for m in c['methods']:
+            total += len(m['name']) + len(m['summary']) + len(m['returns'])
+            for p in m['params']:
+                total += len(p['name']) + len(p['desc'])
+        for m in c['fields']:
+            total += len(m['name']) + len(m['summary'])
+        for m in c['properties']:
+            total += len(m['name']) + len(m['summary'])
+    return total
+
+
+def _walk_slotted_model(classes):
+    """Lit tous les champs rendus, modèle à __slots__"""
+    total = 0
+    for c in classes.values():
+        total += len(c.name) + len(c.summary) + len(c.remarks)
+        for m in c.methods:
+            total += len(m.name) + len(m.summary) + len(m.returns)
+            for name, desc in m.params:
+                total += len(name) + len(desc)
+        for m in c.fields:
+            total += len(m.name) + len(m.summary)
+        for m in c.properties:
+            total += len(m.name) + len(m.summary)
+    return total
+
+
+def _measure_model(xml_path, layout):
+    """Mémoire retenue par le modèle parsé et coût d'un parcours complet, dans un processus neuf"""
+    import gc
+    tracemalloc.start()
+    generator = DocGenerator(xml_path)
+    generator.parse_xml()
+    classes = generator.classes
+    walk = _walk_slotted_model
+    if layout == 'dict':
+        # Même contenu sous l'ancienne forme (un dict par classe, membre et paramètre)
+        classes = {name: c.to_dict() for name, c in classes.items()}
+        generator.classes = None
+        walk = _walk_dict_model
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for _ in range(5):
+        walk(classes)
+    elapsed = (time.perf_counter() - start) / 5
+    return retained, elapsed
+
+
+def bench_model(member_counts=(10000, 100000), members_per_class=10):
+    """Compare le modèle en dictionnaires et le modèle à __slots__ (mémoire, accès aux champs)"""
+    ctx = multiprocessing.get_context('spawn')
+    per_class = members_per_class_total(members_per_class)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for members in member_counts:
+            n_classes = max(1, members // per_class)
+            xml_path = os.path.join(tmp, f'bench_{members}.xml')
+            generate_synthetic_xml(xml_path, n_classes, members_per_class)
+            for layout in ('dict', 'slots'):
+                with ctx.Pool(1) as pool:
+                    retained, elapsed = pool.apply(_measure_model, (xml_path, layout))
+                results.append({
+                    'members': n_classes * per_class,
+                    'layout': layout,
+                    'model_mb': round(retained / (1024 * 1024), 2),
+                    'bytes_per_member': round(retained / (n_classes * per_class)),
+                    'walk_ms': round(elapsed * 1000, 2),
+                })
+    return results
+
+
+def synthetic_doc_ids(count):
+    """Identifiants variés : types, surcharges, génériques, imbriqués, constructeurs"""
+    patterns = (
+        'T:Bench.Ns{i}.Classe{i}',
+        'M:Bench.Ns{i}.Classe{i}.Methode{i}(System.String,System.Int32)',
+        'M:Bench.Ns{i}.Classe{i}.#ctor(System.Collections.Generic.List{{System.String}})',
+        'M:Bench.Ns{i}.Pile`1.Convertir``1(System.Collections.Generic.Dictionary{{`0,``0}})',
+        'P:Bench.Ns{i}.Classe{i}.Propriete{i}',
+        'F:Bench.Ns{i}.Externe+Interne.champ{i}',
+    )
+    return [patterns[i % len(patterns)].format(i=i) for i in range(count)]
+
+
+def bench_doc_ids(count=1_000_000):
+    """Mesure le découpage des identifiants de documentation"""
+    doc_ids = synthetic_doc_ids(count)
+    start = time.perf_counter()
+    for doc_id in doc_ids:
+        parse_doc_id(doc_id)
+    elapsed = time.perf_counter() - start
+    return [{
+        'ids': count,
+        'seconds': round(elapsed, 4),
+        'ns_per_id': round(elapsed / count * 1e9, 1),
+    }]
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Benchmark du générateur de documentation")
+    parser.add_argument('bench', choices=['parse', 'render', 'ids', 'cache', 'phases', 'model'], nargs='?',
+                        default='parse',
+                        help="parse: ET.parse contre iterparse ; render: coût de rendu par page ; "
+                             "ids: découpage des identifiants ; cache: parsing à froid et à chaud ; "
+                             "phases: temps par phase de chaque format (interactive, javadoc) ; "
+                             "model: mémoire du modèle, dictionnaires contre __slots__")
+    parser.add_argument('--json', action='store_true', help="affiche aussi les résultats en JSON")
+    parser.add_argument('--output', metavar='FICHIER', help="écrit les résultats JSON dans ce fichier")
+    phases = parser.add_argument_group('phases')
+    phases.add_argument('--members', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="nombres de membres XML à générer (défaut: 1000 10000 100000)")
+    phases.add_argument('--overloads', type=int, default=1,
+                        help="surcharges par méthode (défaut: 1)")
+    phases.add_argument('--namespace-depth', type=int, default=2,
+                        help="profondeur des namespaces (défaut: 2)")
+    phases.add_argument('--summary-words', type=int, default=12,
+                        help="longueur des résumés en mots (défaut: 12)")
+    phases.add_argument('--formats', nargs='+', default=['interactive', 'javadoc'],
+                        choices=sorted(RENDER_BACKENDS),
+                        help="formats à comparer (défaut: interactive javadoc)")
+    phases.add_argument('--javadoc-max-members', type=int, default=JAVADOC_MAX_MEMBERS,
+                        help="taille maximale mesurée pour javadoc, dont la sortie croît en "
+                             f"classes² (défaut: {JAVADOC_MAX_MEMBERS}, 0: sans limite)")
+    args = parser.parse_args()
+    
+    if args.bench == 'parse':
+        results = bench_parse()
+        print(f"{'classes':>8} {'membres':>9} {'XML (Mo)':>9} {'mode':>10} {'temps (s)':>10} {'RSS max (Mo)':>13}")
+        for r in results:
+            print(f"{r['classes']:>8} {r['members']:>9} {r['xml_mb']:>9} {r['mode']:>10} "
+                  f"{r['seconds']:>10} {r['max_rss_mb']:>13}")
+    elif args.bench == 'ids':
+        results = bench_doc_ids()
+        print(f"{'ids':>9} {'temps (s)':>10} {'ns/id':>7}")
+        for r in results:
+            print(f"{r['ids']:>9} {r['seconds']:>10} {r['ns_per_id']:>7}")
+    elif args.bench == 'phases':
+        results = bench_phases(args.members, overloads=args.overloads,
+                               namespace_depth=args.namespace_depth,
+                               summary_words=args.summary_words, formats=args.formats,
+                               javadoc_max_members=args.javadoc_max_members)
+        print(f"{'format':>14} {'membres':>8} " + ' '.join(f'{p:>21}' for p in PHASES) + f" {'total':>8}")
+        for r in results:
+            cells = ' '.join(f"{'-' if r['phases'][p] is None else r['phases'][p]:>21}" for p in PHASES)
+            print(f"{r['format']:>14} {r['members']:>8} {cells} {r['total_seconds']:>8}")
+    elif args.bench == 'model':
+        results = bench_model()
+        print(f"{'membres':>8} {'modèle':>7} {'mémoire (Mo)':>13} {'o/membre':>9} {'parcours (ms)':>14}")
+        for r in results:
+            print(f"{r['members']:>8} {r['layout']:>7} {r['model_mb']:>13} {r['bytes_per_member']:>9} "
+                  f"{r['walk_ms']:>14}")
+    elif args.bench == 'cache':
+        results = bench_cache()
+        print(f"{'classes':>8} {'XML (Mo)':>9} {'cache (Mo)':>11} {'froid (s)':>10} {'chaud (s)':>10} {'gain':>6}")
+        for r in results:
+            print(f"{r['classes']:>8} {r['xml_mb']:>9} {r['cache_mb']:>11} {r['cold_seconds']:>10} "
+                  f"{r['warm_seconds']:>10} {r['speedup']:>6}")
+    else:
+        results = bench_render()
+        print(f"{'classes':>8} {'pages':>7} {'temps (s)':>10} {'µs/page':>9} {'HTML (Mo)':>10}")
+        for r in results:
+            print(f"{r['classes']:>8} {r['pages']:>7} {r['seconds']:>10} {r['us_per_page']:>9} {r['mb_rendered']:>10}")
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Mode source (--source) de doc_generator : commentaires /// lus directement dans les scripts C#
+Découpe les scripts en déclarations et écrit leurs identifiants comme le compilateur (-doc:).
+"""
+
+import re
+from html import escape, unescape
+from collections import defaultdict
+
+# Alias C# → types .NET, tels qu'écrits dans les identifiants de documentation
+_CS_ALIASES = {
+    'bool': 'System.Boolean', 'byte': 'System.Byte', 'sbyte': 'System.SByte', 'char': 'System.Char',
+    'decimal': 'System.Decimal', 'double': 'System.Double', 'float': 'System.Single',
+    'int': 'System.Int32', 'uint': 'System.UInt32', 'long': 'System.Int64', 'ulong': 'System.UInt64',
+    'short': 'System.Int16', 'ushort': 'System.UInt16', 'nint': 'System.IntPtr',
+    'nuint': 'System.UIntPtr', 'object': 'System.Object', 'string': 'System.String',
+    'dynamic': 'System.Object', 'void': 'System.Void',
+}
+_CS_REFERENCE_ALIASES = {'object', 'string', 'dynamic', 'void'}
+# Namespaces des types de la bibliothèque standard courants dans les signatures (les « using »
+# ne sont pas résolus) ; les autres types externes gardent le nom écrit dans le script
+_CS_WELL_KNOWN = {
+    'List': 'System.Collections.Generic', 'Dictionary': 'System.Collections.Generic',
+    'HashSet': 'System.Collections.Generic', 'Queue': 'System.Collections.Generic',
+    'Stack': 'System.Collections.Generic', 'KeyValuePair': 'System.Collections.Generic',
+    'IList': 'System.Collections.Generic', 'ICollection': 'System.Collections.Generic',
+    'IDictionary': 'System.Collections.Generic', 'IReadOnlyList': 'System.Collections.Generic',
+    'IReadOnlyDictionary': 'System.Collections.Generic', 'Action': 'System', 'Func': 'System',
+    'Task': 'System.Threading.Tasks',
+}
+_CS_OPERATORS = {
+    '+': 'op_Addition', '-': 'op_Subtraction', '*': 'op_Multiply', '/': 'op_Division',
+    '%': 'op_Modulus', '==': 'op_Equality', '!=': 'op_Inequality', '<': 'op_LessThan',
+    '>': 'op_GreaterThan', '<=': 'op_LessThanOrEqual', '>=': 'op_GreaterThanOrEqual',
+    '!': 'op_LogicalNot', '++': 'op_Increment', '--': 'op_Decrement', 'true': 'op_True',
+    'false': 'op_False',
+}
+_CS_MODIFIERS = frozenset(('public', 'private', 'protected', 'internal', 'static', 'sealed',
+                           'abstract', 'partial', 'unsafe', 'new', 'readonly', 'ref', 'file'))
+_CS_TOKEN_RE = re.compile(r'''
+    (?P<doc>///[^\n]*)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<directive>^[ \t]*\#[^\n]*)
+  | (?P<string>@"(?:[^"]|"")*"|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])+')
+  | (?P<interpolated>\$@?"|@\$")
+  | (?P<op>=>|==|!=|<=|>=|[{}();=,\[\]])
+  | (?P<text>[^{}();=,\[\]/"'@$\#!<>]+|.)
+''', re.VERBOSE | re.DOTALL | re.MULTILINE)
+_CS_TYPE_DECL_RE = re.compile(r'\b(class|struct|interface|enum|record)\s+(?:(?:class|struct)\s+)?'
+                              r'@?(\w+)\s*(?:<([^>]*)>)?')
+_CS_MEMBER_NAME_RE = re.compile(r'(~?@?[\w.]+)\s*(?:<([^<>()]*)>)?\s*$')
+_CS_DECLARATOR_RE = re.compile(r'\s*@?\w+\s*(?:[,;]|=(?!=))')
+_CS_CREF_RE = re.compile(r'(\bcref\s*=\s*)(["\'])(.*?)\2')
+_CS_ARITY_RE = re.compile(r'`\d+')
+_CS_TYPE_TOKEN_RE = re.compile(r'[\w.:@]+|[<>\[\](),?*]')
+
+
+def _skip_interpolated(text, pos, verbatim):
+    """Position de fin d'une chaîne interpolée ($"…{expr}…") dont le contenu commence en pos"""
+    holes = 0
+    n = len(text)
+    while pos < n:
+        ch = text[pos]
+        if holes == 0:
+            if ch == '"':
+                if verbatim and text.startswith('""', pos):
+                    pos += 2
+                    continue
+                return pos + 1
+            if ch == '\\' and not verbatim:
+                pos += 2
+                continue
+            if ch == '{':
+                if text.startswith('{{', pos):
+                    pos += 2
+                    continue
+                holes = 1
+            pos += 1
+            continue
+        # Dans une expression : chaînes imbriquées et accolades
+        if ch == '"' or ch == '\'' or ch == '$' or ch == '@':
+            m = _CS_TOKEN_RE.match(text, pos)
+            if m.lastgroup == 'interpolated':
+                pos = _skip_interpolated(text, m.end(), '@' in m.group())
+                continue
+            if m.lastgroup == 'string':
+                pos = m.end()
+                continue
+        elif ch == '{':
+            holes += 1
+        elif ch == '}':
+            holes -= 1
+        pos += 1
+    return n
+
+
+def split_top_level(text, sep=','):
+    """Découpe text sur sep hors de (), [], <> et {}"""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch in '([<{':
+            depth += 1
+        elif ch in ')]>}':
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _parameter_paren(text):
+    """Position de la parenthèse ouvrant la liste de paramètres d'une déclaration, ou -1
+    
+    Les parenthèses d'un type de retour tuple ((int a, int b) F()) sont ignorées, comme
+    l'appel au constructeur de base (: base(…)).
+    """
+    depth = 0
+    for i, ch in enumerate(text):
+        if ch in '([<':
+            if ch == '(' and depth == 0:
+                before = text[:i].rstrip()
+                if before and (before[-1].isalnum() or before[-1] in '_>]=!+-*/%&|^~')\
+                        and before.split()[-1] not in _CS_MODIFIERS:
+                    return i
+            depth += 1
+        elif ch in ')]>':
+            depth -= 1
+    return -1
+
+
+def _closing_paren(text, start):
+    """Position de la parenthèse fermant celle ouverte en start"""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(text)
+
+
+def _strip_attributes(text):
+    """Retire les attributs [..] en tête d'une déclaration"""
+    text = text.strip()
+    while text.startswith('['):
+        depth = 0
+        for i, ch in enumerate(text):
+            if ch == '[':
+                depth += 1
+            elif ch == ']':
+                depth -= 1
+                if depth == 0:
+                    break
+        text = text[i + 1:].strip()
+    return text
+
+
+def _cs_params(text):
+    """Paramètres d'une déclaration : tuple de (type tel qu'écrit, passé par référence)"""
+    params = []
+    for param in split_top_level(text):
+        param = _strip_attributes(param)
+        equals = param.find('=')
+        if equals >= 0:
+            param = param[:equals].strip()
+        words = param.split()
+        by_ref = False
+        while len(words) > 1 and words[0] in ('this', 'params', 'scoped', 'ref', 'out', 'in', 'readonly'):
+            by_ref = by_ref or words[0] in ('ref', 'out', 'in')
+            words.pop(0)
+        if len(words) > 1:
+            words.pop()
+        params.append((' '.join(words), by_ref))
+    return tuple(params)
+
+
+def _cs_type_params(text):
+    """Noms des paramètres de type d'une déclaration générique (<in T, out U>)"""
+    if not text:
+        return ()
+    return tuple(part.split()[-1] for part in split_top_level(text))
+
+
+def scan_csharp_source(text):
+    """Extrait les déclarations d'un script C# : types, membres documentés ou visibles
+    
+    Renvoie une liste d'enregistrements (genre, namespace, chaîne de types, nom, paramètres de
+    type, paramètres, renvoie une valeur, documentation, visible) : genre 'T' (nom =
+    class/struct/enum…), 'M', 'P' ou 'F' ; la chaîne de types est un tuple de (nom, paramètres
+    de type) des types englobants ; les paramètres sont ceux de _cs_params, ou None sans liste de
+    paramètres ; « renvoie une valeur » n'est connu (booléen) que pour les méthodes. La
+    documentation vaut None sans commentaire ///. Visible : public ou protected dans des types
+    visibles, les déclarations que le compilateur signale sans commentaire (CS1591) ; un membre
+    non documenté n'est enregistré que s'il est visible, un type l'est toujours. Les corps de
+    méthodes ne sont parcourus que pour les accolades.
+    """
+    records = []
+    # Cadres : ('ns', nom), ('type', nom, paramètres de type, genre, visible) ou ('block',)
+    stack = []
+    header = []
+    depth = 0
+    skipping = False
+    skip_depth = 0
+    # Déclaration de champs en cours : un « , » d'initialiseur annonce le champ suivant
+    fields = False
+    # Modificateurs de la déclaration de champs en cours, pour les déclarateurs suivants
+    field_words = []
+    doc = None
+    
+    def scope():
+        return stack[-1][0] if stack else 'ns'
+    
+    def context():
+        namespace = '.'.join(frame[1] for frame in stack if frame[0] == 'ns')
+        chain = tuple((frame[1], frame[2]) for frame in stack if frame[0] == 'type')
+        return namespace, chain
+    
+    def visibility(words):
+        """Déclaration visible hors de l'assembly, dans le type en cours ; words : ses modificateurs"""
+        if not all(frame[4] for frame in stack if frame[0] == 'type') or 'private' in words:
+            return False
+        if stack and stack[-1][0] == 'type' and stack[-1][3] in ('interface', 'enum'):
+            return True
+        return 'public' in words or 'protected' in words
+    
+    def emit(kind, name, type_params, params, returns=None, words=()):
+        visible = visibility(words)
+        if doc is not None or visible:
+            namespace, chain = context()
+            records.append((kind, namespace, chain, name, type_params, params, returns,
+                            None if doc is None else '\n'.join(doc), visible))
+    
+    def declare(terminator):
+        """Classe l'en-tête accumulé ; renvoie le cadre à empiler sur « { »"""
+        nonlocal field_words
+        text = _strip_attributes(' '.join(''.join(header).split()))
+        if not text:
+            return ('block',)
+        if text.startswith('namespace '):
+            return ('ns', text[len('namespace '):].strip())
+        
+        paren = _parameter_paren(text)
+        m = _CS_TYPE_DECL_RE.search(text if paren < 0 else text[:paren])
+        if m and set(text[:m.start()].split()) <= _CS_MODIFIERS:
+            type_kind, name, type_params = m.group(1), m.group(2), _cs_type_params(m.group(3))
+            namespace, chain = context()
+            visible = visibility(text[:m.start()].split())
+            records.append(('T', namespace, chain + ((name, type_params),), type_kind, (), None,
+                            None, None if doc is None else '\n'.join(doc), visible))
+            return ('type', name, type_params, type_kind, visible)
+        if scope() != 'type':
+            return ('block',)
+        words = text[:paren].split() if paren >= 0 else text.split()
+        if 'event' in words:
+            return ('block',)
+        
+        if 'delegate' in words and paren >= 0:
+            m = _CS_MEMBER_NAME_RE.search(text[:paren])
+            if m:
+                namespace, chain = context()
+                type_params = _cs_type_params(m.group(2))
+                records.append(('T', namespace, chain + ((m.group(1), type_params),), 'delegate',
+                                (), None, None, None if doc is None else '\n'.join(doc),
+                                visibility(words)))
+            return ('block',)
+        
+        indexer = re.search(r'\bthis\s*\[', text)
+        if indexer and (paren < 0 or indexer.start() < paren):
+            close = text.rfind(']')
+            emit('P', 'Item', (), _cs_params(text[indexer.end():close]), words=words)
+            return ('block',)
+        
+        if paren >= 0:
+            params = _cs_params(text[paren + 1:_closing_paren(text, paren)])
+            prefix = text[:paren].rstrip()
+            conversion = re.search(r'\b(implicit|explicit)\s+operator\s+(.+)$', prefix)
+            operator = re.search(r'\boperator\s*(\S+)$', prefix)
+            if conversion:
+                # Le type de retour fait partie de l'identifiant : op_Implicit(A)~B
+                name = f'op_{conversion.group(1).capitalize()}'
+                emit('M', name, (), params + ((conversion.group(2).strip(), '~'),), True, words)
+                return ('block',)
+            if operator:
+                emit('M', _CS_OPERATORS.get(operator.group(1), f'op_{operator.group(1)}'), (), params,
+                     True, words)
+                return ('block',)
+            m = _CS_MEMBER_NAME_RE.search(prefix)
+            if not m:
+                return ('block',)
+            name, type_params = m.group(1), _cs_type_params(m.group(2))
+            # void juste avant le nom ; constructeurs et finaliseur n'ont pas de type de retour
+            returns = not prefix[:m.start()].rstrip().endswith('void')
+            if name.startswith('~'):
+                name, returns = 'Finalize', False
+            elif name == stack[-1][1]:
+                name = '#cctor' if 'static' in prefix.split() else '#ctor'
+                returns = False
+            emit('M', name.replace('.', '#'), type_params, params, returns, words)
+            return ('block',)
+        
+        # Champ(s) ou propriété : le nom est le dernier mot avant l'initialiseur ou les accesseurs
+        if terminator in ('{', '=>'):
+            emit('P', words[-1].replace('.', '#'), (), None, words=words)
+        else:
+            declarators = split_top_level(text)
+            if words[0] == '_':
+                # Déclarateur qui suit un initialiseur : int a = 1, b;
+                words = field_words
+            field_words = words
+            emit('F', declarators[0].split()[-1], (), None, words=words)
+            for declarator in declarators[1:]:
+                emit('F', declarator.split()[0], (), None, words=words)
+        return ('block',)
+    
+    pos = 0
+    n = len(text)
+    while pos < n:
+        m = _CS_TOKEN_RE.match(text, pos)
+        kind, token = m.lastgroup, m.group()
+        pos = m.end()
+        if kind == 'interpolated':
+            pos = _skip_interpolated(text, pos, '@' in token)
+            if not skipping and scope() != 'block':
+                header.append('""')
+            continue
+        if kind == 'comment' or kind == 'directive':
+            continue
+        
+        if skipping:
+            # Initialiseur ou corps d'expression : jusqu'au « ; » de même niveau
+            if token in ('(', '[', '{'):
+                skip_depth += 1
+            elif token in (')', ']', '}'):
+                skip_depth -= 1
+                if skip_depth < 0:
+                    # Fin d'un bloc englobant (initialiseur de propriété sans « ; »)
+                    skipping = False
+                    if stack:
+                        stack.pop()
+                    header, doc = [], None
+            elif token == ';' and skip_depth == 0:
+                skipping = False
+                doc = None
+            elif token == ',' and skip_depth == 0 and fields and _CS_DECLARATOR_RE.match(text, pos):
+                # Et non la virgule d'un type générique (new Dictionary<string, float>)
+                skipping = False
+                header = ['_ ']
+            continue
+        
+        if scope() == 'block':
+            if token == '{':
+                stack.append(('block',))
+            elif token == '}':
+                stack.pop()
+                header, doc = [], None
+            continue
+        
+        if kind == 'doc':
+            line = token[3:]
+            if line.startswith(' '):
+                line = line[1:]
+            if doc is None or ''.join(header).strip():
+                doc, header = [], []
+            doc.append(line)
+            continue
+        
+        enum_scope = stack and stack[-1][0] == 'type' and stack[-1][3] == 'enum'
+        if token == '{':
+            stack.append(declare('{'))
+            header, doc, depth, fields = [], None, 0, False
+        elif token == '}':
+            if enum_scope and ''.join(header).strip():
+                emit('F', _strip_attributes(''.join(header)).split('=')[0].split()[0], (), None)
+            if stack:
+                stack.pop()
+            header, doc, depth = [], None, 0
+        elif token in ('(', '['):
+            depth += 1
+            header.append(token)
+        elif token in (')', ']'):
+            depth -= 1
+            header.append(token)
+        elif depth == 0 and enum_scope and token == ',':
+            name = _strip_attributes(''.join(header)).split('=')[0].split()
+            if name:
+                emit('F', name[0], (), None)
+            header, doc = [], None
+        elif depth == 0 and not enum_scope and token in ('=', '=>', ';'):
+            frame = declare(token)
+            if frame[0] == 'ns' and token == ';':
+                # namespace de fichier : jusqu'à la fin du script
+                stack.append(frame)
+            header = []
+            if token == ';':
+                doc = None
+            else:
+                skipping, skip_depth, fields = True, 0, token == '='
+        else:
+            header.append(token)
+    return records
+
+
+class _CsTypeNames:
+    """Traduit les types C# écrits dans une signature en types d'identifiant de documentation
+    
+    known : (nom simple, nombre de paramètres de type) → [(nom complet, type valeur)] des types
+    déclarés dans les scripts analysés.
+    """
+    def __init__(self, known, namespace, class_type_params, method_type_params):
+        self.known = known
+        self.namespace = namespace
+        self.class_type_params = class_type_params
+        self.method_type_params = method_type_params
+    
+    def convert(self, text):
+        tokens = _CS_TYPE_TOKEN_RE.findall(text)
+        if not tokens:
+            return text
+        result, _ = self.parse(tokens, 0)
+        return result
+    
+    def parse(self, tokens, i):
+        """Analyse un type à partir de tokens[i] ; renvoie (identifiant, position suivante)"""
+        value_type = False
+        if tokens[i] == '(':
+            # Tuple : (int a, string b) → System.ValueTuple{System.Int32,System.String}
+            items = []
+            i += 1
+            while i < len(tokens) and tokens[i] != ')':
+                item, i = self.parse(tokens, i)
+                items.append(item)
+                while i < len(tokens) and tokens[i] not in (',', ')'):
+                    i += 1
+                if i < len(tokens) and tokens[i] == ',':
+                    i += 1
+            result = f"System.ValueTuple{{{','.join(items)}}}"
+            value_type = True
+            i += 1
+        else:
+            name = tokens[i].replace('global::', '')
+            i += 1
+            args = []
+            if i < len(tokens) and tokens[i] == '<':
+                i += 1
+                while i < len(tokens) and tokens[i] != '>':
+                    arg, i = self.parse(tokens, i)
+                    args.append(arg)
+                    if i < len(tokens) and tokens[i] == ',':
+                        i += 1
+                i += 1
+            result, value_type = self.resolve(name, args)
+        
+        while i < len(tokens) and tokens[i] in ('?', '[', '*'):
+            if tokens[i] == '?':
+                # Seuls les types valeur deviennent Nullable (les références nullables C# 8 non)
+                if value_type:
+                    result = f'System.Nullable{{{result}}}'
+                i += 1
+            elif tokens[i] == '*':
+                result += '*'
+                i += 1
+            else:
+                rank = 1
+                i += 1
+                while i < len(tokens) and tokens[i] == ',':
+                    rank += 1
+                    i += 1
+                result += '[]' if rank == 1 else '[' + ','.join(['0:'] * rank) + ']'
+                i += 1
+        return result, i
+    
+    def find(self, name, arity):
+        """(nom complet, type valeur) d'un type déclaré dans les scripts, ou None"""
+        candidates = self.known.get((name.rsplit('.', 1)[-1], arity))
+        if not candidates:
+            return None
+        matches = [c for c in candidates if _CS_ARITY_RE.sub('', c[0]).endswith(name)]
+        if not matches:
+            return None
+        # Le type du même namespace l'emporte, comme pour le compilateur
+        local = [c for c in matches if c[0].startswith(f'{self.namespace}.')]
+        return (local or matches)[0]
+    
+    def resolve(self, name, args):
+        """Nom complet d'un type nommé, et s'il s'agit d'un type valeur"""
+        suffix = f"{{{','.join(args)}}}" if args else ''
+        if not args:
+            if name in self.method_type_params:
+                return f'``{self.method_type_params.index(name)}', False
+            if name in self.class_type_params:
+                return f'`{self.class_type_params.index(name)}', False
+            if name in _CS_ALIASES:
+                return _CS_ALIASES[name], name not in _CS_REFERENCE_ALIASES
+        found = self.find(name, len(args))
+        if found:
+            full_name, value_type = found
+            return full_name + suffix, value_type
+        if '.' not in name:
+            if name in ('IEnumerator', 'IEnumerable'):
+                return (f'System.Collections.Generic.{name}' if args
+                        else f'System.Collections.{name}') + suffix, False
+            if name in _CS_WELL_KNOWN:
+                return f'{_CS_WELL_KNOWN[name]}.{name}{suffix}', name == 'KeyValuePair'
+        return name + suffix, False
+
+
+def source_doc_ids(records):
+    """Identifiants de documentation (T:, M:, P:, F:) des enregistrements de scan_csharp_source
+    
+    Renvoie [(identifiant, documentation, namespace, renvoie une valeur)] pour les déclarations
+    documentées ou visibles (documentation None sans commentaire) ; les types de tous les
+    scripts servent à écrire les paramètres comme le compilateur (-doc:), et les cref="Nom" de
+    la documentation deviennent des identifiants (T:, M:…), ou !:Nom sinon.
+    """
+    known = defaultdict(list)
+    for kind, namespace, chain, type_kind, *_ in records:
+        if kind == 'T':
+            # Arité des types englobants seulement : Pile`1.Etat, mais Pile{…} une fois instancié
+            path = '.'.join([f'{n}`{len(tp)}' if tp else n for n, tp in chain[:-1]] + [chain[-1][0]])
+            full_name = f'{namespace}.{path}' if namespace else path
+            known[(chain[-1][0], len(chain[-1][1]))].append(
+                (full_name, type_kind in ('struct', 'enum')))
+    for candidates in known.values():
+        candidates.sort()
+    
+    ids = []
+    # (classe, nom du membre sans paramètres) → premier identifiant, pour les cref
+    members = {}
+    for kind, namespace, chain, name, type_params, params, returns, doc, visible in records:
+        if doc is None and not visible:
+            continue
+        path = '.'.join(f'{n}`{len(tp)}' if tp else n for n, tp in chain)
+        class_name = f'{namespace}.{path}' if namespace else path
+        if kind == 'T':
+            ids.append((f'T:{class_name}', doc, namespace, class_name, None))
+            continue
+        
+        member = f'{name}``{len(type_params)}' if type_params else name
+        if params:
+            class_type_params = [tp for _, tps in chain for tp in tps]
+            types = _CsTypeNames(known, namespace, class_type_params, list(type_params))
+            args = []
+            conversion = ''
+            for type_text, by_ref in params:
+                if by_ref == '~':
+                    conversion = f'~{types.convert(type_text)}'
+                    continue
+                args.append(types.convert(type_text) + ('@' if by_ref else ''))
+            member += (f"({','.join(args)})" if args else '') + conversion
+        doc_id = f'{kind}:{class_name}.{member}'
+        members.setdefault((class_name, name), doc_id)
+        ids.append((doc_id, doc, namespace, class_name, returns))
+    
+    def cref_id(cref, namespace, class_name):
+        """Identifiant d'un cref écrit dans le script (Type, Type.Membre, Membre, Pile{T}…)"""
+        # Segments (nom, arité) : Pile{T}.Paire → [('Pile', 1), ('Paire', 0)]
+        base = cref.split('(', 1)[0].replace('{', '<').replace('}', '>')
+        segments = [(part.split('<', 1)[0].strip(), part.count(',') + 1 if '<' in part else 0)
+                    for part in split_top_level(base, '.')]
+        types = _CsTypeNames(known, namespace, (), ())
+        name = '.'.join(n for n, _ in segments)
+        arity = segments[-1][1]
+        found = types.find(name, arity)
+        if found:
+            return f"T:{found[0]}{f'`{arity}' if arity else ''}"
+        owner = class_name
+        if len(segments) > 1:
+            found = types.find('.'.join(n for n, _ in segments[:-1]), segments[-2][1])
+            owner = found[0] + (f'`{segments[-2][1]}' if segments[-2][1] else '') if found else None
+        return members.get((owner, segments[-1][0]), f'!:{cref}')
+    
+    def resolve_crefs(doc, namespace, class_name):
+        return _CS_CREF_RE.sub(
+            lambda m: m.group(0) if m.group(3)[1:2] == ':' else
+            f'{m.group(1)}"{escape(cref_id(unescape(m.group(3)), namespace, class_name))}"', doc)
+    
+    return [(doc_id, resolve_crefs(doc, namespace, class_name) if doc and 'cref' in doc else doc,
+             namespace, returns)
+            for doc_id, doc, namespace, class_name, returns in ids]
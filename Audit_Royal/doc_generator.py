@@ -5,209 +5,78 @@ Crée un site HTML interactif avec recherche, thème sombre, statistiques, etc.
 """
 
 import xml.etree.ElementTree as ET
+import io
 import os
+import sys
+import glob
+import fnmatch
 import re
 import json
+import time
+import pickle
+import shutil
+import gzip
+import zlib
+import base64
+import tarfile
+import zipfile
+import hashlib
+import heapq
+import itertools
+import unicodedata
+import tracemalloc
 from pathlib import Path
-from html import escape
-from collections import defaultdict
+from html import escape, unescape
+from collections import Counter, defaultdict
+from functools import lru_cache
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-class DocGenerator:
-    def __init__(self, xml_path, output_dir="documentation_html"):
-        self.xml_path = xml_path
-        self.output_dir = output_dir
-        self.classes = {}
-        self.namespaces = defaultdict(list)
-        self.stats = {
-            'total_classes': 0,
-            'total_methods': 0,
-            'total_properties': 0,
-            'total_fields': 0
-        }
-        
-    def parse_xml(self):
-        """Parse le fichier XML de documentation"""
-        try:
-            tree = ET.parse(self.xml_path)
-            root = tree.getroot()
-            
-            members = root.find('members')
-            if members is None:
-                print("Aucun membre trouvé dans le XML")
-                return
-            
-            for member in members.findall('member'):
-                name = member.get('name')
-                if name:
-                    self.process_member(name, member)
-            
-            # Calculer les statistiques
-            self.calculate_stats()
-                    
-        except Exception as e:
-            print(f"Erreur lors du parsing XML: {e}")
-            
-    def process_member(self, name, member):
-        """Traite un membre de la documentation"""
-        parts = name.split(':')
-        if len(parts) != 2:
-            return
-            
-        member_type = parts[0]
-        full_name = parts[1]
-        
-        # Extraire le namespace et le nom de classe
-        namespace = ""
-        if '.' in full_name:
-            parts_name = full_name.rsplit('.', 1)
-            class_name = parts_name[0]
-            member_name = parts_name[1] if len(parts_name) > 1 else None
-            
-            # Extraire le namespace
-            if '.' in class_name:
-                namespace = '.'.join(class_name.split('.')[:-1])
-        else:
-            class_name = full_name
-            member_name = None
-            
-        # Initialiser la classe
-        if class_name not in self.classes:
-            self.classes[class_name] = {
-                'name': class_name.split('.')[-1],  # Nom court
-                'full_name': class_name,
-                'namespace': namespace,
-                'summary': '',
-                'methods': [],
-                'fields': [],
-                'properties': [],
-                'remarks': '',
-                'example': ''
-            }
-            if namespace:
-                self.namespaces[namespace].append(class_name)
-        
-        # Extraire la documentation
-        summary = member.find('summary')
-        summary_text = summary.text.strip() if summary is not None and summary.text else ""
-        
-        remarks = member.find('remarks')
-        remarks_text = remarks.text.strip() if remarks is not None and remarks.text else ""
-        
-        example = member.find('example')
-        example_text = example.text.strip() if example is not None and example.text else ""
-        
-        # Extraire les paramètres
-        params = []
-        for param in member.findall('param'):
-            param_name = param.get('name', '')
-            param_desc = param.text.strip() if param.text else ""
-            params.append({'name': param_name, 'desc': param_desc})
-        
-        # Extraire le retour
-        returns = member.find('returns')
-        returns_text = returns.text.strip() if returns is not None and returns.text else ""
-        
-        # Classer le membre
-        if member_type == 'T':
-            self.classes[class_name]['summary'] = summary_text
-            self.classes[class_name]['remarks'] = remarks_text
-            self.classes[class_name]['example'] = example_text
-        elif member_type == 'M':
-            self.classes[class_name]['methods'].append({
-                'name': member_name,
-                'summary': summary_text,
-                'params': params,
-                'returns': returns_text,
-                'remarks': remarks_text
-            })
-        elif member_type == 'F':
-            self.classes[class_name]['fields'].append({
-                'name': member_name,
-                'summary': summary_text
-            })
-        elif member_type == 'P':
-            self.classes[class_name]['properties'].append({
-                'name': member_name,
-                'summary': summary_text
-            })
-    
-    def calculate_stats(self):
-        """Calcule les statistiques"""
-        self.stats['total_classes'] = len(self.classes)
-        for class_data in self.classes.values():
-            self.stats['total_methods'] += len(class_data['methods'])
-            self.stats['total_properties'] += len(class_data['properties'])
-            self.stats['total_fields'] += len(class_data['fields'])
-    
-    def generate_html(self):
-        """Génère les fichiers HTML"""
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Générer le fichier JSON pour la recherche
-        self.generate_search_index()
-        
-        # Générer l'index
-        self.generate_index()
-        
-        # Générer une page par classe
-        for class_name, class_data in self.classes.items():
-            self.generate_class_page(class_name, class_data)
-        
-        # Copier le CSS et JS
-        self.generate_css()
-        self.generate_js()
-        
-        print(f"\n✅ Documentation générée dans: {self.output_dir}/")
-        print(f"📄 Ouvrez: {self.output_dir}/index.html")
-        print(f"\n📊 Statistiques:")
-        print(f"   • {self.stats['total_classes']} classes")
-        print(f"   • {self.stats['total_methods']} méthodes")
-        print(f"   • {self.stats['total_properties']} propriétés")
-        print(f"   • {self.stats['total_fields']} champs")
-    
-    def generate_search_index(self):
-        """Génère l'index de recherche JSON"""
-        search_data = []
-        for class_name, class_data in self.classes.items():
-            safe_name = self.sanitize_filename(class_name)
-            search_data.append({
-                'name': class_data['name'],
-                'full_name': class_data['full_name'],
-                'namespace': class_data['namespace'],
-                'summary': class_data['summary'],
-                'url': f'{safe_name}.html',
-                'type': 'class'
-            })
-            
-            # Ajouter les méthodes
-            for method in class_data['methods']:
-                search_data.append({
-                    'name': f"{class_data['name']}.{method['name']}",
-                    'full_name': f"{class_data['full_name']}.{method['name']}",
-                    'namespace': class_data['namespace'],
-                    'summary': method['summary'],
-                    'url': f'{safe_name}.html#{method["name"]}',
-                    'type': 'method'
-                })
-        
-        with open(os.path.join(self.output_dir, 'search-index.json'), 'w', encoding='utf-8') as f:
-            json.dump(search_data, f, ensure_ascii=False, indent=2)
-    
-    def generate_index(self):
-        """Génère la page d'index"""
-        html = f"""<!DOCTYPE html>
+import cs_source
+from cs_source import scan_csharp_source, source_doc_ids, split_top_level
+
+try:
+    import brotli  # optionnel : fichiers .br en plus des .gz
+except ImportError:
+    brotli = None
+
+MANIFEST_FILE = '.doc-manifest.json'
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+PAGE_BUFFER_SIZE = 64 * 1024
+PAGE_FLUSH_FRAGMENTS = 64
+# Tableau de bord de couverture : nombre de classes les moins documentées listées sur l'index
+COVERAGE_WORST_CLASSES = 10
+
+# Index de recherche : préfixes indexés de SEARCH_MIN_PREFIX à SEARCH_MAX_PREFIX caractères
+SEARCH_MIN_PREFIX = 2
+SEARCH_MAX_PREFIX = 12
+SEARCH_DIR = 'search'
+# Entrées (nom, url, type) des résultats affichés : chargées par blocs de cette taille
+SEARCH_ENTRY_BLOCK = 64
+CLASS_DATA_DIR = 'data'
+_CAMEL_RE = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_WORD_RE = re.compile(r'\w+')
+
+# Gabarits HTML partagés par toutes les pages (f-strings compilées une seule fois)
+STYLESHEET_LINK = '<link rel="stylesheet" href="style.css">'
+
+def _page_header(title, subtitle, stylesheet=STYLESHEET_LINK):
+    """En-tête commun : <head>, bandeau et début de la barre latérale"""
+    return f"""<!DOCTYPE html>
 <html lang="fr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Documentation - Audit Royal</title>
-    <link rel="stylesheet" href="style.css">
+    <title>{title}</title>
+    {stylesheet}
 </head>
 <body>
     <header>
         <div class="header-content">
             <h1>📚 Documentation - Audit Royal</h1>
-            <p>Documentation générée automatiquement à partir des commentaires XML</p>
+            {subtitle}
             <button id="theme-toggle" class="theme-toggle" title="Changer de thème">
                 <span class="theme-icon">🌙</span>
             </button>
@@ -222,272 +91,2436 @@ class DocGenerator:
             </div>
             
             <h2>Navigation</h2>
-            <div class="nav-tabs">
-                <button class="nav-tab active" data-tab="classes">Classes</button>
-                <button class="nav-tab" data-tab="namespaces">Namespaces</button>
-            </div>
-            
-            <div id="classes-tab" class="tab-content active">
-                <ul class="class-list">
-"""
-        
-        for class_name in sorted(self.classes.keys()):
-            safe_name = self.sanitize_filename(class_name)
-            short_name = self.classes[class_name]['name']
-            namespace = self.classes[class_name]['namespace']
-            namespace_label = f'<span class="namespace-label">{escape(namespace)}</span>' if namespace else ''
-            html += f'                    <li><a href="{safe_name}.html">{escape(short_name)}</a>{namespace_label}</li>\n'
-        
-        html += """                </ul>
-            </div>
-            
-            <div id="namespaces-tab" class="tab-content">
-"""
-        
-        # Grouper par namespace
-        for namespace in sorted(self.namespaces.keys()):
-            html += f"""                <div class="namespace-group">
-                    <h3>{escape(namespace) if namespace else 'Global'}</h3>
-                    <ul class="class-list">
-"""
-            for class_name in sorted(self.namespaces[namespace]):
-                safe_name = self.sanitize_filename(class_name)
-                short_name = self.classes[class_name]['name']
-                html += f'                        <li><a href="{safe_name}.html">{escape(short_name)}</a></li>\n'
-            html += """                    </ul>
-                </div>
 """
-        
-        html += """            </div>
-        </nav>
-        
-        <main class="main-content">
-            <div class="welcome-section">
-                <h2>Bienvenue dans la documentation</h2>
-                <p>Cette documentation contient toutes les classes, méthodes et propriétés du projet Audit Royal.</p>
-                <p>Utilisez la barre de recherche ou naviguez par classes/namespaces dans le menu.</p>
-            </div>
-            
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-icon">📦</div>
-                    <div class="stat-number">""" + str(self.stats['total_classes']) + """</div>
-                    <div class="stat-label">Classes</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-icon">⚡</div>
-                    <div class="stat-number">""" + str(self.stats['total_methods']) + """</div>
-                    <div class="stat-label">Méthodes</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-icon">🔧</div>
-                    <div class="stat-number">""" + str(self.stats['total_properties']) + """</div>
-                    <div class="stat-label">Propriétés</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-icon">📝</div>
-                    <div class="stat-number">""" + str(self.stats['total_fields']) + """</div>
-                    <div class="stat-label">Champs</div>
-                </div>
-            </div>
-        </main>
+
+def _page_footer(scripts):
+    """Pied de page commun"""
+    return f"""        </main>
     </div>
     
     <footer>
         <p>Généré avec DocGenerator v2.0 pour C# • © 2024</p>
     </footer>
     
-    <script src="script.js"></script>
-</body>
+{scripts}</body>
 </html>"""
-        
-        with open(os.path.join(self.output_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html)
-    
-    def generate_class_page(self, class_name, class_data):
-        """Génère la page d'une classe"""
-        safe_name = self.sanitize_filename(class_name)
-        
-        html = f"""<!DOCTYPE html>
+
+INDEX_SUBTITLE = '<p>Documentation générée automatiquement à partir des commentaires XML</p>'
+CLASS_SUBTITLE = '<p><a href="index.html" class="back-link">← Retour à l\'index</a></p>'
+INDEX_FOOTER = _page_footer('    <script src="script.js"></script>\n')
+CLASS_FOOTER = _page_footer('    <script src="nav.js"></script>\n    <script src="script.js"></script>\n')
+
+# Gabarits du thème Javadoc (moteur javadoc)
+def _javadoc_header(title, subtitle):
+    """En-tête commun : <head>, bandeau et début de la navigation"""
+    return f"""<!DOCTYPE html>
 <html lang="fr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{escape(class_data['name'])} - Documentation</title>
+    <title>{title}</title>
     <link rel="stylesheet" href="style.css">
 </head>
 <body>
     <header>
-        <div class="header-content">
-            <h1>📚 Documentation - Audit Royal</h1>
-            <p><a href="index.html" class="back-link">← Retour à l'index</a></p>
-            <button id="theme-toggle" class="theme-toggle" title="Changer de thème">
-                <span class="theme-icon">🌙</span>
-            </button>
-        </div>
+        <h1>📚 Documentation - Audit Royal</h1>
+        {subtitle}
     </header>
     
-    <div class="container">
-        <nav class="sidebar">
-            <div class="search-container">
-                <input type="text" id="search-input" placeholder="🔍 Rechercher..." />
-                <div id="search-results" class="search-results"></div>
-            </div>
-            
-            <h2>Navigation</h2>
-            <ul class="class-list">
-"""
-        
-        for cn in sorted(self.classes.keys()):
-            safe = self.sanitize_filename(cn)
-            short_name = self.classes[cn]['name']
-            active = ' class="active"' if cn == class_name else ''
-            html += f'                <li{active}><a href="{safe}.html">{escape(short_name)}</a></li>\n'
-        
-        html += f"""            </ul>
-        </nav>
-        
-        <main class="main-content">
-            <div class="class-header">
-                <div class="breadcrumb">
-                    <a href="index.html">Accueil</a>
-                    {f'<span>→</span><span>{escape(class_data["namespace"])}</span>' if class_data['namespace'] else ''}
-                    <span>→</span><span class="current">{escape(class_data['name'])}</span>
-                </div>
-                <h2 class="class-title">{escape(class_data['name'])}</h2>
-                {f'<p class="namespace-info">Namespace: <code>{escape(class_data["namespace"])}</code></p>' if class_data['namespace'] else ''}
-                <p class="class-summary">{escape(class_data['summary'])}</p>
-                {f'<div class="remarks"><h4>Remarques</h4><p>{escape(class_data["remarks"])}</p></div>' if class_data['remarks'] else ''}
-                {f'<div class="example"><h4>Exemple</h4><pre><code>{escape(class_data["example"])}</code></pre></div>' if class_data['example'] else ''}
-            </div>
-            
-            <div class="member-summary">
-                <h3>Résumé des membres</h3>
-                <div class="summary-badges">
-"""
-        
-        if class_data['fields']:
-            html += f'                    <a href="#fields" class="badge badge-field">{len(class_data["fields"])} Champs</a>\n'
-        if class_data['properties']:
-            html += f'                    <a href="#properties" class="badge badge-property">{len(class_data["properties"])} Propriétés</a>\n'
-        if class_data['methods']:
-            html += f'                    <a href="#methods" class="badge badge-method">{len(class_data["methods"])} Méthodes</a>\n'
-        
-        html += """                </div>
-            </div>
-"""
-        
-        # Champs
-        if class_data['fields']:
-            html += """
-            <section id="fields" class="member-section">
-                <h3>🔹 Champs</h3>
-                <div class="member-grid">
-"""
-            for field in class_data['fields']:
-                html += f"""                    <div class="member-card">
-                        <h4><code>{escape(field['name'])}</code></h4>
-                        <p>{escape(field['summary'])}</p>
-                    </div>
-"""
-            html += """                </div>
-            </section>
-"""
-        
-        # Propriétés
-        if class_data['properties']:
-            html += """
-            <section id="properties" class="member-section">
-                <h3>🔸 Propriétés</h3>
-                <div class="member-grid">
-"""
-            for prop in class_data['properties']:
-                html += f"""                    <div class="member-card">
-                        <h4><code>{escape(prop['name'])}</code></h4>
-                        <p>{escape(prop['summary'])}</p>
-                    </div>
-"""
-            html += """                </div>
-            </section>
-"""
-        
-        # Méthodes
-        if class_data['methods']:
-            html += """
-            <section id="methods" class="member-section">
-                <h3>⚡ Méthodes</h3>
-"""
-            for method in class_data['methods']:
-                method_id = self.sanitize_filename(method['name'])
-                html += f"""
-                <div class="method-card" id="{method_id}">
-                    <div class="method-header">
-                        <h4><code>{escape(method['name'])}</code></h4>
-                        <a href="#{method_id}" class="anchor-link">#</a>
-                    </div>
-                    <p class="method-summary">{escape(method['summary'])}</p>
-"""
-                
-                if method['params']:
-                    html += """
-                    <div class="params-section">
-                        <h5>Paramètres</h5>
-                        <table class="params-table">
-"""
-                    for param in method['params']:
-                        html += f"""                            <tr>
-                                <td><code>{escape(param["name"])}</code></td>
-                                <td>{escape(param["desc"])}</td>
-                            </tr>
+    <nav>
+        <h2>Classes</h2>
+        <ul class="class-list">
 """
-                    html += """                        </table>
-                    </div>
-"""
-                
-                if method['returns']:
-                    html += f"""
-                    <div class="returns-section">
-                        <h5>Valeur de retour</h5>
-                        <p>{escape(method['returns'])}</p>
-                    </div>
-"""
-                
-                if method['remarks']:
-                    html += f"""
-                    <div class="remarks-section">
-                        <h5>Remarques</h5>
-                        <p>{escape(method['remarks'])}</p>
-                    </div>
-"""
-                
-                html += """                </div>
-"""
-            html += """            </section>
-"""
-        
-        html += """        </main>
-    </div>
+
+JAVADOC_FOOTER = """    </main>
     
     <footer>
-        <p>Généré avec DocGenerator v2.0 pour C# • © 2024</p>
+        <p>Généré avec DocGenerator pour C#</p>
     </footer>
-    
-    <script src="script.js"></script>
 </body>
 </html>"""
-        
-        with open(os.path.join(self.output_dir, f'{safe_name}.html'), 'w', encoding='utf-8') as f:
-            f.write(html)
+
+# Moteurs de rendu (--format) : nom → classe, voir register_backend
+RENDER_BACKENDS = {}
+
+def register_backend(name):
+    """Décorateur : enregistre une classe de rendu sous un nom de format
     
-    def generate_css(self):
-        """Génère le fichier CSS amélioré"""
-        css = """/* Variables CSS pour le thème */
-:root {
-    --bg-primary: #ffffff;
-    --bg-secondary: #f8f9fa;
-    --bg-card: #ffffff;
-    --text-primary: #2d3748;
-    --text-secondary: #718096;
+    La classe est construite avec (générateur, dossier de sortie) : le générateur porte le
+    modèle déjà parsé (classes, namespaces, stats). render() écrit le site, sans reparser le XML.
+    """
+    def decorator(cls):
+        cls.format_name = name
+        RENDER_BACKENDS[name] = cls
+        return cls
+    return decorator
+
+def _hash_text(text):
+    """Empreinte SHA-256 d'une chaîne"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+# Générateur partagé par les processus de rendu (voir --jobs)
+_worker_generator = None
+
+def _init_render_worker(output_dir, cref_urls, referenced_by):
+    """Initialise un processus de rendu (tables dérivées du modèle calculées par le processus principal)"""
+    global _worker_generator
+    _worker_generator = DocGenerator(None, output_dir)
+    _worker_generator._cref_urls = cref_urls
+    _worker_generator._referenced_by = referenced_by
+
+def _render_page_worker(item):
+    """Rend une page de classe dans un processus de rendu, renvoie (fichier, HTML, durée)"""
+    class_name, class_data = item
+    start = time.perf_counter()
+    filename, html = _worker_generator.render_class_page(class_name, class_data)
+    return filename, html, time.perf_counter() - start
+
+def _render_backend_worker(format_name, output_dir, model):
+    """Rend un format dans un processus dédié, à partir du modèle parsé par le processus principal"""
+    generator = DocGenerator(None, output_dir)
+    generator.set_model(model)
+    RENDER_BACKENDS[format_name](generator, output_dir).render()
+
+def parse_doc_id(doc_id):
+    """Découpe un identifiant de documentation XML en (type, classe, membre)
+    
+    Gère les paramètres (M:Classe.Methode(System.String,System.Int32)), les génériques
+    (Liste`1, ``0, List{T}), les types imbriqués (+) et les constructeurs (#ctor).
+    Un seul parcours : le nom s'arrête à la première parenthèse, les paramètres restent
+    attachés au membre pour distinguer les surcharges. Renvoie None si l'identifiant est invalide.
+    """
+    if len(doc_id) < 3 or doc_id[1] != ':':
+        return None
+    kind = doc_id[0]
+    
+    paren = doc_id.find('(', 2)
+    if paren < 0:
+        path, params = doc_id[2:], ''
+    else:
+        path, params = doc_id[2:paren], doc_id[paren:]
+    if '+' in path:
+        path = path.replace('+', '.')
+    
+    if kind == 'T':
+        return kind, path, None
+    
+    dot = path.rfind('.')
+    if dot <= 0:
+        return None
+    return kind, path[:dot], path[dot + 1:] + params
+
+def _param_count(member_name):
+    """Nombre de paramètres d'un nom de membre d'identifiant XML : Methode(A,B{C,D}) → 2"""
+    paren = member_name.find('(')
+    if paren < 0:
+        return 0
+    params = member_name[paren + 1:member_name.rfind(')')]
+    if '{' not in params and '[' not in params:
+        return params.count(',') + 1
+    return len(split_top_level(params))
+
+# Caractères d'identifiant XML qui distinguent des surcharges : codés par un chiffre dans les ancres
+# (un nom C# ne commence jamais par un chiffre), pour que Set(Int32), Set(Int32[]), Set(Int32@)…
+# restent distincts ; les autres séparateurs (. ( ) #) deviennent un simple tiret. Voir memberAnchor.
+_ANCHOR_CODES = str.maketrans({',': '-0-', '[': '-1-', ']': '-2-', '@': '-3-', '*': '-4-',
+                               '{': '-5-', '}': '-6-', '`': '-7-', '~': '-8-', ':': '-9-'})
+
+def member_anchor(member_name):
+    """Ancre HTML d'un membre, utilisable telle quelle dans un sélecteur CSS
+    
+    Set(System.Int32[]) → Set-System-Int32-1-2 ; unique parmi les membres d'une classe.
+    """
+    return re.sub(r'[^A-Za-z0-9_]+', '-', member_name.translate(_ANCHOR_CODES)).strip('-')
+
+def expand_xml_paths(patterns):
+    """Liste ordonnée et sans doublon des fichiers XML désignés par des chemins ou des globs"""
+    if patterns is None:
+        return []
+    if isinstance(patterns, (str, os.PathLike)):
+        patterns = [patterns]
+    paths = []
+    for pattern in map(os.fspath, patterns):
+        matches = sorted(glob.glob(pattern)) if any(c in pattern for c in '*?[') else [pattern]
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+def _parse_assembly_worker(item):
+    """Parse un XML d'assembly dans un processus séparé
+    
+    Renvoie (assembly, chemin, XML valide, classes, classes exclues, membres exclus).
+    """
+    xml_path, streaming, cache_dir, cache_max_bytes, include, exclude = item
+    generator = DocGenerator(xml_path, streaming=streaming, cache_dir=cache_dir,
+                             cache_max_bytes=cache_max_bytes, include=include, exclude=exclude)
+    valid = generator.parse_xml()
+    return (generator.assembly, xml_path, valid, generator.classes, generator.excluded,
+            generator.stats['excluded_members'])
+
+class ClassFilter:
+    """Filtres --include/--exclude, appliqués à chaque classe pendant le parsing
+    
+    Motifs : glob sur le nom complet de la classe (Jeu.*, *Manager), namespace:NOM (ce namespace,
+    ses sous-namespaces et leurs types imbriqués) ou assembly:GLOB. Une classe est gardée si elle
+    correspond à un --include (quand il y en a) et à aucun --exclude ; la décision est mémorisée
+    par (assembly, classe) : un seul test par classe, quel que soit son nombre de membres.
+    """
+    def __init__(self, include=(), exclude=()):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.include_rules = self.compile(self.include)
+        self.exclude_rules = self.compile(self.exclude)
+        self.decisions = {}
+    
+    def __bool__(self):
+        return bool(self.include or self.exclude)
+    
+    @staticmethod
+    def compile(patterns):
+        """(expression sur le nom de classe, expression sur l'assembly), None si aucun motif"""
+        names, assemblies = [], []
+        for pattern in patterns:
+            if pattern.startswith('assembly:'):
+                assemblies.append(fnmatch.translate(pattern[len('assembly:'):]))
+            elif pattern.startswith('namespace:'):
+                names.append(re.escape(pattern[len('namespace:'):].strip('.')) + r'\..*\Z')
+            else:
+                names.append(fnmatch.translate(pattern))
+        return tuple(re.compile('|'.join(group)) if group else None for group in (names, assemblies))
+    
+    @staticmethod
+    def matches(rules, class_name, assembly):
+        names, assemblies = rules
+        return bool(names and names.match(class_name) or assemblies and assemblies.match(assembly))
+    
+    def keeps(self, class_name, assembly):
+        """Vrai si la classe est à documenter"""
+        key = (assembly, class_name)
+        keep = self.decisions.get(key)
+        if keep is None:
+            keep = self.decisions[key] = \
+                (not self.include or self.matches(self.include_rules, class_name, assembly)) \
+                and not self.matches(self.exclude_rules, class_name, assembly)
+        return keep
+
+def _exchange_paths(a, b):
+    """Échange atomiquement deux chemins (renameat2 RENAME_EXCHANGE, Linux) ; faux si indisponible"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint)
+    AT_FDCWD, RENAME_EXCHANGE = -100, 2
+    return renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0
+
+def default_cache_dir():
+    """Dossier de cache utilisateur (XDG_CACHE_HOME, LOCALAPPDATA ou ~/.cache)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') \
+        or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'audit-royal-docgen')
+
+def _fold(text):
+    """Normalise pour la recherche : minuscules, sans accents (même règle que script.js)"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+@lru_cache(maxsize=65536)
+def _token_keys(token):
+    """Préfixes bornés d'un jeton, plus le jeton entier"""
+    keys = [token[:i] for i in range(SEARCH_MIN_PREFIX, min(len(token), SEARCH_MAX_PREFIX) + 1)]
+    if len(token) > SEARCH_MAX_PREFIX:
+        keys.append(token)
+    return keys
+
+def _search_keys(tokens):
+    """Clés de l'index inversé pour un ensemble de jetons"""
+    keys = set()
+    for token in tokens:
+        if len(token) >= SEARCH_MIN_PREFIX:
+            keys.update(_token_keys(token))
+    return keys
+
+@lru_cache(maxsize=65536)
+def _word_tokens(word):
+    """Jetons normalisés d'un mot"""
+    return tuple(_TOKEN_RE.findall(_fold(word)))
+
+def _text_tokens(text):
+    """Jetons normalisés d'un texte libre (résumé)"""
+    tokens = set()
+    for word in _WORD_RE.findall(text):
+        tokens.update(_word_tokens(word))
+    return tokens
+
+def _name_tokens(name):
+    """Jetons d'un nom : identifiant complet et mots du CamelCase (CarnetManager → carnet, manager)"""
+    tokens = set(_TOKEN_RE.findall(_fold(name)))
+    for word in re.findall(r'[A-Za-z0-9]+', name):
+        tokens.update(_fold(part) for part in _CAMEL_RE.findall(word))
+    return tokens
+
+@lru_cache(maxsize=None)
+def _generator_fingerprint():
+    """Empreinte du générateur : tout changement de gabarit (ou du scanner C#) invalide le manifeste"""
+    digest = hashlib.sha256()
+    for path in (__file__, cs_source.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+class ClassDoc:
+    """Type documenté : classe, struct, interface ou enum
+    
+    Enregistrements à __slots__ plutôt que dictionnaires : pas de clés répétées par instance,
+    et les champs absents pointent tous vers la même chaîne vide. Les textes (summary, remarks…)
+    sont des fragments HTML produits par _markup, avec des liens cref encore à résoudre.
+    """
+    __slots__ = ('name', 'full_name', 'namespace', 'assemblies', 'summary', 'remarks', 'example',
+                 'methods', 'fields', 'properties', 'coverage')
+    
+    def __init__(self, name, full_name, namespace, assemblies, summary='', remarks='', example='',
+                 methods=None, fields=None, properties=None, coverage=None):
+        self.name = name
+        self.full_name = full_name
+        self.namespace = namespace
+        self.assemblies = assemblies
+        self.summary = summary
+        self.remarks = remarks
+        self.example = example
+        self.methods = [] if methods is None else methods
+        self.fields = [] if fields is None else fields
+        self.properties = [] if properties is None else properties
+        self.coverage = Coverage(types=1) if coverage is None else coverage
+    
+    def __reduce__(self):
+        # Pickle compact (cache du modèle, processus de rendu) : un tuple, sans noms d'attributs
+        return ClassDoc, (self.name, self.full_name, self.namespace, self.assemblies, self.summary,
+                          self.remarks, self.example, self.methods, self.fields, self.properties,
+                          self.coverage)
+    
+    def to_dict(self):
+        """Représentation JSON (empreinte du manifeste)"""
+        return {
+            'name': self.name,
+            'full_name': self.full_name,
+            'namespace': self.namespace,
+            'assemblies': list(self.assemblies),
+            'summary': self.summary,
+            'remarks': self.remarks,
+            'example': self.example,
+            'methods': [m.to_dict() for m in self.methods],
+            'fields': [m.to_dict() for m in self.fields],
+            'properties': [m.to_dict() for m in self.properties],
+        }
+    
+    def payload(self, doc_html, references=()):
+        """Données compactes lues par la vue de classe de script.js (clés courtes, vides omis)
+        
+        doc_html convertit chaque fragment de documentation en HTML final (liens cref résolus) ;
+        references est la liste (libellé, URL) de la section « Référencé par ».
+        """
+        data = {'n': self.name, 'f': self.full_name}
+        if self.namespace:
+            data['ns'] = self.namespace
+        for key, value in (('s', self.summary), ('r', self.remarks), ('x', self.example)):
+            if value:
+                data[key] = doc_html(value)
+        data['a'] = list(self.assemblies)
+        if self.fields:
+            data['F'] = [[m.name, doc_html(m.summary)] for m in self.fields]
+        if self.properties:
+            data['P'] = [[m.name, doc_html(m.summary)] for m in self.properties]
+        if self.methods:
+            data['M'] = [[m.name, doc_html(m.summary), [[name, doc_html(desc)] for name, desc in m.params],
+                          doc_html(m.returns), doc_html(m.remarks)]
+                         for m in self.methods]
+        if references:
+            data['R'] = [list(ref) for ref in references]
+        return data
+    
+    def doc_texts(self):
+        """Tous les fragments de documentation de la classe et de ses membres"""
+        yield self.summary
+        yield self.remarks
+        yield self.example
+        for method in self.methods:
+            yield method.summary
+            yield method.returns
+            yield method.remarks
+            for _, desc in method.params:
+                yield desc
+        for member in self.fields:
+            yield member.summary
+        for member in self.properties:
+            yield member.summary
+
+
+class MethodDoc:
+    """Méthode documentée ; params est un tuple de paires (nom, description)"""
+    __slots__ = ('name', 'summary', 'params', 'returns', 'remarks')
+    
+    def __init__(self, name, summary='', params=(), returns='', remarks=''):
+        self.name = name
+        self.summary = summary
+        self.params = params
+        self.returns = returns
+        self.remarks = remarks
+    
+    def __reduce__(self):
+        return MethodDoc, (self.name, self.summary, self.params, self.returns, self.remarks)
+    
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'summary': self.summary,
+            'params': [{'name': name, 'desc': desc} for name, desc in self.params],
+            'returns': self.returns,
+            'remarks': self.remarks,
+        }
+
+
+class MemberDoc:
+    """Champ ou propriété documenté"""
+    __slots__ = ('name', 'summary')
+    
+    def __init__(self, name, summary=''):
+        self.name = name
+        self.summary = summary
+    
+    def __reduce__(self):
+        return MemberDoc, (self.name, self.summary)
+    
+    def to_dict(self):
+        return {'name': self.name, 'summary': self.summary}
+
+
+class Coverage:
+    """Couverture de la documentation d'une classe, ou cumulée sur un namespace
+    
+    Comptée au parsing par process_member : ni les statistiques ni le rapport ne reparcourent
+    les membres. Les éléments sont le type et ses membres ; un élément est documenté si son
+    résumé n'est pas vide. gaps liste les manques d'une classe en (nature, membre), nature
+    parmi summary, param et returns ; les cumuls de namespace n'ont que les compteurs.
+    """
+    __slots__ = ('types', 'documented_types', 'members', 'documented_members',
+                 'missing_params', 'missing_returns', 'gaps')
+    COUNTERS = __slots__[:-1]
+    
+    def __init__(self, types=0, documented_types=0, members=0, documented_members=0,
+                 missing_params=0, missing_returns=0, gaps=None):
+        self.types = types
+        self.documented_types = documented_types
+        self.members = members
+        self.documented_members = documented_members
+        self.missing_params = missing_params
+        # <returns> n'est vérifiable que si le type de retour est connu (voir process_member)
+        self.missing_returns = missing_returns
+        self.gaps = [] if gaps is None else gaps
+    
+    def __reduce__(self):
+        return Coverage, (self.types, self.documented_types, self.members,
+                          self.documented_members, self.missing_params, self.missing_returns,
+                          self.gaps)
+    
+    def add(self, other, sign=1):
+        """Ajoute (ou retire, sign=-1) les compteurs d'une autre couverture"""
+        for key in Coverage.COUNTERS:
+            setattr(self, key, getattr(self, key) + sign * getattr(other, key))
+    
+    def percent(self):
+        """Part des éléments documentés, en pourcentage (100 sans élément)"""
+        total = self.types + self.members
+        if not total:
+            return 100.0
+        return round(100 * (self.documented_types + self.documented_members) / total, 1)
+    
+    def to_dict(self):
+        """Représentation JSON (rapport --coverage-json)"""
+        data = {
+            'percent': self.percent(),
+            'documented': self.documented_types + self.documented_members,
+            'total': self.types + self.members,
+            'empty_summaries': self.types - self.documented_types
+                               + self.members - self.documented_members,
+            'missing_params': self.missing_params,
+            'missing_returns': self.missing_returns,
+        }
+        if self.gaps:
+            gaps = data['gaps'] = {}
+            for nature, member in self.gaps:
+                gaps.setdefault(nature, []).append(member)
+        return data
+
+
+# Balises des commentaires XML rendues dans le flux du texte : les fragments sont insérés dans
+# des <p>, d'où des <span>/<code> mis en forme par le CSS plutôt que <p>, <ul> ou <pre>
+_INLINE_TAGS = {
+    'c': ('<code>', '</code>'),
+    'code': ('<code class="doc-code">', '</code>'),
+    'para': ('<span class="doc-para">', '</span>'),
+    'b': ('<strong>', '</strong>'),
+    'i': ('<em>', '</em>'),
+}
+# Lien cref en attente de résolution (DocGenerator.doc_html) ; le texte étant échappé,
+# ce marqueur ne peut pas venir du commentaire lui-même
+_CREF_RE = re.compile(r'<a href="cref:([^"]*)">')
+_TAG_RE = re.compile(r'<[^>]*>')
+# Noms de types dans la liste de paramètres d'un identifiant XML : Methode(Jeu.Joueur,System.Int32[])
+_SIGNATURE_TYPE_RE = re.compile(r'[A-Za-z_][\w.`]*')
+
+def _type_argument_count(text, brace):
+    """Nombre d'arguments de type de Nom{A,B{C,D}}, l'accolade ouvrante étant en text[brace]"""
+    depth, count = 0, 1
+    for ch in text[brace:]:
+        if ch in '{[(':
+            depth += 1
+        elif ch in '}])':
+            depth -= 1
+            if depth == 0:
+                break
+        elif ch == ',' and depth == 1:
+            count += 1
+    return count
+
+def _cref_label(cref):
+    """Texte d'un lien cref sans libellé : Type, ou Type.Membre (sans les paramètres)"""
+    parsed = parse_doc_id(cref)
+    if parsed is None:
+        return cref[2:] if cref[1:2] == ':' else cref
+    kind, class_name, member_name = parsed
+    short_class = class_name.rsplit('.', 1)[-1]
+    if kind == 'T':
+        return short_class
+    return f"{short_class}.{member_name.split('(', 1)[0]}"
+
+def _append_markup(w, element):
+    """Ajoute via w le HTML du contenu d'un élément (texte, enfants et leurs queues)"""
+    if element.text:
+        w(escape(element.text))
+    for child in element:
+        tag = child.tag
+        if tag == 'see' or tag == 'seealso':
+            cref = child.get('cref')
+            href = child.get('href')
+            if cref:
+                w(f'<a href="cref:{escape(cref)}"><code>')
+                if child.text or len(child):
+                    _append_markup(w, child)
+                else:
+                    w(escape(_cref_label(cref)))
+                w('</code></a>')
+            elif href and href.startswith(('http://', 'https://')):
+                w(f'<a href="{escape(href)}">')
+                if child.text or len(child):
+                    _append_markup(w, child)
+                else:
+                    w(escape(href))
+                w('</a>')
+            elif child.get('langword'):
+                w(f'<code>{escape(child.get("langword"))}</code>')
+            else:
+                _append_markup(w, child)
+        elif tag == 'paramref' or tag == 'typeparamref':
+            w(f'<code class="paramref">{escape(child.get("name", ""))}</code>')
+        elif tag == 'list':
+            _append_list(w, child)
+        else:
+            # Balise inconnue : son texte est gardé
+            open_tag, close_tag = _INLINE_TAGS.get(tag, ('', ''))
+            w(open_tag)
+            _append_markup(w, child)
+            w(close_tag)
+        if child.tail:
+            w(escape(child.tail))
+
+def _append_list(w, element):
+    """<list type="bullet|number|table"> : une ligne par <item>, « terme — description »"""
+    kind = 'number' if element.get('type') == 'number' else 'bullet'
+    w(f'<span class="doc-list doc-list-{kind}">')
+    for item in element:
+        if item.tag != 'item' and item.tag != 'listheader':
+            continue
+        w('<span class="doc-list-header">' if item.tag == 'listheader' else '<span class="doc-item">')
+        term = item.find('term')
+        description = item.find('description')
+        if term is not None:
+            w('<strong>')
+            _append_markup(w, term)
+            w('</strong>')
+            if description is not None:
+                w(' — ')
+        if description is not None:
+            _append_markup(w, description)
+        elif term is None:
+            _append_markup(w, item)
+        w('</span>')
+    w('</span>')
+
+def _markup(element):
+    """Fragment HTML d'un élément de documentation, produit en un seul parcours
+    
+    Le texte est échappé ; <see>, <seealso>, <paramref>, <typeparamref>, <c>, <code>, <para>
+    et <list> gardent leur structure. Les liens cref restent des marqueurs résolus au rendu,
+    une fois toutes les classes connues. Chaîne vide partagée si l'élément est absent ou vide.
+    """
+    if element is None:
+        return ''
+    if not len(element):
+        # Cas courant : du texte seul
+        return escape(element.text.strip()) if element.text else ''
+    out = []
+    _append_markup(out.append, element)
+    return ''.join(out).strip()
+
+def _plain_text(markup):
+    """Texte brut d'un fragment de documentation (index de recherche)"""
+    if '<' not in markup and '&' not in markup:
+        return markup
+    return unescape(_TAG_RE.sub('', markup))
+
+
+# Mode source (--source) : commentaires /// lus directement dans les scripts C#, sans compilation
+SOURCE_ASSEMBLY = 'Assembly-CSharp'
+SOURCE_DEFAULT_DIR = 'Assets/Scripts'
+
+
+def _scan_source_worker(item):
+    """Analyse un script C# dans un processus séparé
+    
+    Renvoie (chemin, mtime, taille, empreinte, enregistrements) ; enregistrements vaut None si
+    l'empreinte est celle du cache (fichier touché mais inchangé).
+    """
+    path, mtime_ns, size, cached_digest = item
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == cached_digest:
+        return path, mtime_ns, size, digest, None
+    return path, mtime_ns, size, digest, scan_csharp_source(data.decode('utf-8-sig', errors='replace'))
+
+
+class BuildProfiler:
+    """Mesures d'une génération (--profile)
+    
+    Par phase : temps mur, temps CPU du processus principal et, avec memory, pic mémoire
+    (tracemalloc). Le traçage ralentit chaque allocation (les temps triplent, inégalement selon
+    les phases) : sans memory, les temps sont mesurés sans lui et le pic n'est pas relevé.
+    Par page de classe : temps de rendu et taille écrite. Par type de fichier : octets écrits.
+    """
+    
+    def __init__(self, top=10, memory=False):
+        self.top = top
+        self.memory = memory
+        self.phases = []
+        self.page_times = {}
+        self.file_sizes = {}
+        self.bytes_by_type = defaultdict(int)
+        self.files_by_type = defaultdict(int)
+        self.io_seconds = 0.0
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+    
+    @contextmanager
+    def phase(self, name):
+        """Mesure le bloc comme une phase nommée"""
+        if self.memory:
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'phase': name,
+                'wall_ms': round((time.perf_counter() - wall) * 1000, 2),
+                'cpu_ms': round((time.process_time() - cpu) * 1000, 2),
+                'peak_mb': (round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+                            if self.memory else None),
+            })
+    
+    def record_page(self, filename, seconds):
+        self.page_times[filename] = seconds
+    
+    def record_file(self, filename, size, seconds=0.0):
+        ext = os.path.splitext(filename)[1] or filename
+        self.bytes_by_type[ext] += size
+        self.files_by_type[ext] += 1
+        self.file_sizes[filename] = size
+        self.io_seconds += seconds
+    
+    def report(self):
+        """Rapport sous forme de dictionnaire (sérialisable en JSON)"""
+        pages = self.page_times
+        slowest = sorted(pages, key=pages.get, reverse=True)[:self.top]
+        largest = sorted(pages, key=lambda f: self.file_sizes.get(f, 0), reverse=True)[:self.top]
+        return {
+            'memory_traced': self.memory,
+            'phases': self.phases,
+            'total_wall_ms': round(sum(p['wall_ms'] for p in self.phases), 2),
+            'write_ms': round(self.io_seconds * 1000, 2),
+            'pages': {
+                'count': len(pages),
+                'render_ms': round(sum(pages.values()) * 1000, 2),
+                'avg_render_us': round(sum(pages.values()) / len(pages) * 1e6, 1) if pages else 0,
+                'slowest': [{'file': f, 'render_us': round(pages[f] * 1e6, 1)} for f in slowest],
+                'largest': [{'file': f, 'bytes': self.file_sizes.get(f, 0)} for f in largest],
+            },
+            'bytes_by_type': {
+                ext: {'files': self.files_by_type[ext], 'bytes': self.bytes_by_type[ext]}
+                for ext in sorted(self.bytes_by_type)
+            },
+        }
+    
+    def print_report(self):
+        report = self.report()
+        print(f"\n⏱️  Profil de la génération:")
+        print(f"   {'phase':<22} {'mur (ms)':>10} {'CPU (ms)':>10} {'pic (Mo)':>9}")
+        for p in report['phases']:
+            peak = '-' if p['peak_mb'] is None else p['peak_mb']
+            print(f"   {p['phase']:<22} {p['wall_ms']:>10} {p['cpu_ms']:>10} {peak:>9}")
+        print(f"   {'total':<22} {report['total_wall_ms']:>10}")
+        print(f"   dont écriture disque: {report['write_ms']} ms")
+        if self.memory:
+            print("   ⚠️  Temps mesurés sous tracemalloc (--profile-memory) : gonflés et à ne pas "
+                  "comparer entre phases ; relancer sans pour les temps")
+        else:
+            print("   Pic mémoire par phase : --profile-memory (ralentit la mesure des temps)")
+        
+        pages = report['pages']
+        if pages['count']:
+            print(f"\n   {pages['count']} page(s) de classe rendue(s) en {pages['render_ms']} ms "
+                  f"({pages['avg_render_us']} µs/page)")
+            print(f"   Plus lentes:")
+            for p in pages['slowest']:
+                print(f"      {p['render_us']:>10} µs  {p['file']}")
+            print(f"   Plus lourdes:")
+            for p in pages['largest']:
+                print(f"      {p['bytes']:>10} o   {p['file']}")
+        
+        print(f"\n   Octets écrits par type:")
+        for ext, totals in report['bytes_by_type'].items():
+            print(f"      {ext:<8} {totals['files']:>7} fichier(s) {totals['bytes']:>12} o")
+
+
+class DocGenerator:
+    def __init__(self, xml_path, output_dir="documentation_html", streaming=True, incremental=False, jobs=1,
+                 compress=False, compress_min_size=1024, cache_dir=None,
+                 cache_max_bytes=CACHE_MAX_BYTES, atomic=False, archive=None, bundle=None,
+                 client_render=False, targets=None, source_dir=None, include=(), exclude=()):
+        self.xml_paths = expand_xml_paths(xml_path)
+        self.xml_path = self.xml_paths[0] if self.xml_paths else xml_path
+        self.assembly = sys.intern(Path(self.xml_path).stem) if self.xml_path else ""
+        # Mode source : scripts C# lus directement, sans XML du compilateur
+        self.source_dir = source_dir
+        self.source_cache = None
+        if source_dir:
+            self.assembly = SOURCE_ASSEMBLY
+        self.output_dir = output_dir
+        # Formats à produire depuis le même modèle : [(format, dossier)], voir render
+        self.targets = targets or [('interactive', output_dir)]
+        self.streaming = streaming
+        # Publication atomique : les fichiers inchangés sont liés depuis le site en ligne,
+        # ce qui revient à une génération incrémentale dans le dossier de préparation
+        self.atomic = atomic
+        self.incremental = incremental or atomic
+        self.link_from = None
+        # Sorties sans arborescence : une archive .zip/.tar.gz, ou un seul fichier HTML
+        self.archive_path = archive
+        self.archive = None
+        self.bundle_path = bundle
+        # Rendu côté client : un JSON par classe au lieu d'une page HTML
+        self.client_render = client_render
+        self.jobs = jobs
+        self.compress = compress
+        self.compress_min_size = compress_min_size
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.profiler = None
+        self.written_files = []
+        self.unchanged_files = []
+        self.previous_manifest = None
+        self.manifest = {'pages': {}, 'assets': {}}
+        self.skipped_files = 0
+        self.classes = {}
+        self._cref_urls = None
+        self._referenced_by = None
+        self.namespaces = defaultdict(list)
+        # Couverture cumulée par namespace ('' = global), tenue à jour au parsing
+        self.coverage = defaultdict(Coverage)
+        # Classes écartées par --include/--exclude : jamais construites, liens rendus en texte
+        self.class_filter = ClassFilter(include, exclude)
+        self.excluded = set()
+        self.stats = {
+            'total_classes': 0,
+            'total_methods': 0,
+            'total_properties': 0,
+            'total_fields': 0,
+            'excluded_members': 0
+        }
+        
+    def parse_xml(self):
+        """Parse le fichier XML de documentation
+        
+        Renvoie faux si un XML est invalide (fichier tronqué, en cours d'écriture…) : le modèle est
+        alors vidé, pour ne jamais générer ni mettre en cache un site partiel.
+        """
+        if self.source_dir:
+            self.parse_sources()
+            return True
+        if len(self.xml_paths) > 1:
+            return self.parse_assemblies()
+        
+        cache_path = self.cache_path() if self.cache_dir else None
+        if cache_path and self.load_cached_model(cache_path):
+            return True
+        
+        valid = self.parse_xml_uncached()
+        
+        # Un modèle n'est mis en cache qu'après un parsing complet
+        if cache_path and valid and self.classes:
+            self.store_cached_model(cache_path)
+        return valid
+    
+    def phase(self, name):
+        """Contexte de mesure d'une phase (sans effet hors --profile)"""
+        return self.profiler.phase(name) if self.profiler else nullcontext()
+    
+    def cache_path(self):
+        """Fichier de cache du modèle : empreinte du XML + version du générateur + filtres"""
+        digest = hashlib.sha256(_generator_fingerprint().encode('ascii'))
+        digest.update(repr((self.class_filter.include, self.class_filter.exclude)).encode('utf-8'))
+        try:
+            with open(self.xml_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return os.path.join(self.cache_dir, f'{digest.hexdigest()}.pickle')
+    
+    def load_cached_model(self, cache_path):
+        """Charge le modèle (classes, namespaces, stats) depuis le cache ; faux si absent ou illisible"""
+        try:
+            with open(cache_path, 'rb') as f:
+                model = pickle.load(f)
+            self.set_model(model)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError,
+                AttributeError, ImportError, TypeError, IndexError):
+            # Entrée corrompue ou écrite par un autre modèle de classes : on reparse
+            self.reset()
+            return False
+        
+        # Marquer l'entrée comme récemment utilisée (éviction LRU) ; cache en lecture seule toléré
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return True
+    
+    def store_cached_model(self, cache_path):
+        """Enregistre le modèle dans le cache puis applique l'éviction LRU"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self.model(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self.evict_cache()
+        except OSError as e:
+            print(f"⚠️  Cache non écrit: {e}")
+    
+    def model(self):
+        """Modèle parsé, transmissible à un autre processus :
+        (classes, namespaces, stats, assembly, couverture par namespace, classes exclues)"""
+        return (self.classes, dict(self.namespaces), self.stats, self.assembly, dict(self.coverage),
+                self.excluded)
+    
+    def set_model(self, model):
+        """Reprend un modèle produit par model()"""
+        classes, namespaces, stats, assembly, coverage, excluded = model
+        self.coverage = defaultdict(Coverage, coverage)
+        self.excluded = excluded
+        self.classes = classes
+        self._cref_urls = None
+        self._referenced_by = None
+        self.namespaces = defaultdict(list, namespaces)
+        self.stats = stats
+        self.assembly = assembly
+    
+    def evict_cache(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de cache_max_bytes"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.pickle'):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            os.remove(path)
+            total -= size
+    
+    def parse_assemblies(self):
+        """Parse plusieurs XML (un par assembly) en parallèle et fusionne les modèles"""
+        items = [(path, self.streaming, self.cache_dir, self.cache_max_bytes,
+                  self.class_filter.include, self.class_filter.exclude)
+                 for path in self.xml_paths]
+        if self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(items))) as pool:
+                parsed = list(pool.map(_parse_assembly_worker, items))
+        else:
+            parsed = [_parse_assembly_worker(item) for item in items]
+        
+        # Ordre de fusion fixe (nom d'assembly puis chemin) : le résultat ne dépend
+        # ni de l'ordre des arguments ni de l'ordre de fin des processus
+        invalid = [path for _, path, valid, *_ in parsed if not valid]
+        if invalid:
+            # Fusionner les autres assemblies supprimerait les pages de celle-ci
+            print(f"⚠️  XML invalide, génération annulée: {', '.join(invalid)}")
+            self.reset()
+            return False
+        
+        shared = 0
+        for assembly, _, _, classes, excluded, excluded_members in sorted(parsed, key=lambda r: (r[0], r[1])):
+            self.excluded |= excluded
+            self.stats['excluded_members'] += excluded_members
+            for class_name, class_data in classes.items():
+                existing = self.classes.get(class_name)
+                if existing is None:
+                    self.classes[class_name] = class_data
+                else:
+                    self.merge_partial_class(existing, class_data)
+                    shared += 1
+        
+        stats = self.stats
+        for class_name, class_data in self.classes.items():
+            if class_data.namespace:
+                self.namespaces[class_data.namespace].append(class_name)
+            # Compteurs des processus, après fusion des classes partielles
+            self.coverage[class_data.namespace].add(class_data.coverage)
+            stats['total_methods'] += len(class_data.methods)
+            stats['total_properties'] += len(class_data.properties)
+            stats['total_fields'] += len(class_data.fields)
+        
+        # Un type peut être imbriqué dans un type d'une autre assembly
+        self.resolve_nested_types()
+        self.calculate_stats()
+        
+        print(f"📦 {len(parsed)} assemblies fusionnées"
+              + (f" ({shared} classe(s) présente(s) dans plusieurs assemblies)" if shared else ""))
+        return True
+    
+    @staticmethod
+    def merge_partial_class(existing, incoming):
+        """Fusionne une classe déclarée dans plusieurs assemblies ; la première garde la priorité"""
+        for key in ('summary', 'remarks', 'example'):
+            if not getattr(existing, key):
+                setattr(existing, key, getattr(incoming, key))
+        coverage = existing.coverage
+        coverage.documented_types = 1 if existing.summary else 0
+        added = set()
+        for kind in ('methods', 'fields', 'properties'):
+            members = getattr(existing, kind)
+            known = {member.name for member in members}
+            for member in getattr(incoming, kind):
+                if member.name not in known:
+                    members.append(member)
+                    added.add(member.name)
+                    coverage.members += 1
+                    coverage.documented_members += 1 if member.summary else 0
+        # Les manques des membres repris suivent
+        for nature, name in incoming.coverage.gaps:
+            if name in added:
+                coverage.gaps.append((nature, name))
+                if nature == 'param':
+                    coverage.missing_params += 1
+                elif nature == 'returns':
+                    coverage.missing_returns += 1
+        existing.assemblies += tuple(a for a in incoming.assemblies
+                                     if a not in existing.assemblies)
+    
+    def source_paths(self):
+        """Scripts C# du mode source (récursif), triés"""
+        pattern = os.path.join(glob.escape(self.source_dir), '**', '*.cs')
+        return sorted(glob.glob(pattern, recursive=True))
+    
+    def source_cache_path(self):
+        """Fichier du cache par script du mode source (un par dossier et version du générateur)"""
+        key = f'{_generator_fingerprint()}\0{os.path.abspath(self.source_dir)}'
+        return os.path.join(self.cache_dir,
+                            f"source-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pickle")
+    
+    def load_source_cache(self):
+        """Cache par script : {chemin: (mtime_ns, taille, sha256, enregistrements)}"""
+        if self.source_cache is not None:
+            return self.source_cache
+        if not self.cache_dir:
+            return {}
+        cache_path = self.source_cache_path()
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError,
+                AttributeError, ImportError, TypeError, IndexError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cache
+    
+    def parse_sources(self):
+        """Extrait la documentation des commentaires /// des scripts C# (--source)
+        
+        Seuls les scripts dont le mtime ou la taille a changé sont relus, en parallèle avec -j ;
+        un script touché mais identique (même sha256) n'est pas réanalysé. Chaque commentaire
+        passe ensuite par process_member sous l'identifiant qu'écrirait le compilateur ; les
+        déclarations visibles sans commentaire ne comptent que dans la couverture.
+        """
+        cache = self.load_source_cache()
+        entries = {}
+        items = []
+        for path in self.source_paths():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = cache.get(path)
+            if entry and entry[:2] == (st.st_mtime_ns, st.st_size):
+                entries[path] = entry
+            else:
+                items.append((path, st.st_mtime_ns, st.st_size, entry[2] if entry else None))
+        
+        if self.jobs > 1 and len(items) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(items))) as pool:
+                scanned = list(pool.map(_scan_source_worker, items))
+        else:
+            scanned = [_scan_source_worker(item) for item in items]
+        
+        analysed = 0
+        for path, mtime_ns, size, digest, records in scanned:
+            if records is None:
+                records = cache[path][3]
+            else:
+                analysed += 1
+            entries[path] = (mtime_ns, size, digest, records)
+        
+        # Ordre des chemins : le modèle ne dépend pas de l'ordre de fin des processus
+        records = [record for path in sorted(entries) for record in entries[path][3]]
+        malformed = []
+        undocumented = []
+        for doc_id, doc, namespace, returns in source_doc_ids(records):
+            if doc is None:
+                undocumented.append((doc_id, namespace, returns))
+                continue
+            try:
+                member = ET.fromstring(f'<member>{doc}</member>')
+            except ET.ParseError:
+                malformed.append(doc_id)
+                continue
+            self.process_member(doc_id, member, returns)
+        
+        self.resolve_nested_types()
+        # Après les commentaires : un type partiel documenté dans un autre script a déjà sa classe
+        for doc_id, namespace, returns in dict.fromkeys(undocumented):
+            self.count_undocumented(doc_id, namespace, returns)
+        self.calculate_stats()
+        
+        self.source_cache = entries
+        if self.cache_dir and (scanned or len(entries) != len(cache)):
+            self.store_source_cache(entries)
+        
+        print(f"📝 {len(entries)} script(s) C# lu(s) dans {self.source_dir} "
+              f"({analysed} analysé(s), {len(entries) - analysed} repris du cache)")
+        if malformed:
+            print(f"⚠️  {len(malformed)} commentaire(s) /// au XML invalide ignoré(s): "
+                  f"{', '.join(malformed[:5])}{' …' if len(malformed) > 5 else ''}")
+    
+    def store_source_cache(self, entries):
+        """Enregistre le cache par script puis applique l'éviction LRU"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = self.source_cache_path()
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self.evict_cache()
+        except OSError as e:
+            print(f"⚠️  Cache non écrit: {e}")
+    
+    def parse_xml_uncached(self):
+        """Parse le XML, en flux ou en chargeant tout l'arbre ; faux (modèle vidé) si le XML est invalide"""
+        if self.streaming:
+            return self.parse_xml_streaming()
+        
+        try:
+            tree = ET.parse(self.xml_path)
+            root = tree.getroot()
+            
+            self.assembly = sys.intern(root.findtext('assembly/name', self.assembly).strip())
+            
+            members = root.find('members')
+            if members is None:
+                print("Aucun membre trouvé dans le XML")
+                return True
+            
+            for member in members.findall('member'):
+                name = member.get('name')
+                if name:
+                    self.process_member(name, member)
+            
+            # Calculer les statistiques
+            self.resolve_nested_types()
+            self.calculate_stats()
+                    
+        except Exception as e:
+            print(f"Erreur lors du parsing XML: {e}")
+            self.reset()
+            return False
+        return True
+    
+    def parse_xml_streaming(self):
+        """Parse le XML en flux (iterparse) sans garder l'arbre complet en mémoire"""
+        try:
+            members = None
+            depth = 0
+            for event, elem in ET.iterparse(self.xml_path, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    # Seul <doc><members> compte, comme dans root.find('members')
+                    if depth == 2 and elem.tag == 'members' and members is None:
+                        members = elem
+                    continue
+                
+                depth -= 1
+                if depth == 1 and elem.tag == 'assembly':
+                    self.assembly = sys.intern(elem.findtext('name', self.assembly).strip())
+                    continue
+                if depth != 2 or elem.tag != 'member' or members is None:
+                    continue
+                
+                name = elem.get('name')
+                if name:
+                    self.process_member(name, elem)
+                
+                # Libérer le membre traité : l'arbre reste vide au fil du parsing
+                members.clear()
+            
+            if members is None:
+                print("Aucun membre trouvé dans le XML")
+                return True
+            
+            # Calculer les statistiques
+            self.resolve_nested_types()
+            self.calculate_stats()
+        
+        except Exception as e:
+            # Les classes lues avant l'erreur ne sont pas gardées : pas de site tronqué
+            print(f"Erreur lors du parsing XML: {e}")
+            self.reset()
+            return False
+        return True
+            
+    def process_member(self, name, member, returns_value=None):
+        """Traite un membre de la documentation
+        
+        Les statistiques et la couverture (classe et namespace) sont comptées ici, sans second
+        parcours. returns_value indique si une méthode renvoie une valeur ; le XML ne le dit pas
+        (None), sauf pour les opérateurs de conversion (~Type) : seul le mode --source le connaît.
+        """
+        parsed = parse_doc_id(name)
+        if parsed is None:
+            return
+        member_type, class_name, member_name = parsed
+        
+        # Initialiser la classe
+        class_doc = self.classes.get(class_name)
+        if class_doc is None and self.class_filter and (
+                not self.class_filter.keeps(class_name, self.assembly)
+                or class_name.rpartition('.')[0] in self.excluded):
+            # Classe filtrée (ou imbriquée dans une classe filtrée) : rien n'est construit
+            self.excluded.add(class_name)
+            self.stats['excluded_members'] += 1
+            return
+        if class_doc is None:
+            # Extraire le namespace (corrigé ensuite pour les types imbriqués)
+            dot = class_name.rfind('.')
+            namespace = sys.intern(class_name[:dot]) if dot > 0 else ""
+            class_doc = self.classes[class_name] = ClassDoc(
+                class_name[dot + 1:], class_name, namespace, (self.assembly,))
+            if namespace:
+                self.namespaces[namespace].append(class_name)
+            self.coverage[namespace].types += 1
+        coverage = class_doc.coverage
+        totals = self.coverage[class_doc.namespace]
+        
+        # Classer le membre
+        if member_type == 'T':
+            class_doc.summary = _markup(member.find('summary'))
+            class_doc.remarks = _markup(member.find('remarks'))
+            class_doc.example = _markup(member.find('example'))
+            documented = 1 if class_doc.summary else 0
+            totals.documented_types += documented - coverage.documented_types
+            coverage.documented_types = documented
+            return
+        if member_type == 'M':
+            # Noms de paramètres internés : les mêmes reviennent d'une méthode à l'autre
+            params = tuple((sys.intern(param.get('name', '')), _markup(param))
+                           for param in member.iterfind('param'))
+            method = MethodDoc(member_name, _markup(member.find('summary')), params,
+                               _markup(member.find('returns')), _markup(member.find('remarks')))
+            class_doc.methods.append(method)
+            self.stats['total_methods'] += 1
+            summary = method.summary
+            
+            # Paramètres de la signature sans <param> renseigné
+            if sum(1 for _, desc in params if desc) < _param_count(member_name):
+                coverage.gaps.append(('param', member_name))
+                coverage.missing_params += 1
+                totals.missing_params += 1
+            if not method.returns and (returns_value or '~' in member_name):
+                coverage.gaps.append(('returns', member_name))
+                coverage.missing_returns += 1
+                totals.missing_returns += 1
+        elif member_type == 'F':
+            summary = _markup(member.find('summary'))
+            class_doc.fields.append(MemberDoc(member_name, summary))
+            self.stats['total_fields'] += 1
+        elif member_type == 'P':
+            summary = _markup(member.find('summary'))
+            class_doc.properties.append(MemberDoc(member_name, summary))
+            self.stats['total_properties'] += 1
+        else:
+            return
+        
+        coverage.members += 1
+        totals.members += 1
+        if summary:
+            coverage.documented_members += 1
+            totals.documented_members += 1
+        else:
+            coverage.gaps.append(('summary', member_name))
+    
+    def count_undocumented(self, name, namespace, returns_value=None):
+        """Compte dans la couverture une déclaration visible sans commentaire /// (--source)
+        
+        Le compilateur ne l'écrit pas dans le XML : pas de page, mais un résumé vide (et les
+        <param>/<returns> manquants d'une méthode), dans la classe si elle est documentée par
+        ailleurs, sinon dans le seul cumul du namespace.
+        """
+        parsed = parse_doc_id(name)
+        if parsed is None:
+            return
+        member_type, class_name, member_name = parsed
+        if class_name in self.excluded or class_name.rpartition('.')[0] in self.excluded or (
+                self.class_filter and not self.class_filter.keeps(class_name, self.assembly)):
+            return
+        
+        class_doc = self.classes.get(class_name)
+        coverage = class_doc.coverage if class_doc else Coverage(types=0)
+        totals = self.coverage[class_doc.namespace if class_doc else namespace]
+        if member_type == 'T':
+            if class_doc is None:
+                totals.types += 1
+            return
+        
+        if member_type == 'M':
+            if _param_count(member_name):
+                coverage.gaps.append(('param', member_name))
+                coverage.missing_params += 1
+                totals.missing_params += 1
+            if returns_value or '~' in member_name:
+                coverage.gaps.append(('returns', member_name))
+                coverage.missing_returns += 1
+                totals.missing_returns += 1
+        coverage.members += 1
+        totals.members += 1
+        coverage.gaps.append(('summary', member_name))
+    
+    def reset(self):
+        """Vide le modèle et l'état de la génération précédente (le manifeste est conservé)"""
+        self.classes = {}
+        self._cref_urls = None
+        self._referenced_by = None
+        self.namespaces = defaultdict(list)
+        self.coverage = defaultdict(Coverage)
+        self.excluded = set()
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.manifest = {'pages': {}, 'assets': {}}
+        self.written_files = []
+        self.unchanged_files = []
+        self.skipped_files = 0
+    
+    def input_paths(self):
+        """Fichiers lus par parse_xml : les XML, ou les scripts C# en mode source"""
+        return self.source_paths() if self.source_dir else self.xml_paths
+    
+    def watch(self, interval=0.25, debounce=0.3):
+        """Régénère la documentation à chaque modification du XML (mtime/taille)
+        
+        Le processus reste chaud : pas de redémarrage de Python, manifeste gardé en mémoire,
+        et seules les pages modifiées sont réécrites (mode incrémental forcé). Une archive ou
+        un bundle n'a pas de manifeste : le fichier est réécrit en entier à chaque génération.
+        """
+        self.incremental = not (self.archive_path or self.bundle_path)
+        
+        def signature():
+            stamps = []
+            # En mode source, un script ajouté ou supprimé change aussi la signature
+            for path in self.input_paths():
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    return None
+                stamps.append((path, st.st_mtime_ns, st.st_size))
+            return tuple(stamps)
+        
+        last = signature()
+        self.rebuild()
+        watched = self.source_dir or ', '.join(self.xml_paths)
+        print(f"\n👀 Surveillance de {watched} (Ctrl+C pour arrêter)")
+        
+        try:
+            while True:
+                time.sleep(interval)
+                current = signature()
+                if current is None or current == last:
+                    continue
+                
+                # Attendre que le fichier soit stable : Unity peut l'écrire en plusieurs fois
+                while True:
+                    time.sleep(debounce)
+                    settled = signature()
+                    if settled == current:
+                        break
+                    current = settled
+                if current is None:
+                    continue
+                
+                last = current
+                self.rebuild()
+        except KeyboardInterrupt:
+            print("\n👋 Surveillance arrêtée")
+    
+    def rebuild(self):
+        """Reparse le XML et régénère les pages modifiées"""
+        start = time.perf_counter()
+        self.reset()
+        self.parse_xml()
+        if not self.classes:
+            print("⚠️  Aucune classe trouvée dans le XML")
+            return
+        self.render()
+        print(f"⏱️  Régénération en {(time.perf_counter() - start) * 1000:.0f} ms")
+    
+    def resolve_nested_types(self):
+        """Rattache les types imbriqués (Externe.Interne) au namespace de leur type englobant"""
+        for class_name, class_data in self.classes.items():
+            outer = class_data.namespace
+            if outer not in self.classes:
+                continue
+            
+            namespace = outer
+            while namespace in self.classes:
+                namespace = self.classes[namespace].namespace
+            
+            self.namespaces[outer].remove(class_name)
+            if not self.namespaces[outer]:
+                del self.namespaces[outer]
+            # La couverture comptée au parsing suit la classe dans son namespace
+            self.coverage[outer].add(class_data.coverage, -1)
+            if not self.coverage[outer].types:
+                del self.coverage[outer]
+            class_data.namespace = namespace
+            class_data.name = class_name[len(namespace) + 1:] if namespace else class_name
+            if namespace:
+                self.namespaces[namespace].append(class_name)
+            self.coverage[namespace].add(class_data.coverage)
+    
+    def calculate_stats(self):
+        """Complète les statistiques : les membres sont déjà comptés par process_member"""
+        self.stats['total_classes'] = len(self.classes)
+    
+    def coverage_total(self):
+        """Couverture de tout le modèle, cumul des namespaces"""
+        total = Coverage()
+        for totals in self.coverage.values():
+            total.add(totals)
+        return total
+    
+    def coverage_report(self):
+        """Rapport de couverture de --coverage-json : total, par namespace et par classe
+        
+        Les compteurs viennent du parsing ; seules les classes sont énumérées, pas leurs membres.
+        """
+        return {
+            'assembly': self.assembly,
+            'total': self.coverage_total().to_dict(),
+            'namespaces': {namespace: totals.to_dict()
+                           for namespace, totals in sorted(self.coverage.items())},
+            'classes': {class_name: class_data.coverage.to_dict()
+                        for class_name, class_data in sorted(self.classes.items())},
+        }
+    
+    def render(self):
+        """Produit chaque format demandé (self.targets) à partir du modèle parsé, en parallèle
+        
+        Le moteur interactif, qui porte l'état incrémental, le profilage et --jobs, tourne dans
+        ce processus ; chaque autre format a son propre processus et reçoit le modèle tel quel :
+        le XML n'est parsé qu'une fois, quel que soit le nombre de formats.
+        """
+        local = [target for target in self.targets if target[0] == 'interactive'] or self.targets[:1]
+        remote = [target for target in self.targets if target not in local]
+        if not remote:
+            for format_name, output_dir in local:
+                RENDER_BACKENDS[format_name](self, output_dir).render()
+            self.print_unresolved_crefs()
+            return
+        
+        model = self.model()
+        with ProcessPoolExecutor(max_workers=len(remote)) as pool:
+            futures = [pool.submit(_render_backend_worker, format_name, output_dir, model)
+                       for format_name, output_dir in remote]
+            for format_name, output_dir in local:
+                RENDER_BACKENDS[format_name](self, output_dir).render()
+            with self.phase('wait_backends'):
+                for future in futures:
+                    future.result()
+        self.print_unresolved_crefs()
+    
+    def generate_html(self):
+        """Génère les fichiers HTML
+        
+        En mode atomique, le site est construit dans un dossier voisin puis échangé avec le
+        dossier en ligne : un serveur ne voit jamais de pages à moitié écrites ni un mélange
+        d'ancien et de nouvel index de recherche.
+        """
+        if self.bundle_path:
+            with self.phase('bundle'):
+                self.generate_bundle()
+            self.print_summary(self.bundle_path)
+            return
+        
+        live_dir = self.output_dir
+        if self.atomic:
+            if self.previous_manifest is None:
+                self.load_manifest()
+            staging = self.staging_dir()
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+            self.output_dir = staging
+            self.link_from = live_dir
+        
+        try:
+            if self.archive_path:
+                self.open_archive()
+            self.build_output()
+        except BaseException:
+            if self.atomic:
+                shutil.rmtree(staging, ignore_errors=True)
+            raise
+        finally:
+            self.output_dir = live_dir
+            self.link_from = None
+            if self.archive:
+                self.close_archive()
+        
+        if self.atomic:
+            with self.phase('swap'):
+                self.swap_output(staging)
+        
+        self.print_summary(self.archive_path or f'{self.output_dir}/')
+    
+    def print_summary(self, target):
+        """Affiche la destination et les statistiques de la génération"""
+        print(f"\n✅ Documentation générée dans: {target}")
+        if self.incremental:
+            verb = 'lié(s) depuis la version en ligne' if self.atomic else 'non réécrit(s)'
+            print(f"♻️  {self.skipped_files} fichier(s) inchangé(s) {verb}")
+        if not (self.archive_path or self.bundle_path):
+            print(f"📄 Ouvrez: {self.output_dir}/index.html")
+        print(f"\n📊 Statistiques:")
+        print(f"   • {self.stats['total_classes']} classes")
+        print(f"   • {self.stats['total_methods']} méthodes")
+        print(f"   • {self.stats['total_properties']} propriétés")
+        print(f"   • {self.stats['total_fields']} champs")
+        print(f"   • {self.coverage_total().percent():.1f} % documenté")
+        if self.excluded:
+            print(f"   • {len(self.excluded)} classe(s) exclue(s) par les filtres "
+                  f"({self.stats['excluded_members']} élément(s) ignoré(s))")
+    
+    def build_output(self):
+        """Écrit le site dans self.output_dir (ou dans l'archive ouverte)"""
+        if not self.archive:
+            os.makedirs(self.output_dir, exist_ok=True)
+            if self.client_render:
+                os.makedirs(os.path.join(self.output_dir, CLASS_DATA_DIR), exist_ok=True)
+        
+        # Le manifeste n'est lu sur disque qu'une fois par processus (voir watch)
+        if self.incremental and self.previous_manifest is None:
+            self.load_manifest()
+        
+        # Générer le fichier JSON pour la recherche
+        with self.phase('generate_search_index'):
+            self.generate_search_index()
+        
+        # Générer l'index
+        with self.phase('generate_index'):
+            self.generate_index()
+        
+        # Générer la navigation, partagée par toutes les pages de classe
+        if not self.client_render:
+            with self.phase('generate_nav'):
+                self.generate_nav()
+        
+        # Générer une page par classe (seulement celles qui ont changé en mode incrémental)
+        with self.phase('class_pages'):
+            if self.incremental:
+                pending = []
+                for class_name, class_data in self.classes.items():
+                    page_hash = self.class_hash(class_data)
+                    self.manifest['pages'][class_name] = page_hash
+                    if self.is_unchanged('pages', class_name, page_hash,
+                                         self.page_filename(class_name)):
+                        continue
+                    pending.append((class_name, class_data))
+            else:
+                # Sans manifeste à enregistrer, les empreintes ne serviraient à rien
+                pending = list(self.classes.items())
+            if self.client_render:
+                self.generate_class_data(pending)
+            else:
+                self.generate_class_pages(pending)
+        
+        # Copier le CSS et JS
+        with self.phase('css_js'):
+            self.generate_css()
+            self.generate_js()
+        
+        if self.incremental:
+            with self.phase('manifest'):
+                self.remove_stale_pages()
+                self.save_manifest()
+            # En mode --watch, la prochaine génération compare à celle-ci (pages et fichiers produits)
+            self.previous_manifest = self.manifest
+            self.previous_files = self.manifest
+        
+        # Versions précompressées pour le serveur statique
+        if self.compress:
+            with self.phase('compress'):
+                self.compress_outputs()
+    
+    def open_archive(self):
+        """Ouvre l'archive de sortie (.zip, .tar.gz ou .tgz) : les fichiers y sont écrits au fil de l'eau"""
+        path = self.archive_path
+        if path.endswith('.zip'):
+            self.archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9)
+        elif path.endswith(('.tar.gz', '.tgz')):
+            # mtime=0 partout : archive reproductible d'une génération à l'autre
+            self.archive_stream = gzip.GzipFile(path, 'wb', compresslevel=9, mtime=0)
+            self.archive = tarfile.open(fileobj=self.archive_stream, mode='w',
+                                        format=tarfile.PAX_FORMAT)
+        else:
+            raise ValueError(f"Format d'archive non reconnu (.zip, .tar.gz, .tgz): {path}")
+    
+    def close_archive(self):
+        """Termine l'archive de sortie"""
+        self.archive.close()
+        if isinstance(self.archive, tarfile.TarFile):
+            self.archive_stream.close()
+        self.archive = None
+    
+    def archive_write(self, filename, data):
+        """Ajoute un fichier à l'archive, sous un dossier racine nommé comme le dossier de sortie"""
+        arcname = f'{os.path.basename(os.path.normpath(self.output_dir))}/{filename}'
+        if isinstance(self.archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self.archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(data)
+            info.mode = 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+    
+    def generate_bundle(self):
+        """Écrit un seul fichier HTML autonome
+        
+        La page d'index, le CSS et le script sont intégrés ; chaque page de classe est embarquée
+        sous forme de JSON compressé (deflate, base64) et rendue à la demande par script.js.
+        L'index de recherche est intégré tel quel : aucun fetch, le fichier s'ouvre en file://.
+        """
+        compact = {'ensure_ascii': False, 'separators': (',', ':')}
+        pages = {}
+        references = self.referenced_by()
+        for class_name, class_data in self.classes.items():
+            payload = class_data.payload(self.doc_html, references.get(class_name))
+            data = json.dumps(payload, **compact).encode('utf-8')
+            pages[f'{self.sanitize_filename(class_name)}.html'] = \
+                base64.b64encode(zlib.compress(data, 9)).decode('ascii')
+        
+        files = ','.join(f'{json.dumps(path)}:{text}' for path, text in self.search_files())
+        bundle = f'{{"pages":{json.dumps(pages, separators=(",", ":"))},"files":{{{files}}}}}'
+        # Un "</script>" dans les données fermerait la balise
+        bundle = bundle.replace('</', '<\\/')
+        
+        scripts = (f'    <script id="doc-bundle" type="application/json">{bundle}</script>\n'
+                   f'    <script>\n{self.js_source()}</script>\n')
+        html = self.render_index(stylesheet=f'<style>\n{self.css_source()}</style>',
+                                 footer=_page_footer(scripts))
+        with open(self.bundle_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(html)
+        if self.profiler:
+            self.profiler.record_file(self.bundle_path, os.path.getsize(self.bundle_path))
+    
+    def staging_dir(self):
+        """Dossier de préparation, voisin du dossier de sortie (même système de fichiers)"""
+        live_dir = os.path.normpath(self.output_dir)
+        parent, name = os.path.split(live_dir)
+        return os.path.join(parent, f'.{name}.staging')
+    
+    def swap_output(self, staging):
+        """Remplace le site en ligne par le dossier de préparation
+        
+        Sous Linux, les deux dossiers sont échangés en un seul appel (renameat2). Ailleurs,
+        deux renommages : le dossier est absent un instant, mais jamais incohérent.
+        """
+        live_dir = os.path.normpath(self.output_dir)
+        if os.path.isdir(live_dir) and not os.path.islink(live_dir) \
+                and _exchange_paths(staging, live_dir):
+            # staging contient maintenant l'ancienne version : ses fichiers orphelins partent avec
+            shutil.rmtree(staging)
+            return
+        
+        previous = f'{staging}.previous'
+        shutil.rmtree(previous, ignore_errors=True)
+        if os.path.exists(live_dir):
+            os.rename(live_dir, previous)
+        os.rename(staging, live_dir)
+        shutil.rmtree(previous, ignore_errors=True)
+    
+    def link_unchanged(self, filename):
+        """Lie (hardlink) un fichier inchangé et ses versions compressées depuis le site en ligne"""
+        suffixes = ('',) + (COMPRESSED_SUFFIXES if self.compress else ())
+        for name in (filename + suffix for suffix in suffixes):
+            source = os.path.join(self.link_from, name)
+            if not os.path.exists(source):
+                continue
+            target = os.path.join(self.output_dir, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                os.link(source, target)
+            except OSError:
+                # Système de fichiers sans liens physiques : copie
+                shutil.copy2(source, target)
+    
+    def load_manifest(self):
+        """Charge le manifeste de la génération précédente"""
+        self.previous_manifest = {'pages': {}, 'assets': {}}
+        self.previous_files = self.previous_manifest
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # Fichiers produits la dernière fois, connus même si le manifeste est invalidé
+        self.previous_files = {'pages': manifest.get('pages', {}), 'assets': manifest.get('assets', {})}
+        
+        # Un autre générateur (gabarits modifiés) invalide tout le manifeste
+        if manifest.get('generator') == _generator_fingerprint():
+            self.previous_manifest = manifest
+    
+    def save_manifest(self):
+        """Enregistre le manifeste : empreinte de chaque classe et de chaque fichier statique"""
+        self.manifest['generator'] = _generator_fingerprint()
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    
+    def class_hash(self, class_data):
+        """Empreinte des données d'une classe telles que rendues dans sa page"""
+        text = json.dumps(class_data.to_dict(), ensure_ascii=False, sort_keys=True)
+        # Les liens cref et la section « Référencé par » dépendent des autres classes
+        for doc in class_data.doc_texts():
+            if 'cref:' in doc:
+                text += ''.join(f'\n{cref} {self.cref_url(cref)}' for cref in _CREF_RE.findall(doc))
+        for label, url in self.referenced_by().get(class_data.full_name, ()):
+            text += f'\n<- {label} {url}'
+        return _hash_text(text)
+    
+    def cref_table(self):
+        """Table identifiant cref → URL, construite une fois par modèle
+        
+        Les clés ont la forme des identifiants XML (T:, M:, F:, P:) : chaque lien se résout par
+        une seule recherche dans un dict au lieu d'un parcours de self.classes. Les classes
+        exclues par les filtres y figurent avec une URL vide (voir cref_url).
+        """
+        if self._cref_urls is None:
+            # Une classe partielle exclue d'une assembly mais gardée dans une autre garde sa page
+            urls = {f'T:{class_name}': '' for class_name in self.excluded}
+            for class_name, class_data in self.classes.items():
+                page = f'{self.sanitize_filename(class_name)}.html'
+                urls[f'T:{class_name}'] = page
+                for method in class_data.methods:
+                    urls[f'M:{class_name}.{method.name}'] = f'{page}#{member_anchor(method.name)}'
+                for member in class_data.fields:
+                    urls[f'F:{class_name}.{member.name}'] = f'{page}#fields'
+                for member in class_data.properties:
+                    urls[f'P:{class_name}.{member.name}'] = f'{page}#properties'
+            self._cref_urls = urls
+        return self._cref_urls
+    
+    def referenced_by(self):
+        """Index inverse : classe → membres des autres classes qui la mentionnent
+        
+        Construit une fois par modèle, en un seul parcours des membres : les types de la liste
+        de paramètres (identifiants XML, y compris ~retour des opérateurs de conversion) et les
+        liens cref de la documentation sont cherchés par dict dans self.classes, sans comparer
+        les classes deux à deux. Valeurs : listes triées de (libellé, URL).
+        """
+        if self._referenced_by is not None:
+            return self._referenced_by
+        
+        classes = self.classes
+        # Types génériques : Jeu.Pile{System.Int32} dans une signature, Jeu.Pile`1 dans le modèle ;
+        # clé (nom, arité) : Pile`1 et Pile`2 coexistent
+        generics = {}
+        for name in classes:
+            base, tick, arity = name.rpartition('`')
+            if tick and arity.isdigit():
+                generics[(base, int(arity))] = name
+        index = defaultdict(dict)
+        
+        def mentions(docs, params=(), signature=''):
+            """Classes citées par une signature et des fragments de documentation"""
+            targets = set()
+            paren = signature.find('(')
+            if paren >= 0:
+                for m in _SIGNATURE_TYPE_RE.finditer(signature, paren):
+                    type_name = m.group()
+                    if signature.startswith('{', m.end()):
+                        type_name = generics.get(
+                            (type_name, _type_argument_count(signature, m.end())), type_name)
+                    if type_name in classes:
+                        targets.add(type_name)
+            for doc in itertools.chain(docs, (desc for _, desc in params)):
+                if 'cref:' not in doc:
+                    continue
+                for cref in _CREF_RE.findall(doc):
+                    parsed = parse_doc_id(unescape(cref))
+                    if parsed is not None and parsed[1] in classes:
+                        targets.add(parsed[1])
+            return targets
+        
+        def record(targets, class_name, label, url):
+            targets.discard(class_name)
+            for target in targets:
+                index[target].setdefault(url, label)
+        
+        for class_name, class_data in classes.items():
+            page = f'{self.sanitize_filename(class_name)}.html'
+            targets = mentions((class_data.summary, class_data.remarks, class_data.example))
+            if targets:
+                record(targets, class_name, class_data.name, page)
+            for method in class_data.methods:
+                targets = mentions((method.summary, method.returns, method.remarks), method.params,
+                                   method.name)
+                if targets:
+                    record(targets, class_name, f"{class_data.name}.{method.name.split('(', 1)[0]}",
+                           f'{page}#{member_anchor(method.name)}')
+            for section, members in (('fields', class_data.fields), ('properties', class_data.properties)):
+                for member in members:
+                    targets = mentions((member.summary,))
+                    if targets:
+                        record(targets, class_name, f'{class_data.name}.{member.name}',
+                               f'{page}#{section}')
+        
+        self._referenced_by = {target: sorted((label, url) for url, label in refs.items())
+                               for target, refs in index.items()}
+        return self._referenced_by
+    
+    def cref_url(self, cref):
+        """URL d'un lien cref : '' si la cible est exclue par les filtres, None si inconnue"""
+        table = self.cref_table()
+        url = table.get(cref)
+        if url is None and cref[:2] != 'T:':
+            # Membre d'une classe exclue : seules les classes exclues sont dans la table
+            parsed = parse_doc_id(cref)
+            if parsed and table.get(f'T:{parsed[1]}') == '':
+                return ''
+        return url
+    
+    def doc_html(self, markup):
+        """HTML final d'un fragment de documentation : liens cref résolus, ou laissés en texte"""
+        if 'cref:' not in markup:
+            return markup
+        
+        def resolve(match):
+            url = self.cref_url(match.group(1))
+            if url is None:
+                return f'<a class="cref-missing" title="{match.group(1)}">'
+            if not url:
+                # Cible exclue volontairement : texte simple, sans avertissement
+                return '<a class="cref-excluded">'
+            return f'<a href="{url}">'
+        return _CREF_RE.sub(resolve, markup)
+    
+    def unresolved_crefs(self):
+        """Liens cref sans cible dans le modèle (hors classes exclues) : Counter identifiant → occurrences"""
+        missing = Counter()
+        for class_data in self.classes.values():
+            for doc in class_data.doc_texts():
+                if 'cref:' in doc:
+                    missing.update(cref for cref in _CREF_RE.findall(doc)
+                                   if self.cref_url(cref) is None)
+        return missing
+    
+    def print_unresolved_crefs(self, limit=5):
+        """Signale les liens cref non résolus (types externes, membres non documentés…)"""
+        missing = self.unresolved_crefs()
+        if not missing:
+            return
+        examples = ', '.join(unescape(cref) for cref, _ in missing.most_common(limit))
+        print(f"\n🔗 {sum(missing.values())} lien(s) cref non résolu(s) vers {len(missing)} "
+              f"cible(s), rendus en texte: {examples}")
+    
+    def is_unchanged(self, section, key, digest, filename):
+        """Vrai si le fichier est à jour d'après le manifeste précédent"""
+        if not self.incremental or self.previous_manifest is None:
+            return False
+        if self.previous_manifest[section].get(key) != digest:
+            return False
+        if not os.path.exists(os.path.join(self.link_from or self.output_dir, filename)):
+            return False
+        if self.link_from:
+            self.link_unchanged(filename)
+        self.skipped_files += 1
+        self.unchanged_files.append(filename)
+        return True
+    
+    def remove_stale_pages(self):
+        """Supprime les pages des classes disparues et les fichiers statiques qui ne sont plus produits
+        
+        (fragments de recherche vides, anciennes versions des fichiers nommés par empreinte)
+        """
+        if self.link_from:
+            # Le dossier de préparation ne contient que les fichiers de cette génération
+            return
+        stale_files = [self.page_filename(class_name) for class_name in self.previous_files['pages']
+                       if class_name not in self.manifest['pages']]
+        stale_files += [filename for filename in self.previous_files['assets']
+                        if filename not in self.manifest['assets']]
+        for filename in stale_files:
+            path = os.path.join(self.output_dir, filename)
+            for stale in (path,) + tuple(path + suffix for suffix in COMPRESSED_SUFFIXES):
+                if os.path.exists(stale):
+                    os.remove(stale)
+    
+    def write_file(self, filename, content):
+        """Écrit un fichier de sortie"""
+        if self.archive:
+            data = content.encode('utf-8')
+            self.archive_write(filename, data)
+            if self.profiler:
+                self.profiler.record_file(filename, len(data))
+        elif self.profiler:
+            start = time.perf_counter()
+            data = content.encode('utf-8')
+            with open(os.path.join(self.output_dir, filename), 'wb') as f:
+                f.write(data)
+            self.profiler.record_file(filename, len(data), time.perf_counter() - start)
+        else:
+            # newline='' partout (pages en flux, archive, profil) : des fins de ligne \n sur
+            # toutes les plateformes, quels que soient la taille de la page, -j et --profile
+            with open(os.path.join(self.output_dir, filename), 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+        if not (self.compress or self.archive):
+            self.remove_compressed(filename)
+        self.written_files.append(filename)
+    
+    def remove_compressed(self, filename):
+        """Supprime les .gz/.br d'un fichier réécrit sans --compress
+        
+        Ils dateraient d'une génération précédente : un serveur gzip_static les servirait
+        à la place de la nouvelle version.
+        """
+        path = os.path.join(self.output_dir, filename)
+        for suffix in COMPRESSED_SUFFIXES:
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+    
+    def compress_file(self, filename):
+        """Écrit les versions .gz (et .br si disponible) d'un fichier de sortie"""
+        path = os.path.join(self.output_dir, filename)
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        ext = os.path.splitext(filename)[1] or filename
+        if len(data) < self.compress_min_size:
+            # Trop petit : supprimer d'éventuelles versions compressées périmées
+            for suffix in COMPRESSED_SUFFIXES:
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            return ext, len(data), None, None
+        
+        # mtime=0 : sortie reproductible d'une génération à l'autre
+        gz_data = gzip.compress(data, compresslevel=9, mtime=0)
+        with open(path + '.gz', 'wb') as f:
+            f.write(gz_data)
+        
+        br_size = None
+        if brotli is not None:
+            br_data = brotli.compress(data)
+            with open(path + '.br', 'wb') as f:
+                f.write(br_data)
+            br_size = len(br_data)
+        return ext, len(data), len(gz_data), br_size
+    
+    def compress_outputs(self):
+        """Précompresse les fichiers écrits pendant cette génération, sur un pool de threads"""
+        # En mode incrémental, un fichier inchangé garde sa version .gz, sauf s'il n'en a pas encore
+        filenames = self.written_files + [
+            filename for filename in self.unchanged_files
+            if not os.path.exists(os.path.join(self.output_dir, filename + '.gz'))
+        ]
+        with ThreadPoolExecutor() as pool:
+            results = list(pool.map(self.compress_file, filenames))
+        
+        # Taux de compression par type de fichier
+        by_type = defaultdict(lambda: [0, 0, 0, 0, 0])
+        for filename, (ext, raw_size, gz_size, br_size) in zip(filenames, results):
+            totals = by_type[ext]
+            if gz_size is None:
+                totals[4] += 1
+                continue
+            if self.profiler:
+                self.profiler.record_file(filename + '.gz', gz_size)
+                if br_size is not None:
+                    self.profiler.record_file(filename + '.br', br_size)
+            totals[0] += 1
+            totals[1] += raw_size
+            totals[2] += gz_size
+            totals[3] += br_size or 0
+        
+        print(f"\n🗜️  Précompression ({'gzip + brotli' if brotli else 'gzip'}, seuil {self.compress_min_size} o):")
+        for ext in sorted(by_type):
+            count, raw_size, gz_size, br_size, skipped = by_type[ext]
+            if not count:
+                print(f"   • {ext}: {skipped} fichier(s) sous le seuil")
+                continue
+            line = f"   • {ext}: {count} fichier(s), {raw_size} o → gz {gz_size} o ({gz_size / raw_size:.1%})"
+            if brotli is not None:
+                line += f", br {br_size} o ({br_size / raw_size:.1%})"
+            if skipped:
+                line += f", {skipped} sous le seuil"
+            print(line)
+    
+    def write_asset(self, filename, content):
+        """Écrit un fichier statique, sauf s'il est inchangé en mode incrémental"""
+        if not self.incremental:
+            self.write_file(filename, content)
+            return
+        digest = _hash_text(content)
+        self.manifest['assets'][filename] = digest
+        if self.is_unchanged('assets', filename, digest, filename):
+            return
+        self.write_file(filename, content)
+    
+    def render_coverage(self, w, worst):
+        """Tableau de bord de couverture de l'index : total, namespaces, classes les moins documentées"""
+        total = self.coverage_total()
+        percent = total.percent()
+        empty = total.types - total.documented_types + total.members - total.documented_members
+        # Le XML ne donne pas le type de retour : sans --source, seules les conversions comptent
+        returns_note = '' if self.source_dir else \
+            ' title="Type de retour connu en mode --source seulement (conversions dans le XML)"'
+        w(f"""            
+            <section class="coverage-dashboard">
+                <h2>📈 Couverture de la documentation</h2>
+                <div class="coverage-total">
+                    <div class="coverage-bar"><span style="width: {percent}%"></span></div>
+                    <p><strong>{percent:.1f} %</strong> documenté ({total.documented_types + total.documented_members} / {total.types + total.members} types et membres)</p>
+                </div>
+                <ul class="coverage-gaps">
+                    <li><strong>{empty}</strong> résumé(s) vide(s)</li>
+                    <li><strong>{total.missing_params}</strong> méthode(s) sans &lt;param&gt; pour chaque paramètre</li>
+                    <li{returns_note}><strong>{total.missing_returns}</strong> méthode(s) sans &lt;returns&gt;</li>
+                </ul>
+                <table class="coverage-table">
+                    <thead>
+                        <tr><th>Namespace</th><th>Couverture</th><th>Documentés</th><th>Résumés vides</th><th>&lt;param&gt;</th><th{returns_note}>&lt;returns&gt;</th></tr>
+                    </thead>
+                    <tbody>
+""")
+        # Les moins documentés d'abord
+        for namespace, totals in sorted(self.coverage.items(), key=lambda item: (item[1].percent(), item[0])):
+            w(self.coverage_row(escape(namespace) if namespace else 'Global', totals))
+        w("""                    </tbody>
+                </table>
+""")
+        if worst:
+            w("""                <h3>Classes les moins documentées</h3>
+                <table class="coverage-table">
+                    <thead>
+                        <tr><th>Classe</th><th>Couverture</th><th>Documentés</th><th>Résumés vides</th><th>&lt;param&gt;</th><th>&lt;returns&gt;</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for _, class_name in worst:
+                label = f'<a href="{self.sanitize_filename(class_name)}.html">{escape(class_name)}</a>'
+                w(self.coverage_row(label, self.classes[class_name].coverage))
+            w("""                    </tbody>
+                </table>
+""")
+        w("""            </section>
+""")
+    
+    @staticmethod
+    def coverage_row(label, coverage):
+        """Ligne d'un tableau de couverture (namespace ou classe)"""
+        percent = coverage.percent()
+        empty = coverage.types - coverage.documented_types + coverage.members - coverage.documented_members
+        return (f'                        <tr><td>{label}</td>'
+                f'<td><div class="coverage-bar"><span style="width: {percent}%"></span></div>{percent:.1f} %</td>'
+                f'<td>{coverage.documented_types + coverage.documented_members} / {coverage.types + coverage.members}</td>'
+                f'<td>{empty}</td><td>{coverage.missing_params}</td><td>{coverage.missing_returns}</td></tr>\n')
+    
+    def generate_search_index(self):
+        """Génère l'index de recherche : manifeste, fragments par initiale et blocs d'entrées"""
+        if not self.archive:
+            os.makedirs(os.path.join(self.output_dir, SEARCH_DIR), exist_ok=True)
+        for path, text in self.search_files():
+            self.write_asset(path, text)
+    
+    def search_files(self):
+        """Fichiers de l'index de recherche, en (chemin, JSON) ; le manifeste en dernier"""
+        # Entrée compacte : [nom, url, type ('c' classe, 'm' méthode)], et à part le nom
+        # normalisé, réduit au nom pour l'ASCII : le client le met en minuscules au chargement
+        entries = []
+        keys = []
+        name_postings = defaultdict(list)
+        summary_postings = defaultdict(list)
+        
+        def add_entry(name, url, kind, summary):
+            entry_id = len(entries)
+            entries.append([name, url, kind])
+            keys.append(name if name.isascii() else _fold(name))
+            for key in _search_keys(_name_tokens(name)):
+                name_postings[key].append(entry_id)
+            for key in _search_keys(_text_tokens(_plain_text(summary))):
+                summary_postings[key].append(entry_id)
+        
+        for class_name, class_data in self.classes.items():
+            safe_name = self.sanitize_filename(class_name)
+            add_entry(class_data.name, f'{safe_name}.html', 'c', class_data.summary)
+            
+            # Ajouter les méthodes
+            for method in class_data.methods:
+                add_entry(f"{class_data.name}.{method.name}",
+                          f'{safe_name}.html#{member_anchor(method.name)}', 'm', method.summary)
+        
+        # Fragments par initiale de clé ; listes d'identifiants encodées en écarts
+        shards = defaultdict(lambda: {'n': {}, 's': {}, 'e': {}})
+        for section, postings in (('n', name_postings), ('s', summary_postings)):
+            for key, ids in postings.items():
+                shards[key[0]][section][key] = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+        # Chaque fragment embarque le nom normalisé des entrées de ses clés de nom : de quoi classer les
+        # correspondances par nom (elles y sont toutes, quel que soit le terme de la requête
+        # dont on prend le fragment) ; url et type viennent des blocs, pour les seuls résultats
+        for key, ids in name_postings.items():
+            names = shards[key[0]]['e']
+            for entry_id in ids:
+                names[entry_id] = keys[entry_id]
+        
+        compact = {'ensure_ascii': False, 'separators': (',', ':')}
+        files = []
+        for initial in sorted(shards):
+            files.append((f'{SEARCH_DIR}/{initial}.json',
+                          json.dumps(shards[initial], sort_keys=True, **compact)))
+        # Blocs d'entrées : seuls ceux des résultats affichés sont chargés
+        blocks = []
+        for start in range(0, len(entries), SEARCH_ENTRY_BLOCK):
+            blocks.append(f'{SEARCH_DIR}/entries-{start // SEARCH_ENTRY_BLOCK}.json')
+            files.append((blocks[-1], json.dumps(entries[start:start + SEARCH_ENTRY_BLOCK], **compact)))
+        
+        # Manifeste : seul fichier lu avant de charger fragments et blocs
+        manifest = {
+            'p': SEARCH_MAX_PREFIX,
+            'b': SEARCH_ENTRY_BLOCK,
+            'e': blocks,
+            's': {initial: f'{SEARCH_DIR}/{initial}.json' for initial in sorted(shards)},
+        }
+        files.append(('search-index.json', json.dumps(manifest, **compact)))
+        return files
+    
+    def generate_index(self):
+        """Génère la page d'index"""
+        if not self.client_render:
+            self.write_asset('index.html', self.render_index())
+            return
+        
+        # Rendu côté client : l'accueil sert aussi de coquille pour les vues de classe
+        css_name = self.asset_name('style.css', self.css_source())
+        js_name = self.asset_name('script.js', self.js_source())
+        scripts = (f'    <script>window.DOC_CLASS_DATA = "{CLASS_DATA_DIR}/";</script>\n'
+                   f'    <script src="{js_name}"></script>\n')
+        html = self.render_index(stylesheet=f'<link rel="stylesheet" href="{css_name}">',
+                                 footer=_page_footer(scripts))
+        self.write_asset('index.html', html)
+    
+    def render_index(self, stylesheet=STYLESHEET_LINK, footer=INDEX_FOOTER):
+        """Rend la page d'index"""
+        out = [_page_header('Documentation - Audit Royal', INDEX_SUBTITLE, stylesheet)]
+        w = out.append
+        
+        w("""            <div class="nav-tabs">
+                <button class="nav-tab active" data-tab="classes">Classes</button>
+                <button class="nav-tab" data-tab="namespaces">Namespaces</button>
+            </div>
+            
+            <div id="classes-tab" class="tab-content active">
+                <ul class="class-list">
+""")
+        
+        # Classes les moins documentées, relevées pendant la liste (tableau de bord)
+        undocumented = []
+        for class_name in sorted(self.classes.keys()):
+            safe_name = self.sanitize_filename(class_name)
+            class_data = self.classes[class_name]
+            short_name = class_data.name
+            namespace = class_data.namespace
+            namespace_label = f'<span class="namespace-label">{escape(namespace)}</span>' if namespace else ''
+            w(f'                    <li><a href="{safe_name}.html">{escape(short_name)}</a>{namespace_label}</li>\n')
+            percent = class_data.coverage.percent()
+            if percent < 100:
+                undocumented.append((percent, class_name))
+        
+        w("""                </ul>
+            </div>
+            
+            <div id="namespaces-tab" class="tab-content">
+""")
+        
+        # Grouper par namespace
+        for namespace in sorted(self.namespaces.keys()):
+            w(f"""                <div class="namespace-group">
+                    <h3>{escape(namespace) if namespace else 'Global'}</h3>
+                    <ul class="class-list">
+""")
+            for class_name in sorted(self.namespaces[namespace]):
+                safe_name = self.sanitize_filename(class_name)
+                short_name = self.classes[class_name].name
+                w(f'                        <li><a href="{safe_name}.html">{escape(short_name)}</a></li>\n')
+            w("""                    </ul>
+                </div>
+""")
+        
+        w(f"""            </div>
+        </nav>
+        
+        <main class="main-content">
+            <div class="welcome-section">
+                <h2>Bienvenue dans la documentation</h2>
+                <p>Cette documentation contient toutes les classes, méthodes et propriétés du projet Audit Royal.</p>
+                <p>Utilisez la barre de recherche ou naviguez par classes/namespaces dans le menu.</p>
+            </div>
+            
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <div class="stat-icon">📦</div>
+                    <div class="stat-number">{self.stats['total_classes']}</div>
+                    <div class="stat-label">Classes</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-icon">⚡</div>
+                    <div class="stat-number">{self.stats['total_methods']}</div>
+                    <div class="stat-label">Méthodes</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-icon">🔧</div>
+                    <div class="stat-number">{self.stats['total_properties']}</div>
+                    <div class="stat-label">Propriétés</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-icon">📝</div>
+                    <div class="stat-number">{self.stats['total_fields']}</div>
+                    <div class="stat-label">Champs</div>
+                </div>
+            </div>
+""")
+        self.render_coverage(w, heapq.nsmallest(COVERAGE_WORST_CLASSES, undocumented))
+        w(footer)
+        
+        return ''.join(out)
+    
+    def generate_class_pages(self, items):
+        """Génère les pages de classe, en parallèle si plusieurs processus sont demandés"""
+        if self.jobs <= 1 or len(items) < 2:
+            for class_name, class_data in items:
+                self.generate_class_page(class_name, class_data)
+            return
+        
+        # Les processus rendent, le processus principal écrit (ordre conservé)
+        chunksize = max(1, len(items) // (self.jobs * 4))
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_render_worker,
+                                 initargs=(self.output_dir, self.cref_table(),
+                                           self.referenced_by())) as pool:
+            for filename, html, seconds in pool.map(_render_page_worker, items, chunksize=chunksize):
+                if self.profiler:
+                    self.profiler.record_page(filename, seconds)
+                self.write_file(filename, html)
+    
+    def generate_class_data(self, items):
+        """Écrit le JSON compact de chaque classe (mode --client-render)"""
+        compact = {'ensure_ascii': False, 'separators': (',', ':')}
+        references = self.referenced_by()
+        for class_name, class_data in items:
+            payload = class_data.payload(self.doc_html, references.get(class_name))
+            self.write_file(self.page_filename(class_name), json.dumps(payload, **compact))
+    
+    def page_filename(self, class_name):
+        """Fichier produit pour une classe : sa page HTML, ou son JSON en --client-render"""
+        if self.client_render:
+            return f'{CLASS_DATA_DIR}/{self.sanitize_filename(class_name)}.json'
+        return f'{self.sanitize_filename(class_name)}.html'
+    
+    def asset_name(self, filename, content):
+        """Nom publié d'un fichier statique
+        
+        En --client-render, l'empreinte du contenu fait partie du nom (style.<empreinte>.css) :
+        le CSS et le script peuvent être mis en cache sans limite de durée.
+        """
+        if not self.client_render:
+            return filename
+        stem, ext = os.path.splitext(filename)
+        return f'{stem}.{_hash_text(content)[:12]}{ext}'
+    
+    def generate_nav(self):
+        """Génère nav.js : la liste des classes, rendue une seule fois pour tout le site"""
+        items = ''.join(
+            f'<li><a href="{self.sanitize_filename(cn)}.html">{escape(self.classes[cn].name)}</a></li>'
+            for cn in sorted(self.classes.keys())
+        )
+        js = f"window.DOC_NAV = {json.dumps(items, ensure_ascii=False)};\n"
+        self.write_asset('nav.js', js)
+    
+    def generate_class_page(self, class_name, class_data):
+        """Génère la page d'une classe en écrivant ses fragments au fil du rendu
+        
+        La page complète n'existe jamais en mémoire : au plus PAGE_FLUSH_FRAGMENTS fragments
+        (quelques cartes de membre) sont gardés avant d'être écrits, quelle que soit la classe.
+        """
+        filename = f'{self.sanitize_filename(class_name)}.html'
+        start = time.perf_counter()
+        out = []
+        append = out.append
+        
+        members = len(class_data.methods) + len(class_data.fields) + len(class_data.properties)
+        if members * 4 < PAGE_FLUSH_FRAGMENTS or self.archive:
+            # Petite page (ou archive) : un seul write, sans le coût du découpage
+            self.write_class_page(append, class_data)
+            self.write_file(filename, ''.join(out))
+        else:
+            path = os.path.join(self.output_dir, filename)
+            with open(path, 'w', encoding='utf-8', newline='', buffering=PAGE_BUFFER_SIZE) as f:
+                # Fragments regroupés par paquets : un f.write par fragment coûte plus cher que join
+                def w(fragment):
+                    append(fragment)
+                    if len(out) >= PAGE_FLUSH_FRAGMENTS:
+                        f.write(''.join(out))
+                        out.clear()
+                
+                self.write_class_page(w, class_data)
+                f.write(''.join(out))
+            if not self.compress:
+                self.remove_compressed(filename)
+            self.written_files.append(filename)
+            if self.profiler:
+                self.profiler.record_file(filename, os.path.getsize(path))
+        
+        if self.profiler:
+            # Rendu et écriture sont entrelacés : la durée de la page inclut l'écriture
+            self.profiler.record_page(filename, time.perf_counter() - start)
+    
+    def render_class_page(self, class_name, class_data):
+        """Rend la page d'une classe en mémoire et renvoie (nom de fichier, HTML)"""
+        out = []
+        self.write_class_page(out.append, class_data)
+        return f'{self.sanitize_filename(class_name)}.html', ''.join(out)
+    
+    def write_class_page(self, w, class_data):
+        """Rend la page d'une classe fragment par fragment vers w (f.write ou list.append)"""
+        safe_name = self.sanitize_filename(class_data.full_name)
+        name = escape(class_data.name)
+        namespace = escape(class_data.namespace)
+        doc = self.doc_html
+        
+        w(_page_header(f'{name} - Documentation', CLASS_SUBTITLE))
+        
+        w(f"""            <ul class="class-list" id="class-nav" data-current="{escape(safe_name)}.html"></ul>
+        </nav>
+        
+        <main class="main-content">
+            <div class="class-header">
+                <div class="breadcrumb">
+                    <a href="index.html">Accueil</a>
+                    {f'<span>→</span><span>{namespace}</span>' if namespace else ''}
+                    <span>→</span><span class="current">{name}</span>
+                </div>
+                <h2 class="class-title">{name}</h2>
+                {f'<p class="namespace-info">Namespace: <code>{namespace}</code></p>' if namespace else ''}
+                <p class="namespace-info">Assembly: <code>{escape(', '.join(class_data.assemblies))}</code></p>
+                <p class="class-summary">{doc(class_data.summary)}</p>
+                {f'<div class="remarks"><h4>Remarques</h4><p>{doc(class_data.remarks)}</p></div>' if class_data.remarks else ''}
+                {f'<div class="example"><h4>Exemple</h4><pre><code>{doc(class_data.example)}</code></pre></div>' if class_data.example else ''}
+            </div>
+            
+            <div class="member-summary">
+                <h3>Résumé des membres</h3>
+                <div class="summary-badges">
+""")
+        
+        fields = class_data.fields
+        properties = class_data.properties
+        methods = class_data.methods
+        
+        if fields:
+            w(f'                    <a href="#fields" class="badge badge-field">{len(fields)} Champs</a>\n')
+        if properties:
+            w(f'                    <a href="#properties" class="badge badge-property">{len(properties)} Propriétés</a>\n')
+        if methods:
+            w(f'                    <a href="#methods" class="badge badge-method">{len(methods)} Méthodes</a>\n')
+        
+        w("""                </div>
+            </div>
+""")
+        
+        # Champs
+        if fields:
+            self.render_member_grid(w, 'fields', '🔹 Champs', fields)
+        
+        # Propriétés
+        if properties:
+            self.render_member_grid(w, 'properties', '🔸 Propriétés', properties)
+        
+        # Méthodes
+        if methods:
+            w("""
+            <section id="methods" class="member-section">
+                <h3>⚡ Méthodes</h3>
+""")
+            for method in methods:
+                method_id = member_anchor(method.name)
+                w(f"""
+                <div class="method-card" id="{method_id}">
+                    <div class="method-header">
+                        <h4><code>{escape(method.name)}</code></h4>
+                        <a href="#{method_id}" class="anchor-link">#</a>
+                    </div>
+                    <p class="method-summary">{doc(method.summary)}</p>
+""")
+                
+                if method.params:
+                    w("""
+                    <div class="params-section">
+                        <h5>Paramètres</h5>
+                        <table class="params-table">
+""")
+                    for param_name, param_desc in method.params:
+                        w(f"""                            <tr>
+                                <td><code>{escape(param_name)}</code></td>
+                                <td>{doc(param_desc)}</td>
+                            </tr>
+""")
+                    w("""                        </table>
+                    </div>
+""")
+                
+                if method.returns:
+                    w(f"""
+                    <div class="returns-section">
+                        <h5>Valeur de retour</h5>
+                        <p>{doc(method.returns)}</p>
+                    </div>
+""")
+                
+                if method.remarks:
+                    w(f"""
+                    <div class="remarks-section">
+                        <h5>Remarques</h5>
+                        <p>{doc(method.remarks)}</p>
+                    </div>
+""")
+                
+                w("""                </div>
+""")
+            w("""            </section>
+""")
+        
+        # Membres des autres classes qui mentionnent celle-ci
+        references = self.referenced_by().get(class_data.full_name)
+        if references:
+            w("""
+            <section id="referenced-by" class="member-section">
+                <h3>🔗 Référencé par</h3>
+                <ul class="referenced-by">
+""")
+            for label, url in references:
+                w(f'                    <li><a href="{url}"><code>{escape(label)}</code></a></li>\n')
+            w("""                </ul>
+            </section>
+""")
+        
+        w(CLASS_FOOTER)
+    
+    def render_member_grid(self, w, section_id, title, members):
+        """Rend une section de cartes (champs ou propriétés)"""
+        w(f"""
+            <section id="{section_id}" class="member-section">
+                <h3>{title}</h3>
+                <div class="member-grid">
+""")
+        for member in members:
+            w(f"""                    <div class="member-card">
+                        <h4><code>{escape(member.name)}</code></h4>
+                        <p>{self.doc_html(member.summary)}</p>
+                    </div>
+""")
+        w("""                </div>
+            </section>
+""")
+    
+    def generate_css(self):
+        """Génère le fichier CSS amélioré"""
+        css = self.css_source()
+        self.write_asset(self.asset_name('style.css', css), css)
+    
+    def css_source(self):
+        """Feuille de style du site"""
+        return """/* Variables CSS pour le thème */
+:root {
+    --bg-primary: #ffffff;
+    --bg-secondary: #f8f9fa;
+    --bg-card: #ffffff;
+    --text-primary: #2d3748;
+    --text-secondary: #718096;
     --border-color: #e2e8f0;
     --accent-primary: #667eea;
     --accent-secondary: #764ba2;
@@ -495,792 +2528,1902 @@ class DocGenerator:
     --shadow-lg: 0 10px 30px rgba(0,0,0,0.1);
 }
 
-[data-theme="dark"] {
-    --bg-primary: #1a202c;
-    --bg-secondary: #2d3748;
-    --bg-card: #2d3748;
-    --text-primary: #e2e8f0;
-    --text-secondary: #a0aec0;
-    --border-color: #4a5568;
-    --shadow: 0 1px 3px rgba(0,0,0,0.3);
-    --shadow-lg: 0 10px 30px rgba(0,0,0,0.3);
+[data-theme="dark"] {
+    --bg-primary: #1a202c;
+    --bg-secondary: #2d3748;
+    --bg-card: #2d3748;
+    --text-primary: #e2e8f0;
+    --text-secondary: #a0aec0;
+    --border-color: #4a5568;
+    --shadow: 0 1px 3px rgba(0,0,0,0.3);
+    --shadow-lg: 0 10px 30px rgba(0,0,0,0.3);
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    line-height: 1.6;
+    color: var(--text-primary);
+    background: var(--bg-secondary);
+    transition: background-color 0.3s ease, color 0.3s ease;
+}
+
+/* Header */
+header {
+    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
+    color: white;
+    padding: 1.5rem 2rem;
+    box-shadow: var(--shadow-lg);
+    position: sticky;
+    top: 0;
+    z-index: 100;
+}
+
+.header-content {
+    max-width: 1400px;
+    margin: 0 auto;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+header h1 {
+    font-size: 1.5rem;
+    font-weight: 600;
+}
+
+header p {
+    opacity: 0.9;
+    font-size: 0.9rem;
+    margin-top: 0.25rem;
+}
+
+.back-link {
+    color: white;
+    text-decoration: none;
+    border-bottom: 2px solid rgba(255,255,255,0.3);
+    transition: border-color 0.3s;
+    font-size: 0.9rem;
+}
+
+.back-link:hover {
+    border-bottom-color: white;
+}
+
+/* Theme Toggle */
+.theme-toggle {
+    background: rgba(255,255,255,0.2);
+    border: none;
+    color: white;
+    padding: 0.5rem 1rem;
+    border-radius: 8px;
+    cursor: pointer;
+    font-size: 1.2rem;
+    transition: all 0.3s;
+    backdrop-filter: blur(10px);
+}
+
+.theme-toggle:hover {
+    background: rgba(255,255,255,0.3);
+    transform: scale(1.05);
+}
+
+/* Container */
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    display: grid;
+    grid-template-columns: 300px 1fr;
+    gap: 2rem;
+    padding: 2rem;
+    min-height: calc(100vh - 200px);
+}
+
+/* Sidebar */
+.sidebar {
+    background: var(--bg-card);
+    padding: 1.5rem;
+    border-radius: 12px;
+    box-shadow: var(--shadow);
+    height: fit-content;
+    position: sticky;
+    top: 100px;
+    max-height: calc(100vh - 120px);
+    overflow-y: auto;
+}
+
+.sidebar h2 {
+    font-size: 1rem;
+    text-transform: uppercase;
+    color: var(--text-secondary);
+    margin: 1.5rem 0 1rem 0;
+    padding-bottom: 0.5rem;
+    border-bottom: 2px solid var(--accent-primary);
+}
+
+/* Search */
+.search-container {
+    position: relative;
+    margin-bottom: 1rem;
+}
+
+#search-input {
+    width: 100%;
+    padding: 0.75rem;
+    border: 2px solid var(--border-color);
+    border-radius: 8px;
+    font-size: 0.9rem;
+    background: var(--bg-secondary);
+    color: var(--text-primary);
+    transition: all 0.3s;
+}
+
+#search-input:focus {
+    outline: none;
+    border-color: var(--accent-primary);
+    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+}
+
+.search-results {
+    position: absolute;
+    top: 100%;
+    left: 0;
+    right: 0;
+    background: var(--bg-card);
+    border: 2px solid var(--border-color);
+    border-radius: 8px;
+    margin-top: 0.5rem;
+    max-height: 400px;
+    overflow-y: auto;
+    box-shadow: var(--shadow-lg);
+    display: none;
+    z-index: 50;
+}
+
+.search-results.active {
+    display: block;
+}
+
+.search-result-item {
+    padding: 0.75rem;
+    border-bottom: 1px solid var(--border-color);
+    cursor: pointer;
+    transition: background 0.2s;
+}
+
+.search-result-item:hover {
+    background: var(--bg-secondary);
+}
+
+.search-result-item:last-child {
+    border-bottom: none;
+}
+
+.search-result-name {
+    font-weight: 600;
+    color: var(--accent-primary);
+    margin-bottom: 0.25rem;
+}
+
+.search-result-type {
+    font-size: 0.75rem;
+    color: var(--text-secondary);
+    text-transform: uppercase;
+}
+
+/* Tabs */
+.nav-tabs {
+    display: flex;
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+}
+
+.nav-tab {
+    flex: 1;
+    padding: 0.5rem;
+    border: none;
+    background: var(--bg-secondary);
+    color: var(--text-secondary);
+    border-radius: 6px;
+    cursor: pointer;
+    font-size: 0.85rem;
+    font-weight: 500;
+    transition: all 0.3s;
+}
+
+.nav-tab.active {
+    background: var(--accent-primary);
+    color: white;
+}
+
+.tab-content {
+    display: none;
+}
+
+.tab-content.active {
+    display: block;
+}
+
+/* Class List */
+.class-list {
+    list-style: none;
+}
+
+.class-list li {
+    margin-bottom: 0.5rem;
+    position: relative;
+}
+
+.class-list li.active > a {
+    background: var(--accent-primary);
+    color: white;
+    font-weight: 600;
+}
+
+.class-list a {
+    display: block;
+    padding: 0.6rem;
+    color: var(--text-primary);
+    text-decoration: none;
+    border-radius: 6px;
+    transition: all 0.3s;
+    font-size: 0.9rem;
+}
+
+.class-list a:hover {
+    background: var(--bg-secondary);
+    transform: translateX(3px);
+}
+
+.namespace-label {
+    display: block;
+    font-size: 0.7rem;
+    color: var(--text-secondary);
+    margin-top: 0.25rem;
+    padding-left: 0.6rem;
+}
+
+.namespace-group {
+    margin-bottom: 1.5rem;
+}
+
+.namespace-group h3 {
+    font-size: 0.85rem;
+    color: var(--accent-secondary);
+    margin-bottom: 0.5rem;
+    font-weight: 600;
+}
+
+/* Main Content */
+.main-content {
+    background: var(--bg-card);
+    padding: 2rem;
+    border-radius: 12px;
+    box-shadow: var(--shadow);
+}
+
+.welcome-section {
+    margin-bottom: 3rem;
+}
+
+.welcome-section h2 {
+    color: var(--accent-primary);
+    font-size: 2rem;
+    margin-bottom: 1rem;
+}
+
+.welcome-section p {
+    color: var(--text-secondary);
+    font-size: 1.1rem;
+    margin-bottom: 0.5rem;
+}
+
+/* Stats Grid */
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1.5rem;
+    margin: 2rem 0;
+}
+
+.stat-card {
+    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 12px;
+    text-align: center;
+    box-shadow: var(--shadow-lg);
+    transition: transform 0.3s;
+}
+
+.stat-card:hover {
+    transform: translateY(-5px);
+}
+
+.stat-icon {
+    font-size: 2.5rem;
+    margin-bottom: 0.5rem;
+}
+
+.stat-number {
+    font-size: 2.5rem;
+    font-weight: bold;
+    margin: 0.5rem 0;
+}
+
+.stat-label {
+    font-size: 0.9rem;
+    opacity: 0.9;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+}
+
+/* Couverture de la documentation */
+.coverage-dashboard {
+    background: var(--bg-card);
+    padding: 2rem;
+    border-radius: 12px;
+    box-shadow: var(--shadow);
+    margin: 2rem 0;
+}
+
+.coverage-dashboard h2 {
+    margin-bottom: 1rem;
+}
+
+.coverage-dashboard h3 {
+    margin: 1.5rem 0 0.5rem;
+    color: var(--accent-secondary);
+}
+
+.coverage-total .coverage-bar {
+    height: 14px;
+    width: 100%;
+}
+
+.coverage-bar {
+    display: inline-block;
+    width: 80px;
+    height: 8px;
+    margin-right: 0.5rem;
+    background: var(--bg-secondary);
+    border-radius: 4px;
+    overflow: hidden;
+}
+
+.coverage-bar span {
+    display: block;
+    height: 100%;
+    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
+}
+
+.coverage-gaps {
+    list-style: none;
+    display: flex;
+    flex-wrap: wrap;
+    gap: 1.5rem;
+    margin: 1rem 0;
+    color: var(--text-secondary);
+}
+
+.coverage-table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 0.9rem;
+}
+
+.coverage-table th,
+.coverage-table td {
+    padding: 0.5rem;
+    text-align: left;
+    border-bottom: 1px solid var(--border-color);
+}
+
+.coverage-table th {
+    color: var(--text-secondary);
+    font-weight: 600;
+}
+
+/* Class Header */
+.breadcrumb {
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    font-size: 0.9rem;
+    color: var(--text-secondary);
+    margin-bottom: 1rem;
+}
+
+.breadcrumb a {
+    color: var(--accent-primary);
+    text-decoration: none;
+}
+
+.breadcrumb .current {
+    color: var(--text-primary);
+    font-weight: 600;
+}
+
+.class-header {
+    margin-bottom: 2rem;
+    padding-bottom: 2rem;
+    border-bottom: 3px solid var(--border-color);
+}
+
+.class-title {
+    color: var(--accent-primary);
+    font-size: 2.5rem;
+    margin-bottom: 0.5rem;
+}
+
+.namespace-info {
+    color: var(--text-secondary);
+    margin-bottom: 1rem;
+}
+
+.class-summary {
+    font-size: 1.1rem;
+    color: var(--text-secondary);
+    line-height: 1.8;
+}
+
+.remarks, .example {
+    margin-top: 1.5rem;
+    padding: 1rem;
+    background: var(--bg-secondary);
+    border-radius: 8px;
+    border-left: 4px solid var(--accent-primary);
 }
 
-* {
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
+.remarks h4, .example h4 {
+    color: var(--accent-secondary);
+    font-size: 0.9rem;
+    text-transform: uppercase;
+    margin-bottom: 0.5rem;
 }
 
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-    line-height: 1.6;
-    color: var(--text-primary);
-    background: var(--bg-secondary);
-    transition: background-color 0.3s ease, color 0.3s ease;
+/* Member Summary */
+.member-summary {
+    margin: 2rem 0;
 }
 
-/* Header */
-header {
-    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
-    color: white;
-    padding: 1.5rem 2rem;
-    box-shadow: var(--shadow-lg);
-    position: sticky;
-    top: 0;
-    z-index: 100;
+.member-summary h3 {
+    color: var(--text-primary);
+    margin-bottom: 1rem;
 }
 
-.header-content {
-    max-width: 1400px;
-    margin: 0 auto;
+.summary-badges {
     display: flex;
-    justify-content: space-between;
-    align-items: center;
+    gap: 1rem;
+    flex-wrap: wrap;
 }
 
-header h1 {
-    font-size: 1.5rem;
+.badge {
+    display: inline-block;
+    padding: 0.5rem 1rem;
+    border-radius: 20px;
+    font-size: 0.85rem;
     font-weight: 600;
+    text-decoration: none;
+    transition: transform 0.3s;
 }
 
-header p {
-    opacity: 0.9;
-    font-size: 0.9rem;
-    margin-top: 0.25rem;
+.badge:hover {
+    transform: scale(1.05);
 }
 
-.back-link {
+.badge-field {
+    background: #48bb78;
     color: white;
-    text-decoration: none;
-    border-bottom: 2px solid rgba(255,255,255,0.3);
-    transition: border-color 0.3s;
-    font-size: 0.9rem;
 }
 
-.back-link:hover {
-    border-bottom-color: white;
+.badge-property {
+    background: #4299e1;
+    color: white;
 }
 
-/* Theme Toggle */
-.theme-toggle {
-    background: rgba(255,255,255,0.2);
-    border: none;
+.badge-method {
+    background: #ed8936;
     color: white;
-    padding: 0.5rem 1rem;
+}
+
+/* Member Sections */
+.member-section {
+    margin: 3rem 0;
+}
+
+.member-section h3 {
+    color: var(--accent-secondary);
+    font-size: 1.8rem;
+    margin-bottom: 1.5rem;
+    padding-bottom: 0.5rem;
+    border-bottom: 2px solid var(--border-color);
+}
+
+.member-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 1rem;
+}
+
+.member-card {
+    padding: 1.5rem;
+    background: var(--bg-secondary);
     border-radius: 8px;
-    cursor: pointer;
-    font-size: 1.2rem;
+    border-left: 4px solid var(--accent-primary);
     transition: all 0.3s;
-    backdrop-filter: blur(10px);
 }
 
-.theme-toggle:hover {
-    background: rgba(255,255,255,0.3);
-    transform: scale(1.05);
+.member-card:hover {
+    box-shadow: var(--shadow-lg);
+    transform: translateY(-2px);
 }
 
-/* Container */
-.container {
-    max-width: 1400px;
-    margin: 0 auto;
-    display: grid;
-    grid-template-columns: 300px 1fr;
-    gap: 2rem;
-    padding: 2rem;
-    min-height: calc(100vh - 200px);
+.member-card h4 {
+    color: var(--accent-primary);
+    font-size: 1.1rem;
+    margin-bottom: 0.5rem;
 }
 
-/* Sidebar */
-.sidebar {
-    background: var(--bg-card);
+.member-card p {
+    color: var(--text-secondary);
+    font-size: 0.9rem;
+}
+
+/* Method Cards */
+.method-card {
+    background: var(--bg-secondary);
     padding: 1.5rem;
+    margin: 1.5rem 0;
     border-radius: 12px;
-    box-shadow: var(--shadow);
-    height: fit-content;
-    position: sticky;
-    top: 100px;
-    max-height: calc(100vh - 120px);
-    overflow-y: auto;
+    border-left: 4px solid var(--accent-primary);
+    transition: all 0.3s;
 }
 
-.sidebar h2 {
-    font-size: 1rem;
-    text-transform: uppercase;
+.method-card:hover {
+    box-shadow: var(--shadow-lg);
+}
+
+.method-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 0.75rem;
+}
+
+.method-header h4 {
+    color: var(--accent-primary);
+    font-size: 1.3rem;
+}
+
+.anchor-link {
     color: var(--text-secondary);
-    margin: 1.5rem 0 1rem 0;
-    padding-bottom: 0.5rem;
-    border-bottom: 2px solid var(--accent-primary);
+    text-decoration: none;
+    opacity: 0;
+    transition: opacity 0.3s;
 }
 
-/* Search */
-.search-container {
-    position: relative;
+.method-card:hover .anchor-link {
+    opacity: 1;
+}
+
+.method-summary {
+    color: var(--text-secondary);
     margin-bottom: 1rem;
 }
 
-#search-input {
-    width: 100%;
-    padding: 0.75rem;
-    border: 2px solid var(--border-color);
+.params-section, .returns-section, .remarks-section {
+    margin-top: 1rem;
+    padding: 1rem;
+    background: var(--bg-card);
     border-radius: 8px;
-    font-size: 0.9rem;
-    background: var(--bg-secondary);
-    color: var(--text-primary);
-    transition: all 0.3s;
 }
 
-#search-input:focus {
-    outline: none;
-    border-color: var(--accent-primary);
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+.params-section h5, .returns-section h5, .remarks-section h5 {
+    color: var(--accent-secondary);
+    font-size: 0.85rem;
+    text-transform: uppercase;
+    margin-bottom: 0.5rem;
+    letter-spacing: 0.5px;
 }
 
-.search-results {
-    position: absolute;
-    top: 100%;
-    left: 0;
-    right: 0;
-    background: var(--bg-card);
-    border: 2px solid var(--border-color);
+.params-table {
+    width: 100%;
+    border-collapse: collapse;
+}
+
+.params-table tr {
+    border-bottom: 1px solid var(--border-color);
+}
+
+.params-table td {
+    padding: 0.75rem 0.5rem;
+}
+
+.params-table td:first-child {
+    width: 30%;
+    font-weight: 600;
+}
+
+code {
+    background: var(--bg-secondary);
+    padding: 0.2rem 0.5rem;
+    border-radius: 4px;
+    font-family: 'Monaco', 'Menlo', 'Courier New', monospace;
+    font-size: 0.9em;
+    color: var(--accent-primary);
+}
+
+pre {
+    background: var(--bg-primary);
+    padding: 1rem;
     border-radius: 8px;
-    margin-top: 0.5rem;
-    max-height: 400px;
-    overflow-y: auto;
-    box-shadow: var(--shadow-lg);
-    display: none;
-    z-index: 50;
+    overflow-x: auto;
+    border: 1px solid var(--border-color);
 }
 
-.search-results.active {
+pre code {
+    background: none;
+    padding: 0;
+    color: var(--text-primary);
+}
+
+/* Contenu des commentaires XML : <para>, <code>, <list>, liens cref */
+.doc-para, .doc-code, .doc-list {
     display: block;
+    margin-top: 0.5rem;
 }
 
-.search-result-item {
+.doc-code {
+    white-space: pre;
+    overflow-x: auto;
     padding: 0.75rem;
-    border-bottom: 1px solid var(--border-color);
-    cursor: pointer;
-    transition: background 0.2s;
 }
 
-.search-result-item:hover {
-    background: var(--bg-secondary);
+pre .doc-code {
+    margin: 0;
+    padding: 0;
 }
 
-.search-result-item:last-child {
-    border-bottom: none;
+.doc-item {
+    display: list-item;
+    margin-left: 1.5rem;
 }
 
-.search-result-name {
+.doc-list-number .doc-item {
+    list-style-type: decimal;
+}
+
+.doc-list-header {
+    display: block;
     font-weight: 600;
-    color: var(--accent-primary);
-    margin-bottom: 0.25rem;
 }
 
-.search-result-type {
-    font-size: 0.75rem;
-    color: var(--text-secondary);
-    text-transform: uppercase;
+a.cref-missing {
+    cursor: help;
 }
 
-/* Tabs */
-.nav-tabs {
+a.cref-excluded {
+    color: inherit;
+}
+
+/* Référencé par */
+.referenced-by {
+    list-style: none;
     display: flex;
+    flex-wrap: wrap;
     gap: 0.5rem;
-    margin-bottom: 1rem;
 }
 
-.nav-tab {
-    flex: 1;
-    padding: 0.5rem;
-    border: none;
-    background: var(--bg-secondary);
+.referenced-by a {
+    text-decoration: none;
+}
+
+/* Footer */
+footer {
+    background: var(--bg-card);
     color: var(--text-secondary);
-    border-radius: 6px;
-    cursor: pointer;
-    font-size: 0.85rem;
-    font-weight: 500;
-    transition: all 0.3s;
+    text-align: center;
+    padding: 2rem;
+    margin-top: 3rem;
+    font-size: 0.9rem;
 }
 
-.nav-tab.active {
-    background: var(--accent-primary);
-    color: white;
+/* Scrollbar */
+::-webkit-scrollbar {
+    width: 10px;
+    height: 10px;
 }
 
-.tab-content {
-    display: none;
+::-webkit-scrollbar-track {
+    background: var(--bg-secondary);
 }
 
-.tab-content.active {
-    display: block;
+::-webkit-scrollbar-thumb {
+    background: var(--border-color);
+    border-radius: 5px;
 }
 
-/* Class List */
-.class-list {
-    list-style: none;
+::-webkit-scrollbar-thumb:hover {
+    background: var(--text-secondary);
 }
 
-.class-list li {
-    margin-bottom: 0.5rem;
-    position: relative;
+/* Responsive */
+@media (max-width: 1024px) {
+    .container {
+        grid-template-columns: 1fr;
+    }
+    
+    .sidebar {
+        position: static;
+        max-height: none;
+    }
+    
+    .stats-grid {
+        grid-template-columns: repeat(2, 1fr);
+    }
 }
 
-.class-list li.active > a {
-    background: var(--accent-primary);
-    color: white;
-    font-weight: 600;
+@media (max-width: 640px) {
+    .header-content {
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 1rem;
+    }
+    
+    .stats-grid {
+        grid-template-columns: 1fr;
+    }
+    
+    .member-grid {
+        grid-template-columns: 1fr;
+    }
 }
+"""
+    
+    def generate_js(self):
+        """Génère le fichier JavaScript"""
+        js = self.js_source()
+        self.write_asset(self.asset_name('script.js', js), js)
+    
+    def js_source(self):
+        """Script du site (thème, navigation, recherche, vue de classe des modes sans pages)"""
+        return """// Thème
+const themeToggle = document.getElementById('theme-toggle');
+const html = document.documentElement;
 
-.class-list a {
-    display: block;
-    padding: 0.6rem;
-    color: var(--text-primary);
-    text-decoration: none;
-    border-radius: 6px;
-    transition: all 0.3s;
-    font-size: 0.9rem;
+// Charger le thème sauvegardé
+const savedTheme = localStorage.getItem('theme') || 'light';
+html.setAttribute('data-theme', savedTheme);
+updateThemeIcon(savedTheme);
+
+themeToggle?.addEventListener('click', () => {
+    const currentTheme = html.getAttribute('data-theme');
+    const newTheme = currentTheme === 'light' ? 'dark' : 'light';
+    html.setAttribute('data-theme', newTheme);
+    localStorage.setItem('theme', newTheme);
+    updateThemeIcon(newTheme);
+});
+
+function updateThemeIcon(theme) {
+    const icon = document.querySelector('.theme-icon');
+    if (icon) {
+        icon.textContent = theme === 'light' ? '🌙' : '☀️';
+    }
 }
 
-.class-list a:hover {
-    background: var(--bg-secondary);
-    transform: translateX(3px);
+// Fichier unique (--bundle) : pages de classe et index de recherche embarqués dans la page
+const bundleData = document.getElementById('doc-bundle');
+const docBundle = bundleData ? JSON.parse(bundleData.textContent) : null;
+// Rendu côté client (--client-render) : une page d'accueil, un JSON par classe dans ce dossier
+const docClassData = window.DOC_CLASS_DATA || null;
+// Dans ces deux modes, les pages de classe sont des routes #Page.html/ancre de la page d'accueil
+const hashRouting = Boolean(docBundle || docClassData);
+
+// Navigation partagée (nav.js), injectée une seule fois par page
+const classNav = document.getElementById('class-nav');
+if (classNav && window.DOC_NAV) {
+    classNav.innerHTML = window.DOC_NAV;
+    const current = classNav.dataset.current;
+    classNav.querySelectorAll('a').forEach(link => {
+        if (link.getAttribute('href') === current) {
+            link.parentElement.classList.add('active');
+        }
+    });
 }
 
-.namespace-label {
-    display: block;
-    font-size: 0.7rem;
-    color: var(--text-secondary);
-    margin-top: 0.25rem;
-    padding-left: 0.6rem;
+// Recherche : manifeste et fragments chargés à la première saisie puis gardés en cache ;
+// les fragments donnent le nom normalisé des entrées (classement), les blocs d'entrées
+// [nom, url, type] ne sont chargés que pour les résultats affichés
+let searchManifest = null;
+const searchKeys = {};
+const searchRows = {};
+const searchShards = {};
+const searchFetches = {};
+
+function fetchJson(url) {
+    if (!(url in searchFetches)) {
+        searchFetches[url] = docBundle && url in docBundle.files
+            ? Promise.resolve(docBundle.files[url])
+            : fetch(url).then(res => res.json());
+    }
+    return searchFetches[url];
 }
 
-.namespace-group {
-    margin-bottom: 1.5rem;
+// Décode les listes d'identifiants (écarts → valeurs absolues)
+function decodeShard(shard) {
+    for (const section of [shard.n, shard.s]) {
+        for (const key in section) {
+            let acc = 0;
+            section[key] = section[key].map(gap => acc += gap);
+        }
+    }
+    return shard;
 }
 
-.namespace-group h3 {
-    font-size: 0.85rem;
-    color: var(--accent-secondary);
-    margin-bottom: 0.5rem;
-    font-weight: 600;
+async function loadSearchData(terms) {
+    searchManifest = await fetchJson('search-index.json');
+    const pending = [];
+    for (const initial of new Set(terms.map(t => t[0]))) {
+        const url = searchManifest.s[initial];
+        if (url && !(initial in searchShards)) {
+            pending.push(fetchJson(url).then(data => {
+                if (initial in searchShards) return;
+                for (const id in data.e) searchKeys[id] = data.e[id].toLowerCase();
+                searchShards[initial] = decodeShard(data);
+            }));
+        }
+    }
+    await Promise.all(pending);
 }
 
-/* Main Content */
-.main-content {
-    background: var(--bg-card);
-    padding: 2rem;
-    border-radius: 12px;
-    box-shadow: var(--shadow);
+// Blocs des entrées encore inconnues parmi ces identifiants
+async function loadRows(ids) {
+    const size = searchManifest.b;
+    const blocks = new Set(ids.filter(id => !(id in searchRows)).map(id => Math.floor(id / size)));
+    await Promise.all([...blocks].map(block => fetchJson(searchManifest.e[block]).then(data => {
+        data.forEach((entry, i) => { searchRows[block * size + i] = entry; });
+    })));
 }
 
-.welcome-section {
-    margin-bottom: 3rem;
+const searchInput = document.getElementById('search-input');
+const searchResults = document.getElementById('search-results');
+
+// Même normalisation que le générateur : sans accents, en minuscules
+function foldText(text) {
+    return text.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
 }
 
-.welcome-section h2 {
-    color: var(--accent-primary);
-    font-size: 2rem;
-    margin-bottom: 1rem;
+function queryTerms(query) {
+    return foldText(query).match(/[a-z0-9]+/g)?.filter(t => t.length >= 2) || [];
 }
 
-.welcome-section p {
-    color: var(--text-secondary);
-    font-size: 1.1rem;
-    margin-bottom: 0.5rem;
+function postings(section, key) {
+    const shard = searchShards[key[0]];
+    return (shard && shard[section][key]) || [];
 }
 
-/* Stats Grid */
-.stats-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-    gap: 1.5rem;
-    margin: 2rem 0;
+function postingKey(term) {
+    const shard = searchShards[term[0]];
+    return term.length > searchManifest.p && !(shard && (term in shard.n || term in shard.s))
+        ? term.slice(0, searchManifest.p)
+        : term;
 }
 
-.stat-card {
-    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
-    color: white;
-    padding: 2rem;
-    border-radius: 12px;
-    text-align: center;
-    box-shadow: var(--shadow-lg);
-    transition: transform 0.3s;
+function entryAt(id) {
+    const [name, url, type] = searchRows[id];
+    return { name, url, type: type === 'c' ? 'class' : 'method' };
 }
 
-.stat-card:hover {
-    transform: translateY(-5px);
+// Union et intersection de listes d'identifiants triées
+function unionSorted(a, b) {
+    if (a.length === 0) return b;
+    if (b.length === 0) return a;
+    const out = [];
+    let i = 0, j = 0;
+    while (i < a.length || j < b.length) {
+        if (j >= b.length || (i < a.length && a[i] < b[j])) out.push(a[i++]);
+        else if (i >= a.length || b[j] < a[i]) out.push(b[j++]);
+        else { out.push(a[i++]); j++; }
+    }
+    return out;
+}
+
+function intersectSorted(a, b) {
+    const out = [];
+    let i = 0, j = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] < b[j]) i++;
+        else if (b[j] < a[i]) j++;
+        else { out.push(a[i++]); j++; }
+    }
+    return out;
+}
+
+// Identifiants des meilleurs résultats ; les entrées à afficher se chargent ensuite (loadRows)
+function searchEntries(terms, limit = 10) {
+    if (!searchManifest || terms.length === 0) return [];
+    
+    const folded = terms.join(' ');
+    const keys = terms.map(postingKey);
+    
+    // 1) Entrées dont le nom contient tous les termes : nom exact > préfixe > mot du nom
+    let nameCandidates = null;
+    for (const key of keys) {
+        const ids = postings('n', key);
+        nameCandidates = nameCandidates === null ? ids : intersectSorted(nameCandidates, ids);
+    }
+    const best = [];
+    for (const id of nameCandidates) {
+        const key = searchKeys[id];
+        const rank = key === folded ? 0 : key.startsWith(folded) ? 1 : 2;
+        const score = rank * 1e6 + key.length;
+        if (best.length === limit && score >= best[limit - 1][0]) continue;
+        let pos = best.length;
+        while (pos > 0 && best[pos - 1][0] > score) pos--;
+        best.splice(pos, 0, [score, id]);
+        if (best.length > limit) best.pop();
+    }
+    const results = best.map(r => r[1]);
+    if (results.length === limit) return results;
+    
+    // 2) Compléter avec les correspondances dans les résumés, dans l'ordre de l'index
+    let candidates;
+    if (keys.length === 1) {
+        candidates = postings('s', keys[0]);
+    } else {
+        candidates = null;
+        for (const key of keys) {
+            const ids = unionSorted(postings('n', key), postings('s', key));
+            candidates = candidates === null ? ids : intersectSorted(candidates, ids);
+            if (candidates.length === 0) break;
+        }
+    }
+    const nameHits = new Set(nameCandidates);
+    for (const id of candidates) {
+        if (nameHits.has(id)) continue;
+        results.push(id);
+        if (results.length === limit) break;
+    }
+    return results;
 }
 
-.stat-icon {
-    font-size: 2.5rem;
-    margin-bottom: 0.5rem;
-}
+let searchSeq = 0;
+searchInput?.addEventListener('input', async (e) => {
+    const query = e.target.value.trim();
+    
+    if (query.length < 2) {
+        searchResults.classList.remove('active');
+        return;
+    }
+    
+    const terms = queryTerms(query);
+    const seq = ++searchSeq;
+    let results;
+    try {
+        await loadSearchData(terms);
+        const ids = searchEntries(terms);
+        await loadRows(ids);
+        results = ids.map(entryAt);
+    } catch (err) {
+        console.error('Erreur chargement index:', err);
+        return;
+    }
+    // Une saisie plus récente a pris le relais pendant le chargement
+    if (seq !== searchSeq) return;
+    
+    if (results.length > 0) {
+        searchResults.innerHTML = results.map(item => `
+            <div class="search-result-item" onclick="window.location.href='${pageHref(item.url)}'">
+                <div class="search-result-name">${escapeHtml(item.name)}</div>
+                <div class="search-result-type">${item.type}</div>
+            </div>
+        `).join('');
+        searchResults.classList.add('active');
+    } else {
+        searchResults.innerHTML = '<div class="search-result-item">Aucun résultat</div>';
+        searchResults.classList.add('active');
+    }
+});
+
+// Fermer les résultats en cliquant ailleurs
+document.addEventListener('click', (e) => {
+    if (!searchInput?.contains(e.target) && !searchResults?.contains(e.target)) {
+        searchResults?.classList.remove('active');
+    }
+});
+
+// Navigation par onglets
+const navTabs = document.querySelectorAll('.nav-tab');
+navTabs.forEach(tab => {
+    tab.addEventListener('click', () => {
+        const targetTab = tab.getAttribute('data-tab');
+        
+        // Retirer active de tous
+        navTabs.forEach(t => t.classList.remove('active'));
+        document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+        
+        // Activer le bon
+        tab.classList.add('active');
+        document.getElementById(`${targetTab}-tab`)?.classList.add('active');
+    });
+});
+
+// Liens : pages embarquées (mode --bundle) et smooth scroll pour les ancres,
+// y compris dans les vues de classe rendues après le chargement
+document.addEventListener('click', (e) => {
+    const anchor = e.target.closest('a[href]');
+    if (!anchor) return;
+    const href = anchor.getAttribute('href');
+    
+    if (hashRouting && (isPage(href.split('#')[0]) || href === 'index.html')) {
+        e.preventDefault();
+        location.hash = href === 'index.html' ? '' : pageHref(href).slice(1);
+        return;
+    }
+    if (href.startsWith('#')) {
+        const target = href.length > 1 && document.getElementById(decodeURIComponent(href.slice(1)));
+        if (target || !hashRouting) e.preventDefault();
+        if (target) target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+    }
+});
 
-.stat-number {
-    font-size: 2.5rem;
-    font-weight: bold;
-    margin: 0.5rem 0;
-}
+// Même échappement que html.escape côté générateur
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' };
 
-.stat-label {
-    font-size: 0.9rem;
-    opacity: 0.9;
-    text-transform: uppercase;
-    letter-spacing: 1px;
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
 }
 
-/* Class Header */
-.breadcrumb {
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-    font-size: 0.9rem;
-    color: var(--text-secondary);
-    margin-bottom: 1rem;
+// Adresse d'une page : route #page/ancre en mode --bundle/--client-render, URL relative sinon
+function pageHref(url) {
+    return hashRouting ? '#' + url.replace('#', '/') : url;
 }
 
-.breadcrumb a {
-    color: var(--accent-primary);
-    text-decoration: none;
+function isPage(href) {
+    if (docBundle) return href in docBundle.pages;
+    return /^[^/#?]+\\.html$/.test(href) && href !== 'index.html';
 }
 
-.breadcrumb .current {
-    color: var(--text-primary);
-    font-weight: 600;
-}
+// Vue de classe rendue côté client à partir des données compactes (ClassDoc.payload),
+// avec le même balisage que les pages générées ; les textes de documentation y sont déjà en HTML
+// Même codage que member_anchor côté Python : les liens cref et la recherche visent ces ancres
+const ANCHOR_CODES = {',': '-0-', '[': '-1-', ']': '-2-', '@': '-3-', '*': '-4-',
+                      '{': '-5-', '}': '-6-', '`': '-7-', '~': '-8-', ':': '-9-'};
 
-.class-header {
-    margin-bottom: 2rem;
-    padding-bottom: 2rem;
-    border-bottom: 3px solid var(--border-color);
+function memberAnchor(name) {
+    return name.replace(/[,\\[\\]@*{}`~:]/g, c => ANCHOR_CODES[c])
+        .replace(/[^A-Za-z0-9_]+/g, '-').replace(/^-+|-+$/g, '');
 }
 
-.class-title {
-    color: var(--accent-primary);
-    font-size: 2.5rem;
-    margin-bottom: 0.5rem;
+function renderMemberGrid(id, title, members) {
+    return `
+            <section id="${id}" class="member-section">
+                <h3>${title}</h3>
+                <div class="member-grid">
+${members.map(([name, summary]) => `                    <div class="member-card">
+                        <h4><code>${escapeHtml(name)}</code></h4>
+                        <p>${summary}</p>
+                    </div>
+`).join('')}                </div>
+            </section>
+`;
 }
 
-.namespace-info {
-    color: var(--text-secondary);
-    margin-bottom: 1rem;
+function renderMethod([name, summary, params, returns, remarks]) {
+    const id = memberAnchor(name);
+    let out = `
+                <div class="method-card" id="${id}">
+                    <div class="method-header">
+                        <h4><code>${escapeHtml(name)}</code></h4>
+                        <a href="#${id}" class="anchor-link">#</a>
+                    </div>
+                    <p class="method-summary">${summary}</p>
+`;
+    if (params.length) {
+        out += `
+                    <div class="params-section">
+                        <h5>Paramètres</h5>
+                        <table class="params-table">
+${params.map(([pname, desc]) => `                            <tr>
+                                <td><code>${escapeHtml(pname)}</code></td>
+                                <td>${desc}</td>
+                            </tr>
+`).join('')}                        </table>
+                    </div>
+`;
+    }
+    if (returns) {
+        out += `
+                    <div class="returns-section">
+                        <h5>Valeur de retour</h5>
+                        <p>${returns}</p>
+                    </div>
+`;
+    }
+    if (remarks) {
+        out += `
+                    <div class="remarks-section">
+                        <h5>Remarques</h5>
+                        <p>${remarks}</p>
+                    </div>
+`;
+    }
+    return out + `                </div>
+`;
 }
 
-.class-summary {
-    font-size: 1.1rem;
-    color: var(--text-secondary);
-    line-height: 1.8;
+function renderClassView(c) {
+    const name = escapeHtml(c.n);
+    const ns = c.ns ? escapeHtml(c.ns) : '';
+    const fields = c.F || [], properties = c.P || [], methods = c.M || [];
+    let out = `
+            <div class="class-header">
+                <div class="breadcrumb">
+                    <a href="index.html">Accueil</a>
+                    ${ns ? `<span>→</span><span>${ns}</span>` : ''}
+                    <span>→</span><span class="current">${name}</span>
+                </div>
+                <h2 class="class-title">${name}</h2>
+                ${ns ? `<p class="namespace-info">Namespace: <code>${ns}</code></p>` : ''}
+                <p class="namespace-info">Assembly: <code>${escapeHtml(c.a.join(', '))}</code></p>
+                <p class="class-summary">${c.s || ''}</p>
+                ${c.r ? `<div class="remarks"><h4>Remarques</h4><p>${c.r}</p></div>` : ''}
+                ${c.x ? `<div class="example"><h4>Exemple</h4><pre><code>${c.x}</code></pre></div>` : ''}
+            </div>
+            
+            <div class="member-summary">
+                <h3>Résumé des membres</h3>
+                <div class="summary-badges">
+`;
+    if (fields.length) out += `                    <a href="#fields" class="badge badge-field">${fields.length} Champs</a>\n`;
+    if (properties.length) out += `                    <a href="#properties" class="badge badge-property">${properties.length} Propriétés</a>\n`;
+    if (methods.length) out += `                    <a href="#methods" class="badge badge-method">${methods.length} Méthodes</a>\n`;
+    out += `                </div>
+            </div>
+`;
+    if (fields.length) out += renderMemberGrid('fields', '🔹 Champs', fields);
+    if (properties.length) out += renderMemberGrid('properties', '🔸 Propriétés', properties);
+    if (methods.length) {
+        out += `
+            <section id="methods" class="member-section">
+                <h3>⚡ Méthodes</h3>
+${methods.map(renderMethod).join('')}            </section>
+`;
+    }
+    if (c.R) {
+        out += `
+            <section id="referenced-by" class="member-section">
+                <h3>🔗 Référencé par</h3>
+                <ul class="referenced-by">
+${c.R.map(([label, url]) => `                    <li><a href="${url}"><code>${escapeHtml(label)}</code></a></li>
+`).join('')}                </ul>
+            </section>
+`;
+    }
+    return out;
 }
 
-.remarks, .example {
-    margin-top: 1.5rem;
-    padding: 1rem;
-    background: var(--bg-secondary);
-    border-radius: 8px;
-    border-left: 4px solid var(--accent-primary);
+// Fichier unique : chaque page de classe est du JSON compressé (deflate, base64), décodé à la demande
+async function inflatePage(encoded) {
+    const bytes = Uint8Array.from(atob(encoded), ch => ch.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+    return JSON.parse(await new Response(stream).text());
 }
 
-.remarks h4, .example h4 {
-    color: var(--accent-secondary);
-    font-size: 0.9rem;
-    text-transform: uppercase;
-    margin-bottom: 0.5rem;
-}
+const mainContent = document.querySelector('.main-content');
+const homeView = mainContent?.innerHTML;
+const homeTitle = document.title;
 
-/* Member Summary */
-.member-summary {
-    margin: 2rem 0;
+// Données d'une classe : embarquées (--bundle) ou JSON gardé en cache après le premier chargement
+function loadPage(page) {
+    if (docBundle) return inflatePage(docBundle.pages[page]);
+    return fetchJson(`${docClassData}${encodeURIComponent(page.slice(0, -5))}.json`);
 }
 
-.member-summary h3 {
-    color: var(--text-primary);
-    margin-bottom: 1rem;
+function showHome() {
+    mainContent.innerHTML = homeView;
+    document.title = homeTitle;
 }
 
-.summary-badges {
-    display: flex;
-    gap: 1rem;
-    flex-wrap: wrap;
+let routeSeq = 0;
+async function showRoute() {
+    const seq = ++routeSeq;
+    const [page, anchor] = decodeURIComponent(location.hash.slice(1)).split('/');
+    if (!isPage(page)) {
+        // Ancre de la vue courante (#methods...) : rien à rendre
+        if (page && document.getElementById(page)) return;
+        showHome();
+        return;
+    }
+    let data;
+    try {
+        data = await loadPage(page);
+    } catch (err) {
+        console.error('Erreur chargement classe:', err);
+        showHome();
+        return;
+    }
+    // Une navigation plus récente a pris le relais pendant le chargement
+    if (seq !== routeSeq) return;
+    mainContent.innerHTML = renderClassView(data);
+    document.title = `${data.n} - Documentation`;
+    document.querySelectorAll('.class-list li').forEach(li => {
+        li.classList.toggle('active', li.firstElementChild?.getAttribute('href') === page);
+    });
+    const target = anchor && document.getElementById(anchor);
+    if (target) target.scrollIntoView({ block: 'start' });
+    else window.scrollTo(0, 0);
 }
 
-.badge {
-    display: inline-block;
-    padding: 0.5rem 1rem;
-    border-radius: 20px;
-    font-size: 0.85rem;
-    font-weight: 600;
-    text-decoration: none;
-    transition: transform 0.3s;
+if (hashRouting && mainContent) {
+    window.addEventListener('hashchange', showRoute);
+    showRoute();
 }
+"""
+    
+    def sanitize_filename(self, name):
+        """Nettoie un nom pour en faire un nom de fichier valide"""
+        name = re.sub(r'[<>:"/\\|?*]', '_', name)
+        return name
 
-.badge:hover {
-    transform: scale(1.05);
-}
+@register_backend('interactive')
+class InteractiveBackend:
+    """Site interactif : recherche, namespaces, thème clair/sombre (rendu par DocGenerator)
+    
+    Porte les options --incremental, --atomic, --archive, --bundle, --client-render et --compress.
+    """
+    def __init__(self, generator, output_dir):
+        self.generator = generator
+        self.output_dir = output_dir
+    
+    def render(self):
+        """Génère le site"""
+        self.generator.output_dir = self.output_dir
+        self.generator.generate_html()
 
-.badge-field {
-    background: #48bb78;
-    color: white;
+@register_backend('javadoc')
+class JavadocBackend:
+    """Site statique style Javadoc (ancien doc_generator2.py) : liste des classes, tableaux de membres"""
+    def __init__(self, generator, output_dir):
+        self.generator = generator
+        self.output_dir = output_dir
+        self.classes = generator.classes
+        self.sanitize_filename = generator.sanitize_filename
+        self.doc_html = generator.doc_html
+        self._class_list = None
+    
+    def render(self):
+        """Génère les fichiers HTML"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Générer l'index
+        self.generate_index()
+        
+        # Générer une page par classe
+        for class_name, class_data in self.classes.items():
+            self.generate_class_page(class_name, class_data)
+        
+        # Copier le CSS
+        self.generate_css()
+        
+        print(f"\n✅ Documentation javadoc générée dans: {self.output_dir}/")
+        print(f"📄 Ouvrez: {self.output_dir}/index.html")
+    
+    def generate_index(self):
+        """Génère la page d'index"""
+        out = [_javadoc_header('Documentation - Audit Royal',
+                            '<p>Documentation générée automatiquement à partir des commentaires XML</p>')]
+        w = out.append
+        
+        for class_name in sorted(self.classes.keys()):
+            safe_name = self.sanitize_filename(class_name)
+            w(f'            <li><a href="{safe_name}.html">{escape(class_name)}</a></li>\n')
+        
+        w(f"""        </ul>
+    </nav>
+    
+    <main>
+        <h2>Vue d'ensemble</h2>
+        <p>Sélectionnez une classe dans le menu de navigation pour voir sa documentation détaillée.</p>
+        
+        <div class="stats">
+            <div class="stat-box">
+                <div class="stat-number">{len(self.classes)}</div>
+                <div class="stat-label">Classes</div>
+            </div>
+        </div>
+""")
+        w(JAVADOC_FOOTER)
+        
+        with open(os.path.join(self.output_dir, 'index.html'), 'w', encoding='utf-8', newline='') as f:
+            f.write(''.join(out))
+    
+    def generate_class_page(self, class_name, class_data):
+        """Génère la page d'une classe"""
+        safe_name = self.sanitize_filename(class_name)
+        
+        out = [_javadoc_header(f'{escape(class_name)} - Documentation',
+                            '<p><a href="index.html">← Retour à l\'index</a></p>')]
+        w = out.append
+        
+        # La liste des classes est rendue une seule fois par exécution
+        if self._class_list is None:
+            self._class_list = [
+                (cn, f'<a href="{self.sanitize_filename(cn)}.html">{escape(cn)}</a></li>\n')
+                for cn in sorted(self.classes.keys())
+            ]
+        for cn, item in self._class_list:
+            w('            <li class="active">' if cn == class_name else '            <li>')
+            w(item)
+        
+        w(f"""        </ul>
+    </nav>
+    
+    <main>
+        <div class="class-header">
+            <h2>{escape(class_name)}</h2>
+            <p class="class-summary">{self.doc_html(class_data.summary)}</p>
+        </div>
+""")
+        
+        # Champs
+        if class_data.fields:
+            self.render_member_table(w, 'Champs', class_data.fields)
+        
+        # Propriétés
+        if class_data.properties:
+            self.render_member_table(w, 'Propriétés', class_data.properties)
+        
+        # Méthodes
+        if class_data.methods:
+            w("""
+        <section class="member-section">
+            <h3>Méthodes</h3>
+""")
+            for method in class_data.methods:
+                w(f"""
+            <div class="method-detail">
+                <h4>{escape(method.name)}</h4>
+                <p class="method-summary">{self.doc_html(method.summary)}</p>
+""")
+                
+                if method.params:
+                    w("""
+                <div class="params">
+                    <h5>Paramètres:</h5>
+                    <ul>
+""")
+                    for param_name, param_desc in method.params:
+                        w(f'                        <li><code>{escape(param_name)}</code> - {self.doc_html(param_desc)}</li>\n')
+                    w("""                    </ul>
+                </div>
+""")
+                
+                if method.returns:
+                    w(f"""
+                <div class="returns">
+                    <h5>Retourne:</h5>
+                    <p>{self.doc_html(method.returns)}</p>
+                </div>
+""")
+                
+                w("""            </div>
+""")
+            w("""        </section>
+""")
+        
+        w(JAVADOC_FOOTER)
+        
+        with open(os.path.join(self.output_dir, f'{safe_name}.html'), 'w', encoding='utf-8',
+                  newline='') as f:
+            f.write(''.join(out))
+    
+    def render_member_table(self, w, title, members):
+        """Rend un tableau de membres (champs ou propriétés)"""
+        w(f"""
+        <section class="member-section">
+            <h3>{title}</h3>
+            <table class="member-table">
+                <thead>
+                    <tr>
+                        <th>Nom</th>
+                        <th>Description</th>
+                    </tr>
+                </thead>
+                <tbody>
+""")
+        for member in members:
+            w(f"""                    <tr>
+                        <td><code>{escape(member.name)}</code></td>
+                        <td>{self.doc_html(member.summary)}</td>
+                    </tr>
+""")
+        w("""                </tbody>
+            </table>
+        </section>
+""")
+    
+    def generate_css(self):
+        """Génère le fichier CSS"""
+        css = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
 }
 
-.badge-property {
-    background: #4299e1;
-    color: white;
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+    display: grid;
+    grid-template-columns: 250px 1fr;
+    grid-template-rows: auto 1fr auto;
+    min-height: 100vh;
 }
 
-.badge-method {
-    background: #ed8936;
+header {
+    grid-column: 1 / -1;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
     color: white;
+    padding: 2rem;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
 }
 
-/* Member Sections */
-.member-section {
-    margin: 3rem 0;
-}
-
-.member-section h3 {
-    color: var(--accent-secondary);
+header h1 {
     font-size: 1.8rem;
-    margin-bottom: 1.5rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 2px solid var(--border-color);
+    margin-bottom: 0.5rem;
 }
 
-.member-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-    gap: 1rem;
+header p {
+    opacity: 0.9;
 }
 
-.member-card {
-    padding: 1.5rem;
-    background: var(--bg-secondary);
-    border-radius: 8px;
-    border-left: 4px solid var(--accent-primary);
-    transition: all 0.3s;
+header a {
+    color: white;
+    text-decoration: none;
+    border-bottom: 2px solid rgba(255,255,255,0.3);
+    transition: border-color 0.3s;
 }
 
-.member-card:hover {
-    box-shadow: var(--shadow-lg);
-    transform: translateY(-2px);
+header a:hover {
+    border-bottom-color: white;
 }
 
-.member-card h4 {
-    color: var(--accent-primary);
-    font-size: 1.1rem;
-    margin-bottom: 0.5rem;
+nav {
+    background: white;
+    padding: 2rem 1rem;
+    border-right: 1px solid #e0e0e0;
+    overflow-y: auto;
 }
 
-.member-card p {
-    color: var(--text-secondary);
-    font-size: 0.9rem;
+nav h2 {
+    font-size: 1rem;
+    text-transform: uppercase;
+    color: #666;
+    margin-bottom: 1rem;
+    padding-bottom: 0.5rem;
+    border-bottom: 2px solid #667eea;
 }
 
-/* Method Cards */
-.method-card {
-    background: var(--bg-secondary);
-    padding: 1.5rem;
-    margin: 1.5rem 0;
-    border-radius: 12px;
-    border-left: 4px solid var(--accent-primary);
-    transition: all 0.3s;
+.class-list {
+    list-style: none;
 }
 
-.method-card:hover {
-    box-shadow: var(--shadow-lg);
+.class-list li {
+    margin-bottom: 0.5rem;
 }
 
-.method-header {
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    margin-bottom: 0.75rem;
+.class-list li.active {
+    background: #f0f0f0;
+    border-radius: 4px;
 }
 
-.method-header h4 {
-    color: var(--accent-primary);
-    font-size: 1.3rem;
+.class-list a {
+    display: block;
+    padding: 0.5rem;
+    color: #333;
+    text-decoration: none;
+    border-radius: 4px;
+    transition: all 0.3s;
 }
 
-.anchor-link {
-    color: var(--text-secondary);
-    text-decoration: none;
-    opacity: 0;
-    transition: opacity 0.3s;
+.class-list a:hover {
+    background: #667eea;
+    color: white;
+    transform: translateX(5px);
 }
 
-.method-card:hover .anchor-link {
-    opacity: 1;
+main {
+    padding: 2rem;
+    background: white;
+    max-width: 1200px;
 }
 
-.method-summary {
-    color: var(--text-secondary);
+.class-header {
+    margin-bottom: 2rem;
+    padding-bottom: 1rem;
+    border-bottom: 3px solid #667eea;
+}
+
+.class-header h2 {
+    color: #667eea;
+    font-size: 2rem;
     margin-bottom: 1rem;
 }
 
-.params-section, .returns-section, .remarks-section {
-    margin-top: 1rem;
-    padding: 1rem;
-    background: var(--bg-card);
-    border-radius: 8px;
+.class-summary {
+    font-size: 1.1rem;
+    color: #666;
 }
 
-.params-section h5, .returns-section h5, .remarks-section h5 {
-    color: var(--accent-secondary);
-    font-size: 0.85rem;
-    text-transform: uppercase;
-    margin-bottom: 0.5rem;
-    letter-spacing: 0.5px;
+.member-section {
+    margin: 2rem 0;
 }
 
-.params-table {
+.member-section h3 {
+    color: #764ba2;
+    margin-bottom: 1rem;
+    padding-bottom: 0.5rem;
+    border-bottom: 2px solid #e0e0e0;
+}
+
+.member-table {
     width: 100%;
     border-collapse: collapse;
+    margin: 1rem 0;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
 }
 
-.params-table tr {
-    border-bottom: 1px solid var(--border-color);
+.member-table th,
+.member-table td {
+    padding: 1rem;
+    text-align: left;
+    border-bottom: 1px solid #e0e0e0;
 }
 
-.params-table td {
-    padding: 0.75rem 0.5rem;
+.member-table th {
+    background: #667eea;
+    color: white;
+    font-weight: 600;
 }
 
-.params-table td:first-child {
-    width: 30%;
-    font-weight: 600;
+.member-table tr:hover {
+    background: #f9f9f9;
 }
 
-code {
-    background: var(--bg-secondary);
+.member-table code {
+    background: #f4f4f4;
     padding: 0.2rem 0.5rem;
-    border-radius: 4px;
-    font-family: 'Monaco', 'Menlo', 'Courier New', monospace;
-    font-size: 0.9em;
-    color: var(--accent-primary);
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+    color: #667eea;
+    font-weight: bold;
 }
 
-pre {
-    background: var(--bg-primary);
-    padding: 1rem;
+.method-detail {
+    background: #f9f9f9;
+    padding: 1.5rem;
+    margin: 1rem 0;
     border-radius: 8px;
-    overflow-x: auto;
-    border: 1px solid var(--border-color);
+    border-left: 4px solid #667eea;
 }
 
-pre code {
-    background: none;
-    padding: 0;
-    color: var(--text-primary);
+.method-detail h4 {
+    color: #667eea;
+    font-size: 1.3rem;
+    margin-bottom: 0.5rem;
 }
 
-/* Footer */
-footer {
-    background: var(--bg-card);
-    color: var(--text-secondary);
-    text-align: center;
-    padding: 2rem;
-    margin-top: 3rem;
+.method-summary {
+    color: #666;
+    margin-bottom: 1rem;
+}
+
+.params, .returns {
+    margin-top: 1rem;
+}
+
+.params h5, .returns h5 {
+    color: #764ba2;
     font-size: 0.9rem;
+    text-transform: uppercase;
+    margin-bottom: 0.5rem;
 }
 
-/* Scrollbar */
-::-webkit-scrollbar {
-    width: 10px;
-    height: 10px;
+.params ul {
+    list-style: none;
+    padding-left: 1rem;
 }
 
-::-webkit-scrollbar-track {
-    background: var(--bg-secondary);
+.params li {
+    margin: 0.5rem 0;
 }
 
-::-webkit-scrollbar-thumb {
-    background: var(--border-color);
-    border-radius: 5px;
+.params code {
+    background: white;
+    padding: 0.2rem 0.5rem;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+    color: #667eea;
+    font-weight: bold;
 }
 
-::-webkit-scrollbar-thumb:hover {
-    background: var(--text-secondary);
+.doc-para, .doc-code, .doc-list {
+    display: block;
+    margin-top: 0.5rem;
 }
 
-/* Responsive */
-@media (max-width: 1024px) {
-    .container {
-        grid-template-columns: 1fr;
-    }
-    
-    .sidebar {
-        position: static;
-        max-height: none;
-    }
-    
-    .stats-grid {
-        grid-template-columns: repeat(2, 1fr);
-    }
+.doc-code {
+    white-space: pre;
 }
 
-@media (max-width: 640px) {
-    .header-content {
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 1rem;
-    }
-    
-    .stats-grid {
-        grid-template-columns: 1fr;
-    }
-    
-    .member-grid {
-        grid-template-columns: 1fr;
-    }
+.doc-item {
+    display: list-item;
+    margin-left: 1.5rem;
 }
-"""
-        
-        with open(os.path.join(self.output_dir, 'style.css'), 'w', encoding='utf-8') as f:
-            f.write(css)
-    
-    def generate_js(self):
-        """Génère le fichier JavaScript"""
-        js = """// Thème
-const themeToggle = document.getElementById('theme-toggle');
-const html = document.documentElement;
 
-// Charger le thème sauvegardé
-const savedTheme = localStorage.getItem('theme') || 'light';
-html.setAttribute('data-theme', savedTheme);
-updateThemeIcon(savedTheme);
+.doc-list-number .doc-item {
+    list-style-type: decimal;
+}
 
-themeToggle?.addEventListener('click', () => {
-    const currentTheme = html.getAttribute('data-theme');
-    const newTheme = currentTheme === 'light' ? 'dark' : 'light';
-    html.setAttribute('data-theme', newTheme);
-    localStorage.setItem('theme', newTheme);
-    updateThemeIcon(newTheme);
-});
+.stats {
+    display: flex;
+    gap: 2rem;
+    margin: 2rem 0;
+}
 
-function updateThemeIcon(theme) {
-    const icon = document.querySelector('.theme-icon');
-    if (icon) {
-        icon.textContent = theme === 'light' ? '🌙' : '☀️';
-    }
+.stat-box {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 10px;
+    text-align: center;
+    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
 }
 
-// Recherche
-let searchIndex = [];
-fetch('search-index.json')
-    .then(res => res.json())
-    .then(data => searchIndex = data)
-    .catch(err => console.error('Erreur chargement index:', err));
+.stat-number {
+    font-size: 3rem;
+    font-weight: bold;
+}
 
-const searchInput = document.getElementById('search-input');
-const searchResults = document.getElementById('search-results');
+.stat-label {
+    font-size: 1rem;
+    opacity: 0.9;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+}
 
-searchInput?.addEventListener('input', (e) => {
-    const query = e.target.value.toLowerCase().trim();
-    
-    if (query.length < 2) {
-        searchResults.classList.remove('active');
-        return;
+footer {
+    grid-column: 1 / -1;
+    background: #333;
+    color: white;
+    text-align: center;
+    padding: 1rem;
+    font-size: 0.9rem;
+}
+
+@media (max-width: 768px) {
+    body {
+        grid-template-columns: 1fr;
     }
     
-    const results = searchIndex.filter(item => 
-        item.name.toLowerCase().includes(query) ||
-        item.summary.toLowerCase().includes(query)
-    ).slice(0, 10);
-    
-    if (results.length > 0) {
-        searchResults.innerHTML = results.map(item => `
-            <div class="search-result-item" onclick="window.location.href='${item.url}'">
-                <div class="search-result-name">${escapeHtml(item.name)}</div>
-                <div class="search-result-type">${item.type}</div>
-            </div>
-        `).join('');
-        searchResults.classList.add('active');
-    } else {
-        searchResults.innerHTML = '<div class="search-result-item">Aucun résultat</div>';
-        searchResults.classList.add('active');
-    }
-});
-
-// Fermer les résultats en cliquant ailleurs
-document.addEventListener('click', (e) => {
-    if (!searchInput?.contains(e.target) && !searchResults?.contains(e.target)) {
-        searchResults?.classList.remove('active');
+    nav {
+        border-right: none;
+        border-bottom: 1px solid #e0e0e0;
     }
-});
-
-// Navigation par onglets
-const navTabs = document.querySelectorAll('.nav-tab');
-navTabs.forEach(tab => {
-    tab.addEventListener('click', () => {
-        const targetTab = tab.getAttribute('data-tab');
-        
-        // Retirer active de tous
-        navTabs.forEach(t => t.classList.remove('active'));
-        document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-        
-        // Activer le bon
-        tab.classList.add('active');
-        document.getElementById(`${targetTab}-tab`)?.classList.add('active');
-    });
-});
-
-// Smooth scroll pour les ancres
-document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-    anchor.addEventListener('click', function (e) {
-        e.preventDefault();
-        const target = document.querySelector(this.getAttribute('href'));
-        target?.scrollIntoView({ behavior: 'smooth', block: 'start' });
-    });
-});
-
-function escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
 }
 """
         
-        with open(os.path.join(self.output_dir, 'script.js'), 'w', encoding='utf-8') as f:
-            f.write(js)
-    
-    def sanitize_filename(self, name):
-        """Nettoie un nom pour en faire un nom de fichier valide"""
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
-        return name
+        with open(os.path.join(self.output_dir, 'style.css'), 'w', encoding='utf-8', newline='') as f:
+            f.write(css)
 
-def main():
+def main(argv=None):
     import sys
+    import argparse
     
-    if len(sys.argv) < 2:
-        print("Usage: python3 doc_generator.py <chemin_vers_xml> [dossier_sortie]")
-        print("\nExemple:")
-        print("  python3 doc_generator.py Library/ScriptAssemblies/Assembly-CSharp.xml")
-        print("  python3 doc_generator.py fichier.xml /home/user/docs")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Génère un site HTML à partir de la documentation XML C#",
+        epilog="Exemple:\n"
+               "  python3 doc_generator.py Library/ScriptAssemblies/Assembly-CSharp.xml\n"
+               "  python3 doc_generator.py fichier.xml /home/user/docs\n"
+               "  python3 doc_generator.py 'Library/ScriptAssemblies/*.xml' -j 4\n"
+               "  python3 doc_generator.py --source Assets/Scripts docs -j 4",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('xml_path', metavar='chemin_vers_xml', nargs='?',
+                        help="fichier XML généré par le compilateur (-doc:), ou glob entre quotes "
+                             "(avec --source : le dossier de sortie)")
+    parser.add_argument('output_dir', metavar='dossier_sortie', nargs='?',
+                        help="dossier de sortie (défaut: documentation_html)")
+    parser.add_argument('--source', nargs='?', const=SOURCE_DEFAULT_DIR, metavar='DOSSIER',
+                        help="lit les commentaires /// directement dans les scripts C# du dossier "
+                             f"(défaut: {SOURCE_DEFAULT_DIR}), sans XML du compilateur ; "
+                             "seuls les scripts modifiés sont réanalysés (cache par fichier)")
+    parser.add_argument('--xml', action='append', default=[], metavar='CHEMIN',
+                        help="XML d'une assembly supplémentaire (ou glob), répétable")
+    parser.add_argument('--no-stream', dest='streaming', action='store_false',
+                        help="charge tout l'arbre XML en mémoire au lieu du parsing en flux")
+    parser.add_argument('--incremental', action='store_true',
+                        help=f"ne réécrit que les pages modifiées (manifeste {MANIFEST_FILE})")
+    parser.add_argument('--atomic', action='store_true',
+                        help="construit dans un dossier voisin puis le substitue au site en ligne "
+                             "(fichiers inchangés liés, orphelins supprimés ; implique --incremental)")
+    parser.add_argument('--archive', metavar='FICHIER',
+                        help="écrit tout le site dans une seule archive .zip, .tar.gz ou .tgz "
+                             "au lieu du dossier de sortie")
+    parser.add_argument('--bundle', metavar='FICHIER.html',
+                        help="écrit un seul fichier HTML autonome (pages de classe embarquées "
+                             "en JSON compressé, rendues par le script)")
+    parser.add_argument('--client-render', action='store_true',
+                        help="un JSON par classe et une seule page qui les affiche (CSS et script "
+                             "nommés par empreinte, cachables sans limite)")
+    parser.add_argument('--compress', action='store_true',
+                        help="écrit aussi des versions .gz (et .br si le module brotli est installé)")
+    parser.add_argument('--compress-min-size', type=int, default=1024, metavar='OCTETS',
+                        help="taille minimale d'un fichier à précompresser (défaut: 1024)")
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help="ignore le cache du modèle parsé")
+    parser.add_argument('--cache-dir', default=default_cache_dir(), metavar='DOSSIER',
+                        help="dossier du cache du modèle parsé (défaut: %(default)s)")
+    parser.add_argument('--watch', action='store_true',
+                        help="reste actif et régénère (en incrémental) à chaque modification du XML")
+    parser.add_argument('--watch-interval', type=float, default=0.25, metavar='SECONDES',
+                        help="intervalle de scrutation du XML en mode --watch (défaut: 0.25)")
+    parser.add_argument('--profile', action='store_true',
+                        help="affiche le temps mur/CPU par phase, le coût des pages et les octets "
+                             "écrits par type (hors --watch)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="ajoute à --profile le pic mémoire par phase (tracemalloc, qui "
+                             "gonfle les temps mesurés)")
+    parser.add_argument('--profile-json', metavar='FICHIER',
+                        help="écrit aussi le rapport de --profile en JSON")
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help="nombre de pages les plus lentes/lourdes listées (défaut: 10)")
+    parser.add_argument('--cprofile', metavar='FICHIER',
+                        help="capture cProfile du parsing et de la génération (fichier pstats)")
+    parser.add_argument('--include', action='append', default=[], metavar='MOTIF',
+                        help="ne documente que les classes correspondantes, répétable : glob sur le "
+                             "nom complet (Jeu.*), namespace:NOM ou assembly:GLOB")
+    parser.add_argument('--exclude', action='append', default=[], metavar='MOTIF',
+                        help="écarte les classes correspondantes dès le parsing (mêmes motifs que "
+                             "--include) ; les liens vers elles sont rendus en texte")
+    parser.add_argument('--coverage-json', metavar='FICHIER',
+                        help="écrit le rapport de couverture (total, namespaces, classes et "
+                             "membres à compléter) en JSON")
+    parser.add_argument('--coverage-min', type=float, metavar='POURCENT',
+                        help="échoue (code 1) si moins de POURCENT %% des types et membres sont "
+                             "documentés, pour bloquer une intégration continue")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help="nombre de processus pour le parsing des assemblies et le rendu "
+                             "des pages de classe (défaut: 1)")
+    parser.add_argument('--format', dest='formats', action='append', default=[],
+                        metavar='NOM[=DOSSIER]',
+                        help="format à produire, répétable : "
+                             f"{', '.join(sorted(RENDER_BACKENDS))} (défaut: interactive). "
+                             "Tous les formats sont rendus en parallèle depuis un seul parsing ; "
+                             "le premier va dans dossier_sortie, les suivants dans "
+                             "dossier_sortie-NOM sauf =DOSSIER")
+    args = parser.parse_args(argv)
+    if args.source:
+        # Pas de XML : l'unique argument positionnel est le dossier de sortie
+        if args.output_dir or args.xml:
+            parser.error("--source ne prend pas de XML (seul le dossier de sortie est attendu)")
+        args.output_dir, args.xml_path = args.xml_path, None
+    elif not args.xml_path:
+        parser.error("chemin_vers_xml est requis (ou --source)")
+    args.output_dir = args.output_dir or "documentation_html"
+    targets = []
+    for spec in args.formats or ['interactive']:
+        format_name, _, target_dir = spec.partition('=')
+        if format_name not in RENDER_BACKENDS:
+            parser.error(f"format inconnu: {format_name} (disponibles: "
+                         f"{', '.join(sorted(RENDER_BACKENDS))})")
+        if any(format_name == name for name, _ in targets):
+            parser.error(f"format demandé deux fois: {format_name}")
+        default_dir = f'{args.output_dir}-{format_name}' if targets else args.output_dir
+        targets.append((format_name, target_dir or default_dir))
+    if (args.archive or args.bundle) and not any(name == 'interactive' for name, _ in targets):
+        parser.error("--archive et --bundle ne s'appliquent qu'au format interactive")
+    if args.archive and args.bundle:
+        parser.error("--archive et --bundle sont incompatibles")
+    if args.bundle and args.client_render:
+        parser.error("--bundle embarque déjà le rendu côté client : --client-render est inutile")
+    if (args.archive or args.bundle) and (args.incremental or args.atomic or args.compress):
+        parser.error("--archive et --bundle ne se combinent pas avec --incremental, --atomic "
+                     "ou --compress")
+    if args.archive and not args.archive.endswith(('.zip', '.tar.gz', '.tgz')):
+        parser.error("--archive attend un fichier .zip, .tar.gz ou .tgz")
     
-    xml_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "documentation_html"
+    xml_paths = expand_xml_paths([args.xml_path] + args.xml) if not args.source else []
+    output_dir = dict(targets).get('interactive', targets[0][1])
     
-    if not os.path.exists(xml_path):
-        print(f"❌ Erreur: Le fichier {xml_path} n'existe pas")
+    if args.source:
+        if not os.path.isdir(args.source):
+            print(f"❌ Erreur: Le dossier {args.source} n'existe pas")
+            sys.exit(1)
+    elif not xml_paths:
+        print(f"❌ Erreur: Aucun fichier ne correspond à {args.xml_path}")
         sys.exit(1)
+    for xml_path in xml_paths:
+        if not os.path.exists(xml_path):
+            print(f"❌ Erreur: Le fichier {xml_path} n'existe pas")
+            sys.exit(1)
     
-    print(f"📖 Génération de la documentation depuis: {xml_path}")
-    print(f"📁 Dossier de sortie: {output_dir}")
+    print(f"📖 Génération de la documentation depuis: "
+          f"{args.source + ' (scripts C#)' if args.source else ', '.join(xml_paths)}")
+    if args.archive or args.bundle:
+        print(f"📦 Fichier de sortie: {args.archive or args.bundle}")
+    else:
+        print(f"📁 Dossier de sortie: {output_dir}")
+    for format_name, target_dir in targets:
+        if target_dir != output_dir:
+            print(f"📁 Format {format_name}: {target_dir}")
     print()
     
-    generator = DocGenerator(xml_path, output_dir)
-    generator.parse_xml()
+    generator = DocGenerator(xml_paths, output_dir, streaming=args.streaming,
+                             incremental=args.incremental, atomic=args.atomic,
+                             archive=args.archive, bundle=args.bundle,
+                             client_render=args.client_render, targets=targets, jobs=args.jobs,
+                             source_dir=args.source, include=args.include, exclude=args.exclude,
+                             compress=args.compress, compress_min_size=args.compress_min_size,
+                             cache_dir=args.cache_dir if args.cache else None)
+    if args.watch:
+        generator.watch(interval=args.watch_interval)
+        return
+    
+    if args.profile or args.profile_json or args.profile_memory:
+        generator.profiler = BuildProfiler(top=args.profile_top, memory=args.profile_memory)
+    if args.cprofile:
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+    
+    with generator.phase('parse_xml'):
+        generator.parse_xml()
     
     if not generator.classes:
         print("⚠️  Aucune classe trouvée dans le XML")
-        print("Vérifiez que le fichier XML contient bien des commentaires de documentation")
+        if args.source:
+            print("Vérifiez que les scripts contiennent bien des commentaires ///")
+        else:
+            print("Vérifiez que le fichier XML contient bien des commentaires de documentation")
         sys.exit(1)
     
-    generator.generate_html()
+    generator.render()
+    
+    if args.cprofile:
+        import pstats
+        profile.disable()
+        profile.dump_stats(args.cprofile)
+        print(f"\n🔬 Profil cProfile écrit dans {args.cprofile} (10 fonctions les plus coûteuses):")
+        pstats.Stats(profile).sort_stats('cumulative').print_stats(10)
+    if generator.profiler:
+        generator.profiler.print_report()
+        if args.profile_json:
+            with open(args.profile_json, 'w', encoding='utf-8') as f:
+                json.dump(generator.profiler.report(), f, indent=2, ensure_ascii=False)
+    
+    if args.coverage_json:
+        with open(args.coverage_json, 'w', encoding='utf-8') as f:
+            json.dump(generator.coverage_report(), f, indent=2, ensure_ascii=False)
+        print(f"\n📈 Rapport de couverture écrit dans {args.coverage_json}")
+    
+    if args.bundle:
+        print(f"\n🚀 Pour visualiser: xdg-open {args.bundle}")
+    elif not args.archive:
+        print(f"\n🚀 Pour visualiser: xdg-open {output_dir}/index.html")
     
-    print(f"\n🚀 Pour visualiser: xdg-open {output_dir}/index.html")
+    if args.coverage_min is not None:
+        percent = generator.coverage_total().percent()
+        if percent < args.coverage_min:
+            print(f"\n❌ Couverture de {percent:.1f} % inférieure au minimum de {args.coverage_min:g} %")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
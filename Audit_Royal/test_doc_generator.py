@@ -0,0 +1,323 @@
+"""Tests de doc_generator : identifiants du mode --source, ancres des membres, filtres de classes,
+fusion des assemblies et génération incrémentale
+
+Lancement : python -m pytest -q Audit_Royal
+"""
+
+import json
+import os
+import re
+
+import pytest
+
+from cs_source import scan_csharp_source, source_doc_ids
+from doc_generator import Coverage, DocGenerator, member_anchor
+
+
+def doc_ids(declaration):
+    """Identifiants documentés d'une déclaration placée dans Jeu.Pile<T> (non documentée)"""
+    source = ('namespace Jeu {\n'
+              '    public class Pile<T> {\n'
+              '        /// <summary>Doc</summary>\n'
+              f'        {declaration}\n'
+              '    }\n'
+              '}\n')
+    return [doc_id for doc_id, doc, *_ in source_doc_ids(scan_csharp_source(source))
+            if doc is not None]
+
+
+# Déclaration C# → identifiants attendus, tels que les écrit le compilateur (-doc:)
+DECLARATIONS = [
+    ('public void Tirer() {}', ['M:Jeu.Pile`1.Tirer']),
+    ('public int Somme(int a, float b) => 0;', ['M:Jeu.Pile`1.Somme(System.Int32,System.Single)']),
+    ('public void Remplir(int[] valeurs, ref int n, out string s) {}',
+     ['M:Jeu.Pile`1.Remplir(System.Int32[],System.Int32@,System.String@)']),
+    ('public void Grille(int[,] cases) {}', ['M:Jeu.Pile`1.Grille(System.Int32[0:,0:])']),
+    ('public void Pointeur(int* p) {}', ['M:Jeu.Pile`1.Pointeur(System.Int32*)']),
+    ('public void Nullable(int? x, List<int>[] l) {}',
+     ['M:Jeu.Pile`1.Nullable(System.Nullable{System.Int32},'
+      'System.Collections.Generic.List{System.Int32}[])']),
+    # Méthodes génériques dont le type de retour est lui-même générique
+    ('public List<U> Map<U>(Func<T, U> f) { return null; }',
+     ['M:Jeu.Pile`1.Map``1(System.Func{`0,``0})']),
+    ('public Dictionary<string, int> Build<K>(K k) { return null; }',
+     ['M:Jeu.Pile`1.Build``1(``0)']),
+    ('public (int, string) Paire() { return default; }', ['M:Jeu.Pile`1.Paire']),
+    ('public T Premier() { return default; }', ['M:Jeu.Pile`1.Premier']),
+    ('public Pile() {}', ['M:Jeu.Pile`1.#ctor']),
+    ('static Pile() {}', ['M:Jeu.Pile`1.#cctor']),
+    ('~Pile() {}', ['M:Jeu.Pile`1.Finalize']),
+    ('public static Pile<T> operator +(Pile<T> a, Pile<T> b) { return a; }',
+     ['M:Jeu.Pile`1.op_Addition(Jeu.Pile{`0},Jeu.Pile{`0})']),
+    ('public static implicit operator int(Pile<T> p) { return 0; }',
+     ['M:Jeu.Pile`1.op_Implicit(Jeu.Pile{`0})~System.Int32']),
+    ('public int Taille { get; set; }', ['P:Jeu.Pile`1.Taille']),
+    ('public int Double => 2;', ['P:Jeu.Pile`1.Double']),
+    ('public T this[int i] { get { return default; } }', ['P:Jeu.Pile`1.Item(System.Int32)']),
+    ('public int a = 1, b;', ['F:Jeu.Pile`1.a', 'F:Jeu.Pile`1.b']),
+    ('private Dictionary<string, float> poids = new Dictionary<string, float>();',
+     ['F:Jeu.Pile`1.poids']),
+    ('[SerializeField] private float vitesse;', ['F:Jeu.Pile`1.vitesse']),
+    ('public class Noeud {}', ['T:Jeu.Pile`1.Noeud']),
+    ('public enum Etat { A, B }', ['T:Jeu.Pile`1.Etat']),
+    ('public delegate List<V> Fabrique<V>(V x);', ['T:Jeu.Pile`1.Fabrique`1']),
+]
+
+
+@pytest.mark.parametrize('declaration, expected', DECLARATIONS)
+def test_source_doc_ids(declaration, expected):
+    assert doc_ids(declaration) == expected
+
+
+# Surcharges qui ne diffèrent que par un tableau, ref/out, un pointeur, la généricité…
+OVERLOADS = [
+    'Set',
+    'Set(System.Int32)',
+    'Set(System.Int32[])',
+    'Set(System.Int32[0:,0:])',
+    'Set(System.Int32[][])',
+    'Set(System.Int32@)',
+    'Set(System.Int32*)',
+    'Set(System.Int32,System.Int32)',
+    'Set(System.Int32.Int32)',
+    'Set(System.Collections.Generic.List{System.Int32})',
+    'Set(System.Collections.Generic.List.System.Int32)',
+    'Set``1(``0)',
+    'Set``1(``0[])',
+    'Set(`0)',
+    'op_Implicit(System.Int32)~Jeu.Pile',
+    'op_Implicit(System.Int32)~Jeu.Pile[]',
+]
+
+
+def test_member_anchors_are_unique():
+    anchors = [member_anchor(name) for name in OVERLOADS]
+    assert len(set(anchors)) == len(anchors)
+    for anchor in anchors:
+        assert re.fullmatch(r'[A-Za-z_][A-Za-z0-9_-]*', anchor)
+
+
+def test_class_page_ids_are_unique(tmp_path):
+    members = '\n'.join(f'<member name="M:Jeu.Pile.{name}"><summary>{name}</summary></member>'
+                         for name in OVERLOADS)
+    xml_path = tmp_path / 'Jeu.xml'
+    xml_path.write_text('<?xml version="1.0"?>\n<doc><assembly><name>Jeu</name></assembly><members>\n'
+                        '<member name="T:Jeu.Pile"><summary>Pile</summary></member>\n'
+                        f'{members}\n</members></doc>\n', encoding='utf-8')
+    generator = DocGenerator(str(xml_path), str(tmp_path / 'html'))
+    generator.parse_xml()
+    generator.render()
+    
+    page = (tmp_path / 'html' / 'Jeu.Pile.html').read_text(encoding='utf-8')
+    ids = re.findall(r'\bid="([^"]+)"', page)
+    assert len(ids) == len(set(ids))
+    assert {member_anchor(name) for name in OVERLOADS} <= set(ids)
+
+
+def write_xml(path, members, assembly='Jeu'):
+    """Écrit un XML de documentation minimal : members = [(identifiant, résumé)]"""
+    rows = '\n'.join(f'<member name="{name}"><summary>{summary}</summary></member>'
+                     for name, summary in members)
+    path.write_text(f'<?xml version="1.0"?>\n<doc><assembly><name>{assembly}</name></assembly>'
+                    f'<members>\n{rows}\n</members></doc>\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('streaming', [True, False])
+def test_truncated_xml_yields_no_model(tmp_path, streaming):
+    xml_path = tmp_path / 'Jeu.xml'
+    write_xml(xml_path, [(f'T:Jeu.Classe{i}', 'Résumé') for i in range(50)])
+    text = xml_path.read_text(encoding='utf-8')
+    xml_path.write_text(text[:len(text) // 2], encoding='utf-8')
+    
+    generator = DocGenerator(str(xml_path), str(tmp_path / 'html'), streaming=streaming)
+    assert generator.parse_xml() is False
+    assert not generator.classes
+    assert generator.stats['total_classes'] == 0
+
+
+def test_model_cache_skips_invalid_xml_and_unreadable_entries(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    xml_path = tmp_path / 'Jeu.xml'
+    write_xml(xml_path, [(f'T:Jeu.Classe{i}', 'Résumé') for i in range(50)])
+    text = xml_path.read_text(encoding='utf-8')
+    
+    # Un XML tronqué n'est jamais mis en cache
+    xml_path.write_text(text[:len(text) // 2], encoding='utf-8')
+    assert DocGenerator(str(xml_path), cache_dir=str(cache_dir)).parse_xml() is False
+    assert not list(cache_dir.glob('*.pickle'))
+    
+    # Une entrée illisible (classe disparue du module) compte comme absente
+    xml_path.write_text(text, encoding='utf-8')
+    generator = DocGenerator(str(xml_path), cache_dir=str(cache_dir))
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(generator.cache_path(), 'wb') as f:
+        f.write(b'cdoc_generator\nClasseDisparue\n.')
+    assert generator.parse_xml() is True
+    assert len(generator.classes) == 50
+
+
+def test_rebuild_without_compress_drops_stale_gzip(tmp_path):
+    xml_path = write_xml(tmp_path / 'Jeu.xml', [('T:Jeu.Pile', 'Ancien résumé')])
+    output_dir = tmp_path / 'html'
+    generator = DocGenerator(xml_path, str(output_dir), compress=True, compress_min_size=0)
+    generator.parse_xml()
+    generator.render()
+    assert (output_dir / 'Jeu.Pile.html.gz').exists()
+    
+    write_xml(tmp_path / 'Jeu.xml', [('T:Jeu.Pile', 'Nouveau résumé')])
+    generator = DocGenerator(xml_path, str(output_dir))
+    generator.parse_xml()
+    generator.render()
+    assert 'Nouveau résumé' in (output_dir / 'Jeu.Pile.html').read_text(encoding='utf-8')
+    for filename in generator.written_files:
+        assert not (output_dir / f'{filename}.gz').exists(), filename
+
+
+def test_search_shards_carry_their_name_keys(tmp_path):
+    members = [('T:Jeu.Pile', 'Pile de cartes'), ('M:Jeu.Pile.Piocher', 'Pioche une carte'),
+               ('T:Jeu.Défausse', 'Cartes jouées'), ('M:Jeu.Défausse.Vider', 'Vide la pile')]
+    generator = DocGenerator(write_xml(tmp_path / 'Jeu.xml', members), str(tmp_path / 'html'))
+    generator.parse_xml()
+    files = {path: json.loads(text) for path, text in generator.search_files()}
+    manifest = files['search-index.json']
+    
+    # Les blocs reconstituent toutes les entrées, dans l'ordre des identifiants
+    rows = [row for path in manifest['e'] for row in files[path]]
+    assert [row[0] for row in rows] == ['Pile', 'Pile.Piocher', 'Défausse', 'Défausse.Vider']
+    
+    # Toute entrée d'une clé de nom a son nom normalisé dans le fragment de cette clé
+    for initial, path in manifest['s'].items():
+        shard = files[path]
+        for key, gaps in shard['n'].items():
+            ids = [sum(gaps[:i + 1]) for i in range(len(gaps))]
+            for entry_id in ids:
+                assert key in shard['e'][str(entry_id)].lower()
+    assert files[manifest['s']['d']]['e']['2'] == 'defausse'
+
+
+def test_referenced_by_tells_generic_arities_apart(tmp_path):
+    members = [('T:Jeu.Pile`1', 'Pile'), ('T:Jeu.Pile`2', 'Pile à deux paramètres'),
+               ('T:Jeu.Joueur', 'Joueur'),
+               ('M:Jeu.Joueur.Paire(Jeu.Pile{System.Int32,System.String})', 'Deux'),
+               ('M:Jeu.Joueur.Liste(Jeu.Pile{System.Collections.Generic.Dictionary{System.Int32,'
+                'System.String}})', 'Un'),
+               ('M:Jeu.Joueur.Grille(Jeu.Pile{System.Int32[0:,0:]})', 'Un aussi')]
+    generator = DocGenerator(write_xml(tmp_path / 'Jeu.xml', members), str(tmp_path / 'html'))
+    generator.parse_xml()
+    referenced_by = generator.referenced_by()
+    
+    assert [label for label, _ in referenced_by['Jeu.Pile`1']] == ['Joueur.Grille', 'Joueur.Liste']
+    assert [label for label, _ in referenced_by['Jeu.Pile`2']] == ['Joueur.Paire']
+
+
+def test_source_coverage_counts_undocumented_declarations(tmp_path):
+    scripts = tmp_path / 'Scripts'
+    scripts.mkdir()
+    (scripts / 'Pile.cs').write_text(
+        'namespace Jeu {\n'
+        '    /// <summary>Pile</summary>\n'
+        '    public class Pile {\n'
+        '        /// <summary>Pioche</summary>\n'
+        '        public int Piocher(int n) { return n; }\n'
+        '        public void Melanger(int graine) {}\n'
+        '        public int a = 1, b;\n'
+        '        private int cache;\n'
+        '        void Update() {}\n'
+        '    }\n'
+        '    public class Defausse { public void Vider() {} }\n'
+        '    class Interne { public void Rien() {} }\n'
+        '}\n', encoding='utf-8')
+    generator = DocGenerator(None, str(tmp_path / 'html'), source_dir=str(scripts))
+    generator.parse_xml()
+    
+    # Les déclarations sans commentaire n'ont pas de page…
+    assert set(generator.classes) == {'Jeu.Pile'}
+    assert [m.name for m in generator.classes['Jeu.Pile'].methods] == ['Piocher(System.Int32)']
+    # …mais les visibles (public, protected) comptent comme non documentées
+    pile = generator.classes['Jeu.Pile'].coverage
+    assert (pile.members, pile.documented_members) == (4, 1)
+    assert ('summary', 'Melanger(System.Int32)') in pile.gaps
+    assert ('summary', 'b') in pile.gaps
+    assert (pile.missing_params, pile.missing_returns) == (2, 1)
+    total = generator.coverage_total()
+    assert (total.types, total.documented_types) == (2, 1)
+    assert (total.members, total.documented_members) == (5, 1)
+
+
+FILTER_MEMBERS = [('T:Jeu.Pile', 'Pile'), ('T:Jeu.Pile.Noeud', 'Noeud'),
+                  ('M:Jeu.Pile.Noeud.Lier', 'Lie'), ('T:Jeu.JeuManager', 'Manager'),
+                  ('T:Jeu.Cartes.Carte', 'Carte'), ('T:Jeu.Cartes.Carte.Face', 'Face'),
+                  ('T:Jeu.CartesRares.Joker', 'Joker')]
+ALL_CLASSES = {'Jeu.Pile', 'Jeu.Pile.Noeud', 'Jeu.JeuManager', 'Jeu.Cartes.Carte',
+               'Jeu.Cartes.Carte.Face', 'Jeu.CartesRares.Joker'}
+
+# --include, --exclude → classes gardées
+FILTERS = [
+    ([], ['Jeu.Pile'], ALL_CLASSES - {'Jeu.Pile', 'Jeu.Pile.Noeud'}),
+    (['*Manager'], [], {'Jeu.JeuManager'}),
+    ([], ['namespace:Jeu.Cartes'], ALL_CLASSES - {'Jeu.Cartes.Carte', 'Jeu.Cartes.Carte.Face'}),
+    (['namespace:Jeu.Cartes'], [], {'Jeu.Cartes.Carte', 'Jeu.Cartes.Carte.Face'}),
+    (['assembly:J*'], [], ALL_CLASSES),
+    ([], ['assembly:Jeu'], set()),
+    (['Jeu.*'], ['*.Carte*'], {'Jeu.Pile', 'Jeu.Pile.Noeud', 'Jeu.JeuManager'}),
+]
+
+
+@pytest.mark.parametrize('include, exclude, expected', FILTERS)
+def test_class_filter_keeps(tmp_path, include, exclude, expected):
+    generator = DocGenerator(write_xml(tmp_path / 'Jeu.xml', FILTER_MEMBERS), str(tmp_path / 'html'),
+                             include=include, exclude=exclude)
+    generator.parse_xml()
+    assert set(generator.classes) == expected
+    # Les types imbriqués d'une classe exclue le sont aussi
+    assert generator.excluded == ALL_CLASSES - expected
+
+
+def test_partial_class_merges_across_assemblies(tmp_path):
+    jeu = write_xml(tmp_path / 'Jeu.xml', [('T:Jeu.Pile', ''), ('M:Jeu.Pile.Piocher', 'Pioche')])
+    outils = write_xml(tmp_path / 'Outils.xml',
+                       [('T:Jeu.Pile', 'Pile'), ('M:Jeu.Pile.Piocher', 'Autre résumé'),
+                        ('M:Jeu.Pile.Vider(System.Int32)', '')], assembly='Outils')
+    # Ordre des arguments indifférent : l'assembly Jeu garde la priorité
+    generator = DocGenerator([outils, jeu], str(tmp_path / 'html'))
+    assert generator.parse_xml() is True
+    
+    pile = generator.classes['Jeu.Pile']
+    assert pile.assemblies == ('Jeu', 'Outils')
+    assert pile.summary == 'Pile'
+    assert [(m.name, m.summary) for m in pile.methods] == [('Piocher', 'Pioche'),
+                                                           ('Vider(System.Int32)', '')]
+    coverage = pile.coverage
+    assert (coverage.types, coverage.documented_types) == (1, 1)
+    assert (coverage.members, coverage.documented_members) == (2, 1)
+    assert coverage.missing_params == 1
+    assert sorted(coverage.gaps) == [('param', 'Vider(System.Int32)'),
+                                     ('summary', 'Vider(System.Int32)')]
+    total = generator.coverage_total()
+    assert [getattr(total, key) for key in Coverage.COUNTERS] == \
+        [getattr(coverage, key) for key in Coverage.COUNTERS]
+
+
+@pytest.mark.parametrize('atomic', [False, True])
+def test_incremental_rebuild_removes_stale_pages(tmp_path, atomic):
+    output_dir = tmp_path / 'html'
+    members = [('T:Jeu.Pile', 'Pile'), ('T:Jeu.Joueur', 'Joueur'), ('T:Jeu.Vide', 'Vide')]
+    xml_path = write_xml(tmp_path / 'Jeu.xml', members)
+    generator = DocGenerator(xml_path, str(output_dir), incremental=True, atomic=atomic,
+                             compress=True, compress_min_size=0)
+    generator.parse_xml()
+    generator.render()
+    assert (output_dir / 'Jeu.Joueur.html').exists()
+    assert (output_dir / 'Jeu.Joueur.html.gz').exists()
+    
+    write_xml(tmp_path / 'Jeu.xml', members[:1])
+    generator = DocGenerator(xml_path, str(output_dir), incremental=True, atomic=atomic,
+                             compress=True, compress_min_size=0)
+    generator.parse_xml()
+    generator.render()
+    assert (output_dir / 'Jeu.Pile.html').exists()
+    for filename in ('Jeu.Joueur.html', 'Jeu.Joueur.html.gz', 'Jeu.Vide.html', 'Jeu.Vide.html.gz'):
+        assert not (output_dir / filename).exists(), filename
+    assert set(json.loads((output_dir / '.doc-manifest.json').read_text(encoding='utf-8'))['pages']) \
+        == {'Jeu.Pile'}